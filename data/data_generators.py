@@ -6,25 +6,203 @@ for testing purposes within the Orange HRM application. The functions included
 here can be used to create random names and employee IDs to facilitate the
 population of test data.
 
+Employee IDs never repeat: each worker gets its own disjoint range of the ID
+space, and IDs inside that range are drawn from a seeded permutation, so a run
+can create millions of employees without a duplicate. Bulk datasets are built
+in numpy batches and can be written to CSV or Parquet for data-driven runs.
+
 Functions:
     - generate_random_name(): Generates a random first, middle, and last name.
-    - generate_random_employee_id(): Generates a random 3-digit employee ID.
+    - generate_random_employee_id(): Returns the next unique employee ID of this worker.
+
+Classes:
+    - EmployeeDataGenerator: Seeded, batched generator of unique employee records.
 """
+import csv
+import math
+import os
 import random
-import string
+import threading
+
+import numpy as np
+
+from utils.parallel import worker_index
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Charlie", "David", "Eva", "Fay", "Grace", "Hank", "Isha", "Jon",
+    "Kavya", "Liam", "Maya", "Nikhil", "Olivia", "Priya", "Quinn", "Rahul", "Sara", "Tom",
+    "Uma", "Victor", "Wendy", "Xavier", "Yara", "Zane", "Arjun", "Bella", "Chen", "Divya",
+    "Elena", "Farhan", "Gita", "Hugo", "Ines", "Jamal", "Kiran", "Lena", "Mohan", "Nora",
+]
+MIDDLE_NAMES = [
+    "James", "Marie", "Lee", "Ray", "Louise", "Rose", "Jude", "Lynn", "Kumar", "Ann",
+    "Dev", "Grace", "Jay", "Kay", "Lal", "Mae", "Noor", "Paul", "Rani", "Sue",
+    "Tara", "Vic", "Wynn", "Anand", "Belle", "Cole", "Dale", "Eve", "Faith", "Hope",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson", "Sharma", "Patel",
+    "Iyer", "Reddy", "Nair", "Gupta", "Khan", "Singh", "Garcia", "Martinez", "Lopez", "Clark",
+    "Lewis", "Walker", "Hall", "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams",
+    "Nelson", "Carter", "Mitchell", "Roberts", "Turner", "Phillips", "Campbell", "Parker", "Evans", "Edwards",
+]
+NATIONALITIES = [
+    "Indian", "American", "British", "Canadian", "Australian", "German", "French", "Japanese",
+    "Chinese", "Brazilian", "Mexican", "Italian", "Spanish", "Sri Lankan", "Singaporean", "Malaysian",
+]
+MARITAL_STATUSES = ["Single", "Married", "Other"]
+GENDERS = ["Male", "Female"]
+
+# Range of generated dates of birth
+DOB_START = np.datetime64("1960-01-01")
+DOB_END = np.datetime64("2005-12-31")
+
+# Columns of a generated employee record, in output order
+EMPLOYEE_FIELDS = [
+    "employee_id", "first_name", "middle_name", "last_name", "dob",
+    "license_number", "nationality", "marital_status", "gender",
+]
+
 
 def generate_random_name():
     """Generates random first, middle, and last names."""
-    first_names = ["Alice", "Bob", "Charlie", "David", "Eva", "Fay", "Grace", "Hank"]
-    middle_names = ["James", "Marie", "Lee", "Ray", "Louise", "Rose", "Jude", "Lynn"]
-    last_names = ["Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson"]
-
-    first_name = random.choice(first_names)
-    middle_name = random.choice(middle_names)
-    last_name = random.choice(last_names)
+    first_name = random.choice(FIRST_NAMES)
+    middle_name = random.choice(MIDDLE_NAMES)
+    last_name = random.choice(LAST_NAMES)
 
     return first_name, middle_name, last_name
 
+
+class EmployeeDataGenerator:
+    """Deterministic generator of unique employee records for one worker.
+
+    The ID space (all numbers with `id_width` digits) is split into `workers`
+    equal ranges. This worker only uses its own range, and walks it through the
+    permutation index -> (multiplier * index + increment) mod range_size, which
+    visits every ID of the range exactly once in a seed-dependent order.
+    """
+
+    def __init__(self, seed=0, worker=0, workers=1, id_width=8):
+        """Initializes the generator.
+        Args:
+            seed: Seed that fixes the IDs and every other generated value.
+            worker: Index of the worker using this generator.
+            workers: Total number of workers sharing the ID space.
+            id_width: Number of digits of an employee ID (Orange HRM allows up to 10).
+        """
+        if not 0 <= worker < workers:
+            raise ValueError(f"worker must be between 0 and {workers - 1}, got {worker}")
+        self.seed = seed
+        self.worker = worker
+        self.id_width = id_width
+        self.range_size = 10 ** id_width // workers  # IDs reserved for each worker
+        self.range_start = worker * self.range_size  # First ID of this worker's range
+        rng = np.random.default_rng([seed, worker])
+        self.multiplier = self._coprime_multiplier(rng)
+        self.increment = int(rng.integers(0, self.range_size))
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    def _coprime_multiplier(self, rng):
+        """Picks a multiplier coprime with the range size, which makes the mapping a permutation."""
+        while True:
+            multiplier = int(rng.integers(1, self.range_size))
+            if math.gcd(multiplier, self.range_size) == 1:
+                return multiplier
+
+    def capacity(self):
+        """Returns how many unique employee IDs this worker can generate."""
+        return self.range_size
+
+    def reserve(self, count):
+        """Reserves the next `count` record indexes and returns the first one."""
+        with self._lock:
+            start = self._next_index
+            if start + count > self.range_size:
+                raise ValueError(f"ID range of worker {self.worker} is exhausted ({self.range_size} IDs)")
+            self._next_index += count
+        return start
+
+    def next_employee_id(self):
+        """Returns the next unused employee ID of this worker."""
+        return str(self.employee_ids(self.reserve(1), 1)[0])
+
+    def employee_ids(self, start, count):
+        """Returns the employee IDs of records start .. start + count - 1 as a string array."""
+        indexes = np.arange(start, start + count, dtype=np.int64)
+        values = (indexes * self.multiplier + self.increment) % self.range_size + self.range_start
+        return np.char.zfill(values.astype(str), self.id_width)
+
+    def batch(self, start, count):
+        """Generates records start .. start + count - 1 as a dict of column arrays.
+
+        A batch only depends on the seed, the worker and its start index, so the
+        same batch is produced again no matter in which order batches are built.
+        """
+        rng = np.random.default_rng([self.seed, self.worker, start])
+        employee_ids = self.employee_ids(start, count)
+        dob_days = rng.integers(0, int((DOB_END - DOB_START).astype(int)) + 1, size=count)
+        return {
+            "employee_id": employee_ids,
+            "first_name": np.array(FIRST_NAMES)[rng.integers(0, len(FIRST_NAMES), size=count)],
+            "middle_name": np.array(MIDDLE_NAMES)[rng.integers(0, len(MIDDLE_NAMES), size=count)],
+            "last_name": np.array(LAST_NAMES)[rng.integers(0, len(LAST_NAMES), size=count)],
+            "dob": np.datetime_as_string(DOB_START + dob_days.astype("timedelta64[D]"), unit="D"),
+            "license_number": np.char.add("DL", employee_ids),  # Unique because the ID is
+            "nationality": np.array(NATIONALITIES)[rng.integers(0, len(NATIONALITIES), size=count)],
+            "marital_status": np.array(MARITAL_STATUSES)[rng.integers(0, len(MARITAL_STATUSES), size=count)],
+            "gender": np.array(GENDERS)[rng.integers(0, len(GENDERS), size=count)],
+        }
+
+    def iter_batches(self, count, batch_size=100_000):
+        """Reserves `count` records and yields them as column batches."""
+        start = self.reserve(count)
+        for offset in range(0, count, batch_size):
+            yield self.batch(start + offset, min(batch_size, count - offset))
+
+    def iter_records(self, count, batch_size=100_000):
+        """Reserves `count` records and yields them one by one as dicts."""
+        for columns in self.iter_batches(count, batch_size):
+            for values in zip(*(columns[field].tolist() for field in EMPLOYEE_FIELDS)):
+                yield dict(zip(EMPLOYEE_FIELDS, values))
+
+    def to_csv(self, path, count, batch_size=100_000):
+        """Writes `count` new records to a CSV file and returns its path."""
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(EMPLOYEE_FIELDS)
+            for columns in self.iter_batches(count, batch_size):
+                writer.writerows(zip(*(columns[field].tolist() for field in EMPLOYEE_FIELDS)))
+        return path
+
+    def to_parquet(self, path, count, batch_size=100_000):
+        """Writes `count` new records to a Parquet file and returns its path (needs pyarrow)."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Writing Parquet files requires pyarrow: pip install pyarrow") from e
+
+        schema = pa.schema([(field, pa.string()) for field in EMPLOYEE_FIELDS])
+        with pq.ParquetWriter(path, schema) as writer:
+            for columns in self.iter_batches(count, batch_size):
+                writer.write_table(pa.table({field: columns[field].tolist() for field in EMPLOYEE_FIELDS}, schema=schema))
+        return path
+
+
+def _default_seed():
+    """Returns the seed from EMPLOYEE_DATA_SEED, or a fresh one so reruns against a live app get new IDs."""
+    seed = os.environ.get("EMPLOYEE_DATA_SEED")
+    return int(seed) if seed is not None else random.SystemRandom().randrange(2 ** 32)
+
+
+# Generator shared by the tests of this worker
+_employee_generator = EmployeeDataGenerator(
+    seed=_default_seed(),
+    worker=worker_index(),
+    workers=int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1")),
+)
+
+
 def generate_random_employee_id():
-    """Generate a random 3 digit employee ID."""
-    return ''.join(random.choices(string.digits, k=3))  # 6-digit employee ID
+    """Returns the next unique 8-digit employee ID of this worker."""
+    return _employee_generator.next_employee_id()
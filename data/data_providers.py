@@ -0,0 +1,160 @@
+"""
+data/data_providers.py
+
+This module provides the data-driven layer of the test suite: it reads the CSV
+files in data/ with the standard csv module (no pandas import at collection
+time) and turns their rows into pytest parameters.
+
+Small files (up to SMALL_FILE_BYTES) are parsed once per session and cached;
+first_row() and RowRef.load() read them from the cache, which is refreshed when
+the modification time or size of the file changes. Large files are streamed row by row, so a 100k-row
+credential matrix never has to be loaded into memory as a whole: a pytest
+parameter only holds the position of its row in the file (a RowRef), and the
+row is read when the test actually runs. Data files must hold one record per line.
+
+Functions:
+    - data_path(name): Returns the absolute path of a file in data/.
+    - load_rows(name, **filters): Returns the cached rows of a CSV file matching the filters.
+    - iter_rows(name, **filters): Streams the rows of a CSV file matching the filters.
+    - first_row(name, **filters): Returns the first row matching the filters.
+    - iter_row_refs(name, **filters): Streams matching rows with a RowRef pointing back to each of them.
+    - iter_params(name, id_field=None, limit=None, **filters): Streams row references as pytest parameters.
+"""
+import csv
+import itertools
+import os
+
+import pytest
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Files up to this size are parsed once and kept in memory; larger ones are streamed
+SMALL_FILE_BYTES = 1024 * 1024
+
+# Parsed small files, keyed by path: ((mtime, size) they were parsed at, [(offset, row)], {offset: row})
+_row_cache = {}
+
+# Header row of each large file read through a RowRef, keyed by path: ((mtime, size), header)
+_header_cache = {}
+
+
+def data_path(name):
+    """Returns the absolute path of a data file; absolute paths are returned unchanged."""
+    return name if os.path.isabs(name) else os.path.join(DATA_DIR, name)
+
+
+def _matches(row, filters):
+    return all(row.get(field) == str(value) for field, value in filters.items())
+
+
+def _version(path):
+    """Returns what identifies the current content of a file: its modification time and size."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_line(line):
+    return next(csv.reader([line.decode("utf-8")]), None)
+
+
+def _iter_lines(csv_file):
+    """Streams (offset, values) for the data lines of a file opened in binary mode, after its header."""
+    while True:
+        offset = csv_file.tell()
+        line = csv_file.readline()
+        if not line:
+            return
+        values = _parse_line(line)
+        if values:  # Blank lines are skipped
+            yield offset, values
+
+
+def _parsed(path, version):
+    """Returns the cached rows of a small file, parsing it again if it changed since."""
+    cached = _row_cache.get(path)
+    if cached is None or cached[0] != version:
+        with open(path, "rb") as csv_file:
+            header = _parse_line(csv_file.readline()) or []
+            rows = [(offset, dict(zip(header, values))) for offset, values in _iter_lines(csv_file)]
+        cached = _row_cache[path] = (version, rows, dict(rows))
+    return cached
+
+
+def iter_rows(name, **filters):
+    """Streams the rows of a CSV file as dicts, keeping only those whose columns equal the filters."""
+    with open(data_path(name), newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            if _matches(row, filters):
+                yield row
+
+
+def load_rows(name, **filters):
+    """Returns copies of the rows of a CSV file matching the filters, parsing the file only once per session."""
+    path = data_path(name)
+    _, rows, _ = _parsed(path, _version(path))
+    return [dict(row) for _, row in rows if _matches(row, filters)]
+
+
+def first_row(name, **filters):
+    """Returns the first row matching the filters: from the cache for small files, else without reading the rest."""
+    path = data_path(name)
+    version = _version(path)
+    if version[1] <= SMALL_FILE_BYTES:
+        _, rows, _ = _parsed(path, version)
+        row = next((dict(row) for _, row in rows if _matches(row, filters)), None)
+    else:
+        row = next(iter_rows(path, **filters), None)
+    if row is None:
+        raise LookupError(f"No row of {name} matches {filters}")
+    return row
+
+
+class RowRef:
+    """Position of one data row in its file; the row itself is read when load() is called."""
+
+    __slots__ = ("path", "offset")
+
+    def __init__(self, path, offset):
+        self.path = path
+        self.offset = offset
+
+    def load(self):
+        """Returns the referenced row as a dict: from the cache for small files, else read from its position."""
+        version = _version(self.path)
+        if version[1] <= SMALL_FILE_BYTES:
+            row = _parsed(self.path, version)[2].get(self.offset)
+            if row is not None:
+                return dict(row)
+        with open(self.path, "rb") as csv_file:
+            cached = _header_cache.get(self.path)
+            if cached is None or cached[0] != version:
+                cached = _header_cache[self.path] = (version, _parse_line(csv_file.readline()))
+            csv_file.seek(self.offset)
+            return dict(zip(cached[1], _parse_line(csv_file.readline())))
+
+    def __repr__(self):
+        return f"RowRef({os.path.basename(self.path)!r}, offset={self.offset})"
+
+
+def iter_row_refs(name, **filters):
+    """Streams (row, RowRef) pairs for the rows matching the filters, reading the file line by line."""
+    path = data_path(name)
+    with open(path, "rb") as csv_file:
+        header = _parse_line(csv_file.readline())
+        for offset, values in _iter_lines(csv_file):
+            row = dict(zip(header, values))
+            if _matches(row, filters):
+                yield row, RowRef(path, offset)
+
+
+def iter_params(name, id_field=None, limit=None, **filters):
+    """Streams matching rows as pytest.param objects holding a RowRef, for indirect parametrization.
+    Args:
+        name: CSV file name in data/ (or an absolute path).
+        id_field: Column used in the test id; the row number is always appended.
+        limit: Only use the first `limit` matching rows.
+        filters: Column values a row must have.
+    """
+    for number, (row, ref) in enumerate(itertools.islice(iter_row_refs(name, **filters), limit), start=1):
+        label = f"{row[id_field]}-{number}" if id_field else f"row{number}"
+        yield pytest.param(ref, id=label)
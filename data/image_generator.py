@@ -0,0 +1,162 @@
+"""
+data/image_generator.py
+
+This module provides the profile pictures uploaded by the tests: the sample
+picture in data/, and generated pictures of an exact size in each format Orange
+HRM accepts (JPEG, PNG and GIF), up to its upload limit.
+
+A generated picture is a small valid image of its format padded to the wanted
+size with comment or private-chunk data that every decoder skips, so the bytes
+the browser reads, encodes and uploads grow with the size while the picture
+stays the same. The padding is seeded by the size, so a file is generated once
+and then reused from the cache folder by every later run.
+
+Functions:
+    - profile_image_path(): Returns the absolute path of data/profileimage.jpeg.
+    - generate_image(size, image_format): Returns the bytes of a picture of exactly `size` bytes.
+    - image_file(size, image_format, cache_dir): Returns the path of a cached generated picture.
+    - image_matrix(sizes, formats, cache_dir): Returns (format, size, path) for every combination.
+"""
+import os
+import random
+import struct
+import tempfile
+import zlib
+
+from data.data_providers import data_path
+
+# Sample picture shipped with the suite
+PROFILE_IMAGE = "profileimage.jpeg"
+
+# Largest profile picture Orange HRM accepts (1 MiB, see MAX_PICTURE_BYTES of the stand-in server)
+MAX_UPLOAD_BYTES = 1024 * 1024
+
+# File extension of each supported format
+IMAGE_FORMATS = {"jpeg": ".jpeg", "png": ".png", "gif": ".gif"}
+
+# Picture sizes of the upload benchmark, from a typical photo up to the limit
+UPLOAD_SIZES = (16 * 1024, 128 * 1024, 512 * 1024, MAX_UPLOAD_BYTES)
+
+# 1x1 GIF89a with a two-colour palette, without its trailer byte
+_GIF_IMAGE = (
+    b"GIF89a" + bytes.fromhex("01000100800000")  # Logical screen: 1x1, global palette of two colours
+    + bytes.fromhex("000000ffffff")  # Palette: black, white
+    + bytes.fromhex("2c0000000001000100000202440100")  # Image: one pixel, LZW-coded, end of data
+)
+
+# Type of the PNG chunk holding the padding: ancillary, private, safe to copy
+_PNG_PADDING_CHUNK = b"paDd"
+
+
+def profile_image_path():
+    """Returns the absolute path of the sample profile picture, on any operating system."""
+    path = data_path(PROFILE_IMAGE)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"The sample profile picture is missing: {path}")
+    return path
+
+
+def _filler(size, length):
+    """Returns `length` reproducible, incompressible bytes for a picture of `size` bytes."""
+    return random.Random(size).randbytes(length)
+
+
+def _png_chunk(chunk_type, data):
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def _png_image(width=200, height=200):
+    """Returns a grey PNG of the recommended profile picture dimensions, without its IEND chunk."""
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+    pixels = (b"\x00" + b"\x80\x80\x80" * width) * height
+    return b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header) + _png_chunk(b"IDAT", zlib.compress(pixels, 9))
+
+
+def _jpeg(size):
+    with open(profile_image_path(), "rb") as image:
+        picture = image.read()
+    padding = size - len(picture)
+    if padding < 0 or 0 < padding < 4:
+        raise ValueError(f"A JPEG picture has {len(picture)} bytes or at least 4 more, not {size}")
+    segments = []
+    filler = _filler(size, padding)
+    while padding:
+        segment = min(padding, 65537)  # A comment segment holds at most 65533 bytes after its 4-byte header
+        if 0 < padding - segment < 4:
+            segment = padding - 4
+        data, filler = filler[:segment - 4], filler[segment - 4:]
+        segments.append(b"\xff\xfe" + struct.pack(">H", segment - 2) + data)
+        padding -= segment
+    return picture[:2] + b"".join(segments) + picture[2:]  # Comments go right after the start-of-image marker
+
+
+def _png(size):
+    picture = _png_image()
+    end = _png_chunk(b"IEND", b"")
+    padding = size - len(picture) - len(end)
+    if padding < 0 or 0 < padding < 12:
+        raise ValueError(f"A PNG picture has {len(picture) + len(end)} bytes or at least 12 more, not {size}")
+    chunk = _png_chunk(_PNG_PADDING_CHUNK, _filler(size, padding - 12)) if padding else b""
+    return picture + chunk + end
+
+
+def _gif(size):
+    padding = size - len(_GIF_IMAGE) - 1
+    if padding < 0 or 0 < padding < 5:
+        raise ValueError(f"A GIF picture has {len(_GIF_IMAGE) + 1} bytes or at least 5 more, not {size}")
+    extension = b""
+    if padding:
+        blocks = -(-(padding - 3) // 256)  # Comment extension: 3 bytes, plus a length byte per block of up to 255
+        filler = _filler(size, padding - 3 - blocks)
+        sizes = [len(filler) // blocks + (1 if number < len(filler) % blocks else 0) for number in range(blocks)]
+        parts, offset = [], 0
+        for length in sizes:
+            parts.append(bytes([length]) + filler[offset:offset + length])
+            offset += length
+        extension = b"\x21\xfe" + b"".join(parts) + b"\x00"
+    return _GIF_IMAGE + extension + b"\x3b"
+
+
+_GENERATORS = {"jpeg": _jpeg, "png": _png, "gif": _gif}
+
+
+def _check_format(image_format):
+    if image_format not in _GENERATORS:
+        raise ValueError(f"Unknown image format {image_format!r}, expected one of {sorted(_GENERATORS)}")
+
+
+def generate_image(size, image_format="jpeg"):
+    """Returns the bytes of a valid picture of exactly `size` bytes.
+    Args:
+        size: File size in bytes; at least the size of the unpadded picture of the format.
+        image_format: "jpeg", "png" or "gif".
+    """
+    _check_format(image_format)
+    return _GENERATORS[image_format](size)
+
+
+def image_file(size, image_format="jpeg", cache_dir=None):
+    """Returns the path of a generated picture, writing it to the cache folder only the first time.
+    Args:
+        size: File size in bytes.
+        image_format: "jpeg", "png" or "gif".
+        cache_dir: Folder of the generated pictures; a folder in the system temp directory by default.
+    """
+    _check_format(image_format)
+    cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "orangehrm-images")
+    path = os.path.join(cache_dir, f"profile-{size}{IMAGE_FORMATS[image_format]}")
+    if os.path.isfile(path) and os.path.getsize(path) == size:
+        return path
+    data = generate_image(size, image_format)
+    os.makedirs(cache_dir, exist_ok=True)
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "wb") as image:
+        image.write(data)
+    os.replace(partial, path)  # Parallel workers never see a half-written picture
+    return path
+
+
+def image_matrix(sizes=UPLOAD_SIZES, formats=tuple(IMAGE_FORMATS), cache_dir=None):
+    """Returns (format, size, path) for every combination of format and size."""
+    return [(image_format, size, image_file(size, image_format, cache_dir))
+            for image_format in formats for size in sizes]
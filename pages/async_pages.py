@@ -0,0 +1,234 @@
+"""
+async_pages.py
+
+This module defines AsyncLoginPage and AsyncPIMPage, the asyncio counterparts of
+LoginPage and PIMPage for browser sessions driven by utils.async_webdriver.
+
+They use the locators, page scripts and outcome signals of the synchronous page
+objects, so both follow the application in the same way. Every method is a
+coroutine: while one browser works, the event loop drives the others, so a
+single process can run the flows in dozens of browsers at once. AsyncEventWait
+runs the wait loop of EventWait, awaiting each of its steps.
+
+Usage:
+    async with ChromeDriverServer() as server:
+        driver = await server.new_session()
+        await driver.get(login_url)
+        login_page = AsyncLoginPage(driver)
+        await login_page.login("Admin", "admin123")
+        outcome, text = await login_page.wait_for_outcome()
+        pim_page = AsyncPIMPage(driver)
+        await pim_page.navigate_to_pim()
+"""
+import asyncio
+
+from pages.dropdown import READ_OPTIONS_JS, SELECT_OPTION_JS
+from pages.form_filler import FILL_FORM_JS, to_script_locator
+from pages.locators import compile_locator
+from pages.login_page import LOCATORS as LOGIN_LOCATORS, LOGIN_OUTCOMES
+from pages.pim_page import LOCATORS as PIM_LOCATORS, SAVE_OUTCOMES
+from pages.waits import EventWait, latched_selectors, outcome_steps, outcome_triples
+from utils.steps import run_async_steps
+
+
+def element_located(locator, state="visible"):
+    """Async condition that returns the element of locator once it is present, visible or clickable."""
+    async def _condition(driver):
+        element = await driver.find_element(*locator)
+        if state == "present":
+            return element
+        if not await element.is_displayed():
+            return False
+        if state == "clickable" and not await element.is_enabled():
+            return False
+        return element
+
+    return _condition
+
+
+def outcome_appeared(outcomes):
+    """Async condition that returns (name, text) for the first of several outcomes whose element has appeared."""
+    pairs = outcome_triples(outcomes)
+    return lambda driver: run_async_steps(outcome_steps(driver, pairs))
+
+
+class AsyncEventWait(EventWait):
+    """Waits for an async condition, re-checking it whenever the DOM changes.
+
+    The loop is EventWait's, including the test time budget; only its driver
+    calls and sleeps are awaited.
+    """
+
+    _sleep = staticmethod(asyncio.sleep)
+
+    async def arm(self, *css_selectors):
+        """Starts remembering the text of the next element matching each css_selector (e.g. a toast)."""
+        return await run_async_steps(self._arm_steps(css_selectors))
+
+    async def until(self, condition, message=""):
+        """Waits until await condition(driver) returns a truthy value and returns that value."""
+        return await run_async_steps(self._wait_steps(condition, message, expect_true=True))
+
+    async def until_not(self, condition, message=""):
+        """Waits until await condition(driver) returns a falsy value."""
+        return await run_async_steps(self._wait_steps(condition, message, expect_true=False))
+
+
+class _AsyncPage:
+    """Locators and waits shared by the async page objects."""
+
+    def __init__(self, driver, locators, timeout):
+        self.driver = driver
+        self.wait = AsyncEventWait(driver, timeout)
+        self.locators = {name: compile_locator(locator) for name, locator in locators.items()}
+
+    async def element(self, name, state="visible"):
+        """Waits for the element registered under name to be present, visible or clickable."""
+        return await self.wait.until(element_located(self.locators[name], state), f"'{name}' is not {state}")
+
+    async def type_into(self, name, text):
+        """Replaces the text of a field the Selenium way."""
+        field = await self.element(name)
+        await field.clear()
+        await field.send_keys(text)
+
+    async def fill(self, **values):
+        """Fills several fields in one script call, typing the ones the script cannot set."""
+        names = list(values)
+        statuses = await self.driver.execute_script(
+            FILL_FORM_JS, [to_script_locator(self.locators[name]) + [values[name]] for name in names]
+        )
+        for name, status in zip(names, statuses):
+            if status not in ("filled", "unchanged"):
+                await self.type_into(name, values[name])
+
+
+class AsyncLoginPage(_AsyncPage):
+    """Async page object for the login form."""
+
+    def __init__(self, driver, timeout=10):
+        super().__init__(driver, LOGIN_LOCATORS, timeout)
+
+    async def login(self, username, password):
+        """Logs in to the application using provided username and password."""
+        await self.type_into("username", username)
+        await self.type_into("password", password)
+        login_button = await self.element("login_button", "clickable")
+        await self.wait.arm(*latched_selectors(LOGIN_OUTCOMES))  # Field messages count whenever they are visible; an earlier alert is ignored
+        await login_button.click()
+
+    async def wait_for_outcome(self):
+        """Waits for the result of the last login attempt; returns ("success" | "invalid" | "validation", text)."""
+        return await self.wait.until(outcome_appeared(LOGIN_OUTCOMES), "No outcome of the login was shown")
+
+    async def is_logged_in(self):
+        """Checks if the user is logged in by verifying the page title."""
+        return "OrangeHRM" in await self.driver.title()
+
+
+class AsyncPIMPage(_AsyncPage):
+    """Async page object for the PIM (Personnel Information Management) section."""
+
+    def __init__(self, driver, timeout=20):
+        super().__init__(driver, PIM_LOCATORS, timeout)
+        self.last_outcome = None  # "success", "error" or "validation" for the last toast or message read
+
+    async def navigate_to_pim(self):
+        """Clicks on the PIM tab."""
+        await (await self.element("pim_menu", "clickable")).click()
+
+    async def click_add_employee(self):
+        """Clicks on the 'Add Employee' link."""
+        await (await self.element("add_employee_link", "clickable")).click()
+
+    async def enter_employee_details(self, first_name, middle_name, last_name, employee_id):
+        """Fills in the employee details."""
+        await self.element("first_name")  # Wait for the form once, then fill all fields in a single round trip
+        await self.fill(first_name=first_name, middle_name=middle_name, last_name=last_name,
+                        employee_id=str(employee_id))
+
+    async def upload_employee_image(self, image_path):
+        """Uploads the employee's profile image."""
+        await (await self.element("file_input", "present")).send_keys(image_path)
+
+    async def _save(self, button_name, state):
+        save_button = await self.element(button_name, state)
+        await self.wait.arm(*latched_selectors(SAVE_OUTCOMES))  # Catch the toast even if it disappears quickly
+        await save_button.click()
+
+    async def click_save(self):
+        """Clicks the save button of the Add Employee form."""
+        await self._save("submit_button", "clickable")
+
+    async def click_save2(self):
+        """Clicks the save button of the personal details form."""
+        await self._save("personal_details_save", "visible")
+
+    async def get_toast_message(self):
+        """Returns the message that follows a save or delete: the success toast, or the error shown instead."""
+        self.last_outcome, message = await self.wait.until(outcome_appeared(SAVE_OUTCOMES), "No toast was shown")
+        return message
+
+    async def select_first_employee(self):
+        """Opens the first employee of the employee list."""
+        await (await self.element("first_row")).click()
+
+    async def search_employee_by_id(self, employee_id):
+        """Filters the employee list down to the employee with the given ID."""
+        await self.type_into("employee_id", employee_id)
+        await (await self.element("submit_button", "clickable")).click()
+
+        async def _first_row_shows_id(driver):
+            return employee_id in await (await driver.find_element(*self.locators["first_row_id"])).text()
+
+        await self.wait.until(_first_row_shows_id, f"Employee {employee_id} is not the first row of the list")
+
+    async def _select(self, name, value):
+        """Selects the option with the given text in an oxd-select dropdown."""
+        field = await self.element(name, "clickable")
+        await field.click()
+
+        async def _options(driver):
+            return await driver.execute_script(READ_OPTIONS_JS, field) or False
+
+        options = await self.wait.until(_options, f"The {name} dropdown did not open")
+        if value not in options:
+            raise ValueError(f"'{value}' is not an option of the {name} dropdown")
+        if await self.driver.execute_script(SELECT_OPTION_JS, field, options.index(value), value) != value:
+            raise ValueError(f"Could not select '{value}' in the {name} dropdown")
+
+    async def select_marital_status(self, status):
+        """Select marital status from dropdown."""
+        await self._select("marital_status", status)
+
+    async def select_nationality(self, nationality):
+        """Select nationality from dropdown."""
+        await self._select("nationality", nationality)
+
+    async def select_gender(self, gender):
+        """Select gender radio button."""
+        await (await self.element("gender_male" if gender == "male" else "gender_female")).click()
+
+    async def edit_employee_details(self, first_name, middle_name, last_name, employee_id, license_number, dob,
+                                    nationality, marital_status, gender):
+        """Edit employee details."""
+        # The edit form is filled in asynchronously, so wait until the stored name has been loaded
+        first_name_field = await self.element("first_name")
+
+        async def _loaded(driver):
+            return await first_name_field.get_property("value")
+
+        await self.wait.until(_loaded, "The personal details were not loaded")
+        await self.fill(first_name=first_name, middle_name=middle_name, last_name=last_name,
+                        employee_id=str(employee_id), license_number=license_number,
+                        license_expiry="2024-10-30", date_of_birth=dob)
+        await self.select_marital_status(marital_status)
+        await self.select_gender(gender)
+
+    async def delete_employee_details(self):
+        """Selects the listed employees and deletes them."""
+        checkbox = await self.element("select_all_checkbox", "clickable")
+        if not await checkbox.is_selected():
+            await checkbox.click()
+        await (await self.element("delete_selected_button", "clickable")).click()
+        await self._save("confirm_delete_button", "clickable")
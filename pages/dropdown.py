@@ -0,0 +1,119 @@
+"""
+dropdown.py
+
+This module defines the Dropdown class, which drives the custom select widgets
+(oxd-select) of the Orange HRM application.
+
+Instead of pressing ARROW_DOWN and reading the text after every key press, the
+dropdown is opened once, all option texts are read with one script call and the
+wanted option is clicked directly by its index. Option lists are cached per
+browser session, so a value that does not exist is rejected before the dropdown
+is even opened the next time.
+
+Usage:
+    nationality = Dropdown(driver, wait, (By.CSS_SELECTOR, "..."), "nationality")
+    nationality.select("Indian")
+"""
+from selenium.webdriver.support import expected_conditions as EC
+
+# Option lists already read, keyed by (browser session id, dropdown name)
+_option_cache = {}
+
+# Returns the texts of the options of the opened dropdown the field belongs to
+READ_OPTIONS_JS = """
+const wrapper = arguments[0].closest('.oxd-select-wrapper') || document;
+return Array.from(wrapper.querySelectorAll("[role='option']"), option => option.innerText.trim());
+"""
+
+# Clicks the option at the given index if it holds the expected text; returns the text found there
+SELECT_OPTION_JS = """
+const [field, index, expected] = arguments;
+const wrapper = field.closest('.oxd-select-wrapper') || document;
+const option = wrapper.querySelectorAll("[role='option']")[index];
+if (!option) return null;
+const text = option.innerText.trim();
+if (text !== expected) return text;
+option.scrollIntoView({block: 'nearest'});
+for (const type of ['mousedown', 'mouseup', 'click']) {
+    option.dispatchEvent(new MouseEvent(type, {bubbles: true, cancelable: true, view: window}));
+}
+return text;
+"""
+
+
+def clear_option_cache():
+    """Forgets every cached option list."""
+    _option_cache.clear()
+
+
+class Dropdown:
+    """One oxd-select dropdown of a page."""
+
+    def __init__(self, driver, wait, locator, name):
+        """Initializes the Dropdown.
+        Args:
+            driver: A Selenium WebDriver instance.
+            wait: The wait of the page object.
+            locator: (By, value) locator of the clickable select field.
+            name: Name of the dropdown, used as its cache key.
+        """
+        self.driver = driver
+        self.wait = wait
+        self.locator = locator
+        self.name = name
+
+    @property
+    def _cache_key(self):
+        return (self.driver.session_id, self.name)
+
+    def cached_options(self):
+        """Returns the cached option texts, or None if they have not been read yet."""
+        return _option_cache.get(self._cache_key)
+
+    def _open(self):
+        """Clicks the select field and returns it."""
+        field = self.wait.until(EC.element_to_be_clickable(self.locator))
+        field.click()
+        return field
+
+    def _read_options(self, field):
+        """Reads all option texts of the opened dropdown in one call and caches them."""
+        options = self.wait.until(lambda driver: driver.execute_script(READ_OPTIONS_JS, field) or False)
+        _option_cache[self._cache_key] = options
+        return options
+
+    def options(self):
+        """Returns the option texts of the dropdown, reading them once per session."""
+        options = self.cached_options()
+        if options is None:
+            field = self._open()
+            options = self._read_options(field)
+            field.click()  # Close the dropdown again
+        return options
+
+    def _index_of(self, value, options):
+        """Returns the index of value in options or raises ValueError."""
+        try:
+            return options.index(value)
+        except ValueError:
+            raise ValueError(f"'{value}' is not an option of the {self.name} dropdown") from None
+
+    def select(self, value):
+        """Selects the option with the given text.
+
+        Raises:
+            ValueError: If the dropdown has no option with that text.
+        """
+        cached = self.cached_options()
+        if cached is not None:
+            self._index_of(value, cached)  # Fail before touching the page
+        field = self._open()
+        options = cached if cached is not None else self._read_options(field)
+        found = self.driver.execute_script(SELECT_OPTION_JS, field, self._index_of(value, options), value)
+        if found != value:
+            # The cached list no longer matches the page, read it again and retry once
+            options = self._read_options(field)
+            found = self.driver.execute_script(SELECT_OPTION_JS, field, self._index_of(value, options), value)
+            if found != value:
+                raise ValueError(f"Could not select '{value}' in the {self.name} dropdown")
+        return value
@@ -0,0 +1,100 @@
+"""
+form_filler.py
+
+This module defines the FormFiller class, which fills a whole form in a single
+scripted WebDriver call instead of a wait, clear() and send_keys() per field.
+
+The script finds every field, skips the ones that already hold the wanted value,
+sets the others through the native value setter and fires the input and change
+events the Vue frontend of Orange HRM listens to. Fields the script cannot set
+(file inputs, non-input widgets, fields that are not found yet) are typed one by
+one through Selenium as a fallback.
+
+Usage:
+    filler = FormFiller(driver, wait)
+    filler.fill({(By.NAME, "firstName"): "Alice", (By.NAME, "lastName"): "Smith"})
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+# Resolves, compares and sets every field in one round trip.
+# Each entry of arguments[0] is [strategy, selector, value]; the result lists one status per entry.
+FILL_FORM_JS = """
+const fields = arguments[0];
+const find = (strategy, selector) => strategy === 'xpath'
+    ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(selector);
+const setters = {
+    INPUT: Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set,
+    TEXTAREA: Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set,
+};
+return fields.map(([strategy, selector, value]) => {
+    const field = find(strategy, selector);
+    if (!field) return 'missing';
+    const setter = setters[field.tagName];
+    if (!setter || field.type === 'file' || field.disabled || field.readOnly) return 'fallback';
+    if (field.value === value) return 'unchanged';
+    field.focus();
+    setter.call(field, value);
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+    field.blur();
+    return field.value === value ? 'filled' : 'fallback';
+});
+"""
+
+
+def to_script_locator(locator):
+    """Converts a Selenium (By, value) locator into the [strategy, selector] pair used by the script."""
+    by, value = locator
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.NAME:
+        return ["css", f'[name="{value}"]']
+    if by == By.ID:
+        return ["css", f'[id="{value}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f".{value}"]
+    raise ValueError(f"Locator strategy {by!r} cannot be used in a batch fill")
+
+
+class FormFiller:
+    """Fills several form fields with one script call."""
+
+    def __init__(self, driver, wait):
+        """Initializes the FormFiller.
+        Args:
+            driver: A Selenium WebDriver instance.
+            wait: The wait of the page object, used for fallback fields.
+        """
+        self.driver = driver
+        self.wait = wait
+
+    def fill(self, fields):
+        """Fills the form and returns the status of every field.
+        Args:
+            fields: Mapping of (By, value) locators to the text to enter, in form order.
+        Returns:
+            dict: Locator -> "filled", "unchanged" or "typed".
+        """
+        results = {}
+        if fields:
+            statuses = self.driver.execute_script(
+                FILL_FORM_JS, [to_script_locator(locator) + [value] for locator, value in fields.items()]
+            )
+            results.update(zip(fields, statuses))
+
+        for locator, value in fields.items():
+            if results.get(locator) in ("filled", "unchanged"):
+                continue
+            self.type_field(locator, value)
+            results[locator] = "typed"
+        return results
+
+    def type_field(self, locator, value):
+        """Types a value into one field the Selenium way."""
+        field = self.wait.until(EC.visibility_of_element_located(locator))
+        field.clear()
+        field.send_keys(value)
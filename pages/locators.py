@@ -0,0 +1,164 @@
+"""
+locators.py
+
+This module defines the LocatorRegistry class, which holds the locators of one
+page object and caches the elements they resolve to.
+
+Locators are compiled once when the registry is built: simple XPaths and NAME,
+ID and CLASS_NAME locators are turned into the equivalent CSS selector, which
+browsers resolve faster. A resolved element is kept until the page object
+reports a navigation (invalidate()) or the element turns out to be stale, in
+which case it is looked up again transparently. Hits, misses and stale
+re-resolutions are counted per registry, and added to a shared counter while
+count_stats() is on (the test suite turns it on for the tests with a browser).
+
+Usage:
+    registry = LocatorRegistry(driver, wait, {"save": (By.XPATH, "//button[@type='submit']")})
+    registry.element("save", "clickable").click()
+    registry.invalidate()  # After a click that navigates
+    print(registry.stats())
+"""
+import re
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+
+# Counter the cache statistics of every registry are added to, or None (see count_stats())
+_stats = None
+
+# //tag or //tag[@attribute='value'] - the XPath shapes that have a plain CSS equivalent
+_SIMPLE_XPATH = re.compile(r"^//([a-zA-Z][\w-]*)(?:\[@([\w-]+)=(['\"])([^'\"]*)\3\])?$")
+_CSS_IDENTIFIER = re.compile(r"^[a-zA-Z_][\w-]*$")
+
+# Conditions used to resolve an element in a given state
+_CONDITIONS = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+
+
+def count_stats(counter):
+    """Adds the hits, misses and stale re-resolutions of every registry to counter from now on.
+    Args:
+        counter: A collections.Counter, or None to stop counting.
+    """
+    global _stats
+    _stats = counter
+
+
+def compile_locator(locator):
+    """Returns the fastest equivalent of a (By, value) locator, preferring CSS selectors."""
+    by, value = locator
+    if by == By.XPATH:
+        match = _SIMPLE_XPATH.match(value)
+        if match:
+            tag, attribute, _, attribute_value = match.groups()
+            return (By.CSS_SELECTOR, f'{tag}[{attribute}="{attribute_value}"]' if attribute else tag)
+    elif by == By.ID and _CSS_IDENTIFIER.match(value):
+        return (By.CSS_SELECTOR, f"#{value}")
+    elif by == By.ID:
+        return (By.CSS_SELECTOR, f'[id="{value}"]')
+    elif by == By.NAME:
+        return (By.CSS_SELECTOR, f'[name="{value}"]')
+    elif by == By.CLASS_NAME and _CSS_IDENTIFIER.match(value):
+        return (By.CSS_SELECTOR, f".{value}")
+    return (by, value)
+
+
+class CachedElement(WebElement):
+    """WebElement that looks itself up again when the browser reports it as stale."""
+
+    def __init__(self, element, resolve):
+        """Wraps a resolved element.
+        Args:
+            element: The WebElement found by the driver.
+            resolve: Callable returning a fresh WebElement for the same locator.
+        """
+        super().__init__(element.parent, element.id)
+        self._resolve = resolve
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._id = self._resolve().id  # The page re-rendered the element, point to the new one
+            return super()._execute(command, params)
+
+
+class LocatorRegistry:
+    """Compiled locators of one page and the elements they currently resolve to."""
+
+    def __init__(self, driver, wait, locators):
+        """Initializes the registry.
+        Args:
+            driver: A Selenium WebDriver instance.
+            wait: The wait of the page object, used when an element has to be looked up.
+            locators: Mapping of locator names to (By, value) locators.
+        """
+        self.driver = driver
+        self.wait = wait
+        self.locators = {name: compile_locator(locator) for name, locator in locators.items()}
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def locator(self, name):
+        """Returns the compiled (By, value) locator registered under name."""
+        return self.locators[name]
+
+    def _count(self, kind):
+        """Counts a cache hit, miss or stale re-resolution."""
+        setattr(self, kind, getattr(self, kind) + 1)
+        if _stats is not None:
+            _stats[kind] += 1
+
+    def _refresh(self, name):
+        """Finds the element again after it went stale."""
+        self._count("stale")
+        return self.driver.find_element(*self.locators[name])
+
+    def _is_ready(self, element, state):
+        """Checks a cached element against the wanted state."""
+        if state == "present":
+            return True
+        if state == "visible":
+            return element.is_displayed()
+        return element.is_displayed() and element.is_enabled()
+
+    def element(self, name, state="visible"):
+        """Returns the element registered under name, waiting for it only if it is not cached.
+        Args:
+            name: Name of the locator.
+            state: "present", "visible" or "clickable".
+        """
+        cached = self._cache.get(name)
+        if cached is not None:
+            try:
+                if self._is_ready(cached, state):
+                    self._count("hits")
+                    return cached
+            except StaleElementReferenceException:
+                # is_displayed() runs a script on the element instead of an element command, so it is not
+                # retried by CachedElement: the element is looked up again below
+                self._count("stale")
+            except NoSuchElementException:
+                pass  # Stale and gone from the page: wait for it below
+        self._count("misses")
+        element = self.wait.until(_CONDITIONS[state](self.locators[name]))
+        cached = CachedElement(element, lambda: self._refresh(name))
+        self._cache[name] = cached
+        return cached
+
+    def invalidate(self, name=None):
+        """Drops the cached element of one locator, or of all locators after a navigation."""
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+    def stats(self):
+        """Returns the cache hits, misses and stale re-resolutions of this registry."""
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale}
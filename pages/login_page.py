@@ -3,7 +3,8 @@ login_page.py
 
 This module defines the LoginPage class, which encapsulates the login functionality
 of the Orange HRM application. It includes methods for entering user credentials,
-submitting the login form, and checking the login status based on the page title.
+submitting the login form, detecting the outcome of a login attempt as soon as
+the application shows it, and checking the login status based on the page title.
 
 Usage:
     Instantiate the LoginPage class with a Selenium WebDriver instance to use its
@@ -11,8 +12,25 @@ Usage:
 """
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from pages.locators import LocatorRegistry
+from pages.waits import EventWait, latched_selectors, outcome_appeared
+from utils.perf_metrics import perf_transition
+from utils.trace_log import trace
+
+# Locators of the login form, compiled and cached by the page's LocatorRegistry
+LOCATORS = {
+    "username": (By.NAME, "username"),
+    "password": (By.NAME, "password"),
+    "login_button": (By.XPATH, "//button[@type='submit']"),
+}
+
+# Signals raced after submitting the form: the dashboard header, the credentials alert or a field message
+LOGIN_OUTCOMES = {
+    "success": ".oxd-topbar-header-breadcrumb-module",
+    "invalid": ".oxd-alert-content-text",
+    "validation": ".oxd-input-field-error-message",
+}
 
 class LoginPage:
     """Page object for the login functionality of the Orange HRM application."""
@@ -24,26 +42,38 @@ class LoginPage:
         """
 
         self.driver = driver  # Store the WebDriver instance
-        self.wait = WebDriverWait(driver, 10)  # Set up an explicit wait for elements
+        self.wait = EventWait(driver, 10)  # Set up an explicit wait that wakes up on DOM changes
+        self.locators = LocatorRegistry(driver, self.wait, LOCATORS)  # Resolves and caches page elements
 
     def login(self, username, password):
         """Logs in to the application using provided username and password."""
-        print("Waiting for the username field to be visible...")
-        username_field = self.wait.until(EC.visibility_of_element_located((By.NAME, "username")))
+        username_field = self.locators.element("username")
         username_field.clear()  # Clear the field before entering new data
         username_field.send_keys(username)  # Enter the username
-        print(f"Entered Username: {username}")
+        trace("login.username", username=username)
 
-        print("Waiting for the password field to be visible...")
-        password_field = self.wait.until(EC.visibility_of_element_located((By.NAME, "password")))
+        password_field = self.locators.element("password")
         password_field.clear()  # Clear the field before entering new data
         password_field.send_keys(password)  # Enter the password
-        print(f"Entered Password: {password}")
+        trace("login.password", password=password)  # Redacted if the trace is ever written
+
+        login_button = self.locators.element("login_button", "clickable")
+        self.wait.arm(*latched_selectors(LOGIN_OUTCOMES))  # Field messages count whenever they are visible; an earlier alert is ignored
+        with perf_transition(self.driver, "login", LOGIN_OUTCOMES):  # Records the next page, or the rejection, when measuring performance
+            login_button.click()  # Click the login button
+        self.locators.invalidate()  # Logging in leaves the login page
+        trace("login.submit")
 
-        print("Waiting for the login button to be clickable...")
-        login_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']")))
-        login_button.click()  # Click the login button
-        print("Clicked on the login button.")
+    def wait_for_outcome(self):
+        """Waits for the result of the last login attempt, returning as soon as one is shown.
+
+        Returns:
+               tuple: (outcome, text), where outcome is "success" (the dashboard opened), "invalid"
+               (the "Invalid credentials" alert) or "validation" (e.g. "Required" under an empty field).
+        """
+        outcome, text = self.wait.until(outcome_appeared(LOGIN_OUTCOMES), "No outcome of the login was shown")
+        trace("login.outcome", outcome=outcome, message=text)
+        return outcome, text
 
     def is_logged_in(self):
         """
@@ -54,5 +84,5 @@ class LoginPage:
 
         """
         title = self.driver.title  # Get the current page title
-        print(f"Current page title: {title}")
+        trace("login.title", title=title)
         return "OrangeHRM" in title  # Return True if logged in, else False
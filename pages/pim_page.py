@@ -11,116 +11,243 @@ Usage:
     WebDriver instance and call the appropriate methods to interact with the
     PIM features of the application.
 """
+import time
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
+
+from pages.dropdown import Dropdown
+from pages.form_filler import FormFiller
+from pages.locators import LocatorRegistry
+from pages.waits import EventWait, latched_selectors, outcome_appeared
+from utils.perf_metrics import perf_checkpoint, perf_transition
+from utils.trace_log import trace
+
+# Locators of the PIM pages, compiled and cached by the page's LocatorRegistry
+LOCATORS = {
+    "pim_menu": (By.XPATH, "//span[text()='PIM']"),
+    "add_employee_link": (By.XPATH, "//a[normalize-space()='Add Employee']"),
+    "first_name": (By.NAME, "firstName"),
+    "middle_name": (By.NAME, "middleName"),
+    "last_name": (By.NAME, "lastName"),
+    "employee_id": (By.XPATH, "//label[text()='Employee Id']/ancestor::div[contains(@class, 'oxd-input-group')]//input"),
+    "license_number": (By.XPATH, "//label[text()=\"Driver's License Number\"]/parent::div/following-sibling::div/input"),
+    "license_expiry": (By.XPATH, "//label[text()='License Expiry Date']/parent::div/following-sibling::div//input"),
+    "date_of_birth": (By.XPATH, "//label[text()='Date of Birth']/parent::div/following-sibling::div//input"),
+    "nationality": (By.CSS_SELECTOR, ".orangehrm-edit-employee-content .orangehrm-vertical-padding:nth-of-type(1) .oxd-grid-item--gutters:nth-of-type(1) [tabindex]"),
+    "marital_status": (By.CSS_SELECTOR, ".orangehrm-edit-employee-content .oxd-grid-item--gutters:nth-of-type(2) [tabindex]"),
+    "gender_male": (By.CSS_SELECTOR, ".--gender-grouped-field .oxd-input-field-bottom-space:nth-of-type(1) label"),
+    "gender_female": (By.CSS_SELECTOR, ".--gender-grouped-field .oxd-input-field-bottom-space:nth-of-type(2) label"),
+    "file_input": (By.XPATH, "//input[@type='file']"),
+    "submit_button": (By.XPATH, "//button[@type='submit']"),
+    "personal_details_save": (By.CSS_SELECTOR, ".orangehrm-edit-employee-content .orangehrm-vertical-padding:nth-of-type(1) .oxd-button--secondary"),
+    "first_row": (By.XPATH, "//div[@role='table']/div[2]/div[1]/div[1]"),
+    "first_row_id": (By.XPATH, "//div[@role='table']/div[2]/div[1]/div[1]/div[2]"),
+    # Checkbox of the table's first row group (the header row), which selects every listed employee
+    "select_all_checkbox": (By.XPATH, "//div[@role='table']/div[@role='rowgroup']/div[1]/div[1]/div[1]/div[1]/div[1]/label[1]"),
+    "delete_selected_button": (By.CSS_SELECTOR, ".oxd-button--label-danger"),
+    "confirm_delete_button": (By.CSS_SELECTOR, "button[class='oxd-button oxd-button--medium oxd-button--label-danger orangehrm-button-margin']"),
+}
+SUCCESS_TOAST_MESSAGE = ".oxd-toast-content--success .oxd-text--toast-message"
+ERROR_TOAST_MESSAGE = ".oxd-toast-content--error .oxd-text--toast-message"
+VALIDATION_MESSAGE = ".oxd-input-field-error-message"
+
+# Signals raced after saving or deleting: whichever appears first is the outcome of the action
+SAVE_OUTCOMES = {"success": SUCCESS_TOAST_MESSAGE, "error": ERROR_TOAST_MESSAGE, "validation": VALIDATION_MESSAGE}
+
+# Ticks the checkbox of every listed row whose Id cell is in arguments[0].
+# Returns {id: milliseconds spent selecting that row} for the rows found.
+_SELECT_ROWS_BY_ID_JS = """
+const wanted = new Set(arguments[0]);
+const timings = {};
+for (const row of document.querySelectorAll("div[role='table'] .oxd-table-card [role='row']")) {
+    const started = performance.now();
+    const cells = row.querySelectorAll("[role='cell']");
+    const employeeId = cells.length > 1 ? cells[1].innerText.trim() : null;
+    if (!wanted.has(employeeId)) continue;
+    const checkbox = cells[0].querySelector("input[type='checkbox']");
+    if (checkbox && !checkbox.checked) cells[0].querySelector("label").click();
+    timings[employeeId] = performance.now() - started;
+}
+return timings;
+"""
+
+# Reads the whole current page of the employee table in one call
+_READ_EMPLOYEE_PAGE_JS = """
+const rows = Array.from(
+    document.querySelectorAll("div[role='table'] .oxd-table-card [role='row']"),
+    row => Array.from(row.querySelectorAll("[role='cell']"), cell => cell.innerText.trim())
+);
+const selected = document.querySelector('.oxd-pagination-page-item--selected');
+const hasNext = Array.from(document.querySelectorAll('.oxd-pagination-page-item--previous-next'))
+    .some(button => button.querySelector('.bi-chevron-right'));
+return {rows: rows, page: selected ? parseInt(selected.innerText, 10) : 1, hasNext: hasNext};
+"""
+
+# Clicks the pagination button of page arguments[0], or the arrow towards it; returns false if there is none
+_GO_TO_PAGE_JS = """
+const target = arguments[0];
+const items = Array.from(document.querySelectorAll('.oxd-pagination-page-item'));
+const exact = items.find(item => item.innerText.trim() === String(target));
+if (exact) { exact.click(); return true; }
+const selected = document.querySelector('.oxd-pagination-page-item--selected');
+const current = selected ? parseInt(selected.innerText, 10) : 1;
+const arrow = target > current ? '.bi-chevron-right' : '.bi-chevron-left';
+const button = items.find(item => item.querySelector(arrow));
+if (!button) return false;
+button.click();
+return true;
+"""
+
+# Clicks the listed row whose Id cell equals arguments[0]
+_OPEN_ROW_BY_ID_JS = """
+for (const row of document.querySelectorAll("div[role='table'] .oxd-table-card [role='row']")) {
+    const cells = row.querySelectorAll("[role='cell']");
+    if (cells.length > 1 && cells[1].innerText.trim() === arguments[0]) { row.click(); return true; }
+}
+return false;
+"""
+
+# Keys of the employee table columns after the checkbox column
+EMPLOYEE_COLUMNS = [
+    "employee_id", "first_middle_name", "last_name", "job_title", "employment_status", "sub_unit", "supervisor",
+]
+
+class EmployeeIndex:
+    """In-memory map of the employee list: employee ID -> (page number, row)."""
+
+    def __init__(self):
+        self.rows = {}  # employee_id -> (page, row dict)
+        self.pages_read = set()
+        self.complete = False  # True once the last page has been read
+
+    def add_page(self, page, rows, has_next):
+        """Records the rows of one list page."""
+        for row in rows:
+            self.rows[row["employee_id"]] = (page, row)
+        self.pages_read.add(page)
+        if not has_next:
+            self.complete = True
+
+    def next_unread_page(self):
+        """Returns the first page that has not been read yet."""
+        page = 1
+        while page in self.pages_read:
+            page += 1
+        return page
+
 
 class PIMPage:
     """Page object for the PIM (Personnel Information Management) section."""
 
     def __init__(self, driver):
         self.driver = driver  # Store the driver instance
-        self.wait = WebDriverWait(driver, 20)  # Set up an explicit wait
+        self.wait = EventWait(driver, 20)  # Set up an explicit wait that wakes up on DOM changes
+        self.locators = LocatorRegistry(driver, self.wait, LOCATORS)  # Resolves and caches page elements
+        self.form_filler = FormFiller(driver, self.wait)  # Fills whole forms in one script call
+        self.nationality_dropdown = Dropdown(driver, self.wait, self.locators.locator("nationality"), "nationality")
+        self.marital_status_dropdown = Dropdown(driver, self.wait, self.locators.locator("marital_status"), "marital_status")
+        self.last_outcome = None  # "success", "error" or "validation" for the last toast or message read
+        self.employee_index = EmployeeIndex()  # Rows of the employee list read by this page object
 
     def navigate_to_pim(self):
         """Clicks on the PIM tab."""
-        print("Waiting for the PIM element to be clickable...")
-        pim_element = self.wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='PIM']")))  # Wait for PIM element
-        print("PIM element found, clicking...")
-        pim_element.click()  # Click on PIM tab
+        pim_element = self.locators.element("pim_menu", "clickable")  # Wait for PIM element
+        trace("pim.open_list")
+        with perf_transition(self.driver, "pim_list"):  # Records the load of the employee list when measuring performance
+            pim_element.click()  # Click on PIM tab
+        self.locators.invalidate()  # The employee list replaces the current page
+        self.invalidate_employee_index()  # The list is loaded again, with employees added elsewhere (e.g. the API)
 
     def click_add_employee(self):
         """Clicks on the 'Add Employee' link."""
-        print("Waiting for the 'Add Employee' link to be clickable...")
-        add_employee_link = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//a[normalize-space()='Add Employee']"))
-        )  # Wait for 'Add Employee' link
-        print("Add Employee tab located, attempting to click...")
+        add_employee_link = self.locators.element("add_employee_link", "clickable")  # Wait for 'Add Employee' link
+        trace("pim.open_add_employee")
         add_employee_link.click()  # Click on 'Add Employee'
+        self.locators.invalidate()
+
+    def _form_fields(self, **values):
+        """Maps locator names to their compiled locators, as expected by the form filler."""
+        return {self.locators.locator(name): value for name, value in values.items()}
 
     def enter_employee_details(self, first_name, middle_name, last_name, employee_id):
         """Fills in the employee details."""
-        print("Entering employee details...",first_name, middle_name, last_name, employee_id)
-
-        # Fill in first name
-        first_name_field = self.wait.until(EC.visibility_of_element_located((By.NAME, "firstName")))
-        first_name_field.clear()
-        first_name_field.send_keys(first_name)
-        print(f"Entered First Name: {first_name}")
-
-        # Fill in middle name
-        middle_name_field = self.wait.until(EC.visibility_of_element_located((By.NAME, "middleName")))
-        middle_name_field.clear()
-        middle_name_field.send_keys(middle_name)
-        print(f"Entered Middle Name: {middle_name}")
-
-        # Fill in last name
-        last_name_field = self.wait.until(EC.visibility_of_element_located((By.NAME, "lastName")))
-        last_name_field.clear()
-        last_name_field.send_keys(last_name)
-        print(f"Entered Last Name: {last_name}")
-
-        # Fill in employee ID
-        employee_id_field = self.wait.until(EC.visibility_of_element_located(
-            (By.XPATH, "//label[text()='Employee Id']/ancestor::div[contains(@class, 'oxd-input-group')]//input"))
-        )
-        employee_id_field.clear()
-        employee_id_field.send_keys(employee_id)
-        print(f"Entered Employee ID: {employee_id}")
+        # Wait for the form once, then fill all fields in a single round trip
+        self.locators.element("first_name")
+        results = self.form_filler.fill(self._form_fields(
+            first_name=first_name,
+            middle_name=middle_name,
+            last_name=last_name,
+            employee_id=str(employee_id),
+        ))
+        trace("pim.employee_details", first_name=first_name, middle_name=middle_name, last_name=last_name,
+              employee_id=employee_id, entered=list(results.values()))
 
     def upload_employee_image(self, image_path):
         """Uploads the employee's profile image."""
         # Specify the image path
-        file_input = self.wait.until(EC.presence_of_element_located(
-            (By.XPATH, "//input[@type='file']")))  # Adjusted to a more general selector
+        file_input = self.locators.element("file_input", "present")  # Adjusted to a more general selector
         file_input.send_keys(image_path)  # Upload the image using send_keys
-        print(f"Image uploaded from: {image_path}")
+        trace("pim.upload_image", path=image_path)
 
     def click_save(self):
         """Clicks the save button."""
-        print("Save button function called")
-        save_button = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']")))
+        save_button = self.locators.element("submit_button", "clickable")
+        perf_checkpoint(self.driver, "add_employee_form")  # The form as it was filled in, before saving
+        self.wait.arm(*latched_selectors(SAVE_OUTCOMES))  # Catch the toast even if it disappears quickly
         save_button.click()  # Click on the save button
-        print("Save button clicked")
+        self.locators.invalidate()  # Saving a new employee opens their details page
+        self.invalidate_employee_index()
+        trace("pim.save")
 
     def click_save2(self):
-        save_btn = self.wait.until(
-            EC.visibility_of_element_located(
-                (
-                    (By.CSS_SELECTOR,".orangehrm-edit-employee-content .orangehrm-vertical-padding:nth-of-type(1) .oxd-button--secondary")
-                )
-            )
-        )
+        save_btn = self.locators.element("personal_details_save")
+        self.wait.arm(*latched_selectors(SAVE_OUTCOMES))  # Catch the toast even if it disappears quickly
         save_btn.click()
+        self.invalidate_employee_index()
+
     def get_toast_message(self):
-        """Retrieves the success toast message after saving."""
-        print("Waiting for the success toast message to be visible...")
-        # Wait for the success toast to be visible using XPath
-        toast = self.wait.until(
-            EC.visibility_of_element_located((By.XPATH, "//div[contains(@class, 'oxd-toast-content--success')]")))
-        message = toast.find_element(By.XPATH, ".//p[contains(@class, 'oxd-text--p oxd-text--toast-message')]").text
-        print("Toast message is", message)
+        """Retrieves the message that follows a save or delete: the success toast, or the error shown instead.
+
+        Success and error toasts and field validation messages ("Required", "Employee Id
+        already exists") are raced, so a failed save is reported as soon as the application
+        shows why, instead of after the full timeout. The kind of outcome is kept in last_outcome.
+        """
+        # The page watcher reports the text as soon as one of the messages is added to the page
+        self.last_outcome, message = self.wait.until(outcome_appeared(SAVE_OUTCOMES))
+        if self.last_outcome == "success":
+            perf_checkpoint(self.driver, "save_toast")  # Includes the latency of the save request
+        trace("pim.outcome", outcome=self.last_outcome, message=message)
         return message  # Return the text of the toast message
 
     def select_first_employee(self):
         """Selects the first employee in the employee list."""
         try:
             # Wait until the employee list is visible
-            self.wait.until(
-                EC.visibility_of_element_located((By.XPATH, "//div[@role='table']/div[2]/div[1]/div[1]"))
-            )
-
-            # Locate the first employee's row using the provided XPath
-            first_employee_row = self.driver.find_element(By.XPATH, "//div[@role='table']/div[2]/div[1]/div[1]")
+            first_employee_row = self.locators.element("first_row")
 
             # Click on the first employee's row to open their details
             first_employee_row.click()
+            self.locators.invalidate()
 
-            print("Successfully selected the first employee.")
+            trace("pim.select_first_employee")
         except Exception as e:
-            print(f"Error selecting the first employee: {e}")
+            trace("pim.select_first_employee_failed", error=repr(e))
+
+    def search_employee_by_id(self, employee_id):
+        """Filters the employee list down to the employee with the given ID."""
+        employee_id_field = self.locators.element("employee_id")
+        employee_id_field.clear()
+        employee_id_field.send_keys(employee_id)
+
+        search_button = self.locators.element("submit_button", "clickable")
+        search_button.click()
+        self.locators.invalidate()  # The table rows are rendered again
+        self.invalidate_employee_index()  # The list is now filtered
+
+        # Wait until the first row of the filtered list shows the searched ID
+        self.wait.until(EC.text_to_be_present_in_element(self.locators.locator("first_row_id"), employee_id))
+        trace("pim.search", employee_id=employee_id)
 
     def clear_and_enter_text(self, locator_type, locator, text, field_name):
         """Clear existing text and enter new text."""
@@ -129,76 +256,49 @@ class PIMPage:
         if current_value != text:  # Only clear and enter if the current value is different
             field.clear()  # Clear the field before entering new text
             field.send_keys(text)
-            print(f"Entered '{text}' in {field_name}.")
+            trace("pim.field", field=field_name, value=text)
         else:
-            print(f"No change needed for {field_name}. Current value is already '{current_value}'.")
+            trace("pim.field_unchanged", field=field_name, value=current_value)
 
     def select_marital_status(self, status):
         """Select marital status from dropdown."""
-
-        marital_status_field = self.wait.until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, ".orangehrm-edit-employee-content .oxd-grid-item--gutters:nth-of-type(2) [tabindex]")
-            )
-        )
-        marital_status_field.click()
-
-        while marital_status_field.text != status:
-            marital_status_field.send_keys(Keys.ARROW_DOWN)
-        marital_status_field.send_keys(Keys.ENTER)
-        print(f"Selected marital status: '{status}'.")
+        self.marital_status_dropdown.select(status)  # Raises ValueError if the status is not an option
+        trace("pim.marital_status", status=status)
 
     def select_nationality(self, nationality):
         """Select nationality from dropdown."""
-
-        print(f"Selecting nationality: {nationality}")
-
-        # Wait for the nationality field to be visible and click it
-        nationality_field =self.wait.until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR,".orangehrm-edit-employee-content .orangehrm-vertical-padding:nth-of-type(1) .oxd-grid-item--gutters:nth-of-type(1) [tabindex]")
-            )
-        )
-        # (By.CSS_SELECTOR,".orangehrm-edit-employee-content .orangehrm-vertical-padding:nth-of-type(1) \.oxd-grid-item--gutters:nth-of-type(1) [tabindex]")
-
-        nationality_field.click()
-
-        while nationality_field.text != nationality:
-            nationality_field.send_keys(Keys.ARROW_DOWN)
-        nationality_field.send_keys(Keys.ENTER)
-
-        print(f"Nationality '{nationality}' selected.")
+        self.nationality_dropdown.select(nationality)  # Raises ValueError if the nationality is not an option
+        trace("pim.nationality", nationality=nationality)
 
     def select_gender(self, gender):
         """Select gender radio button."""
 
         if gender == 'male':
-            gender_option = self.wait.until(
-                EC.visibility_of_element_located(
-                    (By.CSS_SELECTOR, ".--gender-grouped-field .oxd-input-field-bottom-space:nth-of-type(1) label")
-                )
-            )
+            gender_option = self.locators.element("gender_male")
         else:
-            gender_option = self.wait.until(EC.visibility_of_element_located
-                      ((By.CSS_SELECTOR, ".--gender-grouped-field .oxd-input-field-bottom-space:nth-of-type(2) label")))
+            gender_option = self.locators.element("gender_female")
 
         gender_option.click()
 
-        print(f"Selected gender: '{gender}'.")
+        trace("pim.gender", gender=gender)
 
     def edit_employee_details(self, first_name, middle_name, last_name, employee_id, license_number, dob, nationality, marital_status, gender):
         """Edit employee details."""
-        # Enter employee full name
-        self.enter_employee_details(first_name, middle_name, last_name, employee_id)
-
-        # Enter license number
-        self.clear_and_enter_text(By.XPATH, "//label[text()=\"Driver's License Number\"]/parent::div/following-sibling::div/input", license_number, "Driver's License Number")
-
-        # Enter license expiry date (hardcoded value)
-        self.clear_and_enter_text(By.XPATH, "//label[text()='License Expiry Date']/parent::div/following-sibling::div//input", "2024-10-30", "License Expiry Date")
-
-        # Enter Date of Birth
-        self.clear_and_enter_text(By.XPATH, "//label[text()='Date of Birth']/parent::div/following-sibling::div//input", dob, "Date of Birth")
+        # The edit form is filled in asynchronously, so wait until the stored name has been loaded
+        first_name_field = self.locators.element("first_name")
+        self.wait.until(lambda driver: first_name_field.get_attribute("value"))
+
+        # Enter full name, employee ID, license number, license expiry date (hardcoded value) and date of birth
+        results = self.form_filler.fill(self._form_fields(
+            first_name=first_name,
+            middle_name=middle_name,
+            last_name=last_name,
+            employee_id=str(employee_id),
+            license_number=license_number,
+            license_expiry="2024-10-30",
+            date_of_birth=dob,
+        ))
+        trace("pim.edit_details", entered=list(results.values()))
 
         # Select marital status
         self.select_marital_status(marital_status)
@@ -210,23 +310,165 @@ class PIMPage:
         """Selects the employee checkbox and clicks the delete button."""
 
         # Wait for the checkbox to be visible and click it
-        checkbox = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH,
-                                        "//body/div[@id='app']/div[@class='oxd-layout orangehrm-upgrade-layout']/div[@class='oxd-layout-container']/div[@class='oxd-layout-context']/div[@class='orangehrm-background-container']/div[@class='orangehrm-paper-container']/div[@class='orangehrm-container']/div[@role='table']/div[@role='rowgroup']/div[1]/div[1]/div[1]/div[1]/div[1]/label[1]"))
-        )
+        checkbox = self.locators.element("select_all_checkbox", "clickable")
         if not checkbox.is_selected():
             checkbox.click()
-        print("Employee checkbox selected.")
+        trace("pim.select_all")
 
         # Wait for the delete button to be clickable and click it
-        delete_button = self.wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, ".oxd-button--label-danger"))
-        )
+        delete_button = self.locators.element("delete_selected_button", "clickable")
         delete_button.click()
-
-        print("Delete Selected button clicked.")
-        confirm_button =  self.wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[class='oxd-button oxd-button--medium oxd-button--label-danger orangehrm-button-margin']"))
-        )
+        trace("pim.delete_selected")
+        confirm_button = self.locators.element("confirm_delete_button", "clickable")
+        self.wait.arm(*latched_selectors(SAVE_OUTCOMES))  # Catch the toast even if it disappears quickly
         confirm_button.click()
-        print("Confirmed deletion.")
+        self.locators.invalidate()  # The list is reloaded without the deleted rows
+        self.invalidate_employee_index()
+        trace("pim.confirm_delete")
+
+    def delete_employees(self, employee_ids):
+        """Deletes the employees with the given IDs, with one multi-select and one confirmation per list page.
+
+        Args:
+            employee_ids: Employee IDs to delete, anywhere in the employee list.
+        Returns:
+            dict: Employee ID -> seconds spent on it (its share of the selection and of the
+            confirmation round trip of its page).
+        Raises:
+            ValueError: If an employee ID is not in the list.
+        """
+        remaining = [str(employee_id) for employee_id in employee_ids]
+        timings = {}
+        while remaining:
+            if self.find_employee(remaining[0]) is None:
+                raise ValueError(f"Employee not found in the list: {remaining[0]}")
+            self._go_to_page(self.employee_index.rows[remaining[0]][0])
+
+            selected = self.driver.execute_script(_SELECT_ROWS_BY_ID_JS, remaining)
+            if not selected:
+                raise ValueError(f"Employee not found on its list page: {remaining[0]}")
+            started = time.perf_counter()
+            self.locators.element("delete_selected_button", "clickable").click()
+            confirm_button = self.locators.element("confirm_delete_button", "clickable")
+            self.wait.arm(*latched_selectors(SAVE_OUTCOMES))  # Catch the toast even if it disappears quickly
+            confirm_button.click()
+            self.locators.invalidate()  # The list is reloaded without the deleted rows
+            self.invalidate_employee_index()
+            outcome, message = self.wait.until(outcome_appeared(SAVE_OUTCOMES))
+            if outcome != "success":
+                raise ValueError(f"Employees could not be deleted: {message}")
+            confirm_share = (time.perf_counter() - started) / len(selected)
+
+            for employee_id, milliseconds in selected.items():
+                timings[employee_id] = milliseconds / 1000 + confirm_share
+            remaining = [employee_id for employee_id in remaining if employee_id not in selected]
+
+        trace("pim.delete_employees", deleted=list(timings))
+        return timings
+
+    def add_employees(self, employees, image_path=None):
+        """Adds several employees one after another through the Add Employee form.
+
+        After each save the form is opened again through the 'Add Employee' link, a
+        client-side route change that reuses the loaded application instead of a page load.
+        Args:
+            employees: Dicts with first_name, middle_name, last_name and employee_id.
+            image_path: Optional profile picture uploaded for every employee.
+        Returns:
+            list: One dict per employee with its employee_id, outcome ("success", "error" or "validation",
+            see get_toast_message()), message (the toast, or the error shown instead) and seconds taken.
+        """
+        results = []
+        for index, employee in enumerate(employees):
+            started = time.perf_counter()
+            if index > 0 or "addEmployee" not in self.driver.current_url:
+                self.click_add_employee()
+            self.enter_employee_details(
+                employee["first_name"], employee["middle_name"], employee["last_name"], employee["employee_id"]
+            )
+            if image_path:
+                self.upload_employee_image(image_path)
+            self.click_save()
+            message = self.get_toast_message()
+            if self.last_outcome == "success":
+                self.wait.until(EC.url_contains("viewPersonalDetails"))  # Saved: the app opened the new employee
+            results.append({
+                "employee_id": str(employee["employee_id"]),
+                "outcome": self.last_outcome,
+                "message": message,
+                "seconds": time.perf_counter() - started,
+            })
+        trace("pim.add_employees", added=[result["employee_id"] for result in results if result["outcome"] == "success"])
+        return results
+
+    def invalidate_employee_index(self):
+        """Forgets the employee list index after the list has changed."""
+        self.employee_index = EmployeeIndex()
+
+    def read_employee_page(self):
+        """Reads every row of the current employee list page in one call.
+
+        Returns:
+            tuple: (page number, list of row dicts keyed by EMPLOYEE_COLUMNS, whether a next page exists)
+        """
+        self.locators.element("first_row")  # Wait for the list to be rendered
+        page = self.driver.execute_script(_READ_EMPLOYEE_PAGE_JS)
+        rows = [dict(zip(EMPLOYEE_COLUMNS, cells[1:])) for cells in page["rows"]]
+        self.employee_index.add_page(page["page"], rows, page["hasNext"])
+        return page["page"], rows, page["hasNext"]
+
+    def _go_to_page(self, page_number):
+        """Moves the employee list to the given page."""
+        current = self.driver.execute_script(_READ_EMPLOYEE_PAGE_JS)
+        while current["page"] != page_number:
+            first_row = current["rows"][0] if current["rows"] else None
+            if not self.driver.execute_script(_GO_TO_PAGE_JS, page_number):
+                raise ValueError(f"The employee list has no page {page_number}")
+            current = self.wait.until(self._other_page_rendered(first_row))
+            self.locators.invalidate()
+
+    @staticmethod
+    def _other_page_rendered(previous_first_row):
+        """Condition that returns the list state once rows other than the previous page's are shown."""
+        def _predicate(driver):
+            state = driver.execute_script(_READ_EMPLOYEE_PAGE_JS)
+            return state if state["rows"] and state["rows"][0] != previous_first_row else False
+
+        return _predicate
+
+    def iter_employee_pages(self):
+        """Lazily yields (page number, rows) for every page of the employee list, starting at page 1."""
+        page_number = 1
+        while True:
+            self._go_to_page(page_number)
+            page, rows, has_next = self.read_employee_page()
+            yield page, rows
+            if not has_next:
+                return
+            page_number += 1
+
+    def find_employee(self, employee_id):
+        """Returns the list row of the employee with the given ID, or None if it is not listed.
+
+        Rows come from the in-memory index; only pages not indexed yet are read, and
+        only until the employee is found.
+        """
+        employee_id = str(employee_id)
+        index = self.employee_index
+        while employee_id not in index.rows and not index.complete:
+            self._go_to_page(index.next_unread_page())
+            self.read_employee_page()
+            index = self.employee_index
+        entry = index.rows.get(employee_id)
+        return entry[1] if entry else None
+
+    def open_employee(self, employee_id):
+        """Opens the details page of the employee with the given ID."""
+        employee_id = str(employee_id)
+        if self.find_employee(employee_id) is None:
+            raise ValueError(f"Employee not found in the list: {employee_id}")
+        self._go_to_page(self.employee_index.rows[employee_id][0])
+        self.driver.execute_script(_OPEN_ROW_BY_ID_JS, employee_id)
+        self.locators.invalidate()
+        self.wait.until(EC.url_contains("viewPersonalDetails"))
+        trace("pim.open_employee", employee_id=employee_id)
@@ -0,0 +1,278 @@
+"""
+waits.py
+
+This module defines the EventWait class, a drop-in replacement for Selenium's
+WebDriverWait that wakes up as soon as the page changes instead of sleeping a
+fixed 0.5 seconds between checks.
+
+A small watcher is installed in the page: a MutationObserver that counts DOM
+changes and remembers the text of elements it was asked to look out for (for
+example toasts that only stay on screen for a moment). Between two checks of
+the condition, EventWait runs an async script that returns on the next DOM
+change, so a condition is usually seen true within milliseconds. When the
+watcher cannot be used (navigation in progress, scripts blocked), it falls
+back to polling with a short, growing interval.
+
+The conditions are the usual expected_conditions, or any callable taking the
+driver, exactly as with WebDriverWait. outcome_appeared() races several
+outcomes of an action (a success toast, an error toast, a validation message)
+and returns whichever shows up first, so a failed action is reported as soon
+as the application says so instead of after the full timeout.
+
+A time budget can be started for the current thread (one test): every wait
+then ends at the earlier of its own timeout and the end of the budget, so the
+waits late in a slow test get shorter.
+
+Usage:
+    wait = EventWait(driver, 10)
+    button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']")))
+    wait.arm(".oxd-toast-content--success .oxd-text--toast-message")
+    button.click()
+    message = wait.until(toast_appeared(".oxd-toast-content--success .oxd-text--toast-message"))
+
+    start_time_budget(60)
+    wait.arm(*latched_selectors(outcomes))
+    button.click()
+    outcome, text = wait.until(outcome_appeared(outcomes))
+"""
+import threading
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
+)
+
+from utils.steps import run_steps
+
+# Installs the watcher once per document
+_INSTALL_WATCHER_JS = """
+if (!window.__oxdWatch) {
+    const watch = {count: 0, listeners: new Set(), latches: {}, ignored: {}};
+    const checkLatches = () => {
+        for (const selector of Object.keys(watch.latches)) {
+            if (watch.latches[selector] !== null) continue;
+            const ignored = watch.ignored[selector];
+            const element = Array.from(document.querySelectorAll(selector)).find(node => !ignored || !ignored.has(node));
+            if (element) {
+                watch.latches[selector] = element.innerText.trim();
+                delete watch.ignored[selector];
+            }
+        }
+    };
+    watch.checkLatches = checkLatches;
+    new MutationObserver(() => {
+        watch.count++;
+        checkLatches();
+        for (const listener of Array.from(watch.listeners)) listener();
+    }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    window.__oxdWatch = watch;
+}
+"""
+
+# Returns the change counter as soon as it differs from arguments[0], or after arguments[1] ms
+WAIT_FOR_CHANGE_JS = _INSTALL_WATCHER_JS + """
+const [lastSeen, maxWait] = arguments;
+const done = arguments[arguments.length - 1];
+const watch = window.__oxdWatch;
+if (lastSeen !== null && watch.count !== lastSeen) return done(watch.count);
+const finish = () => { clearTimeout(timer); watch.listeners.delete(finish); done(watch.count); };
+const timer = setTimeout(finish, maxWait);
+watch.listeners.add(finish);
+"""
+
+# Starts remembering the text of the first element matching each selector in arguments[0] that is added
+# from now on; matching elements already on the page (e.g. the toast of the previous save) are ignored
+ARM_LATCH_JS = _INSTALL_WATCHER_JS + """
+const watch = window.__oxdWatch;
+for (const selector of arguments[0]) {
+    watch.latches[selector] = null;
+    watch.ignored[selector] = new Set(document.querySelectorAll(selector));
+}
+"""
+
+# Returns the remembered text for arguments[0] (arming the latch if needed) and forgets it once read
+_READ_LATCH_JS = _INSTALL_WATCHER_JS + """
+const watch = window.__oxdWatch;
+const selector = arguments[0];
+if (!(selector in watch.latches)) watch.latches[selector] = null;
+watch.checkLatches();
+const text = watch.latches[selector];
+if (text !== null) delete watch.latches[selector];
+return text;
+"""
+
+# Returns [name, text] of the first outcome in arguments[0] ([name, selector, shown] triples) whose element
+# has appeared, or, for a shown outcome, is visible now; then forgets all of them. null if there is none
+READ_OUTCOMES_JS = _INSTALL_WATCHER_JS + """
+const watch = window.__oxdWatch;
+const outcomes = arguments[0];
+for (const [name, selector, shown] of outcomes) {
+    if (!shown && !(selector in watch.latches)) watch.latches[selector] = null;
+}
+watch.checkLatches();
+const texts = outcomes.map(([name, selector, shown]) => {
+    if (!shown) return watch.latches[selector];
+    const element = Array.from(document.querySelectorAll(selector)).find(node => node.getClientRects().length > 0);
+    return element ? element.innerText.trim() : null;
+});
+const index = texts.findIndex(text => text !== null && text !== undefined);
+if (index < 0) return null;
+for (const [name, selector] of outcomes) {
+    delete watch.latches[selector];
+    delete watch.ignored[selector];
+}
+return [outcomes[index][0], texts[index]];
+"""
+
+# Outcomes whose element stays on screen while it applies, like a message under a field that the
+# application shows while the field is typed: they count whenever they are visible, even if they were
+# shown before the action, and are not armed
+SHOWN_OUTCOMES = ("validation",)
+
+# End of the time budget of the current thread's test, as time.monotonic() (unset or None without a budget)
+_budget = threading.local()
+
+
+def start_time_budget(seconds):
+    """Limits the waits of the current thread to a total of seconds from now; None removes the limit."""
+    _budget.deadline = time.monotonic() + seconds if seconds is not None else None
+
+
+def clear_time_budget():
+    """Removes the time budget of the current thread."""
+    _budget.deadline = None
+
+
+def budget_remaining():
+    """Returns the seconds left in the current thread's time budget, or None without a budget."""
+    deadline = getattr(_budget, "deadline", None)
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def toast_appeared(css_selector):
+    """Condition that returns the text of an element matching css_selector once it has appeared.
+
+    The text is remembered by the page watcher, so a toast that already
+    disappeared again is still reported if the selector was armed before.
+    """
+    def _predicate(driver):
+        text = driver.execute_script(_READ_LATCH_JS, css_selector)
+        return text if text is not None else False
+
+    return _predicate
+
+
+def latched_selectors(outcomes):
+    """Returns the selectors of the outcomes to arm before an action: all but the SHOWN_OUTCOMES."""
+    return [selector for name, selector in outcomes.items() if name not in SHOWN_OUTCOMES]
+
+
+def outcome_triples(outcomes):
+    """Returns the [name, selector, shown] triples READ_OUTCOMES_JS takes."""
+    return [[name, selector, name in SHOWN_OUTCOMES] for name, selector in outcomes.items()]
+
+
+def outcome_appeared(outcomes):
+    """Condition that returns (name, text) for the first of several outcomes whose element has appeared.
+
+    Args:
+        outcomes: Outcome name -> CSS selector of the element that signals it, e.g.
+            {"success": success_toast, "error": error_toast, "validation": field_error}.
+    The elements are remembered by the page watcher like toasts (arm the
+    latched_selectors() before the action). A SHOWN_OUTCOMES element counts
+    whenever it is visible, so a validation message shown while the form was
+    filled in is the outcome of saving it. While the page is being replaced, for
+    example after submitting a form, the condition is simply false.
+    """
+    pairs = outcome_triples(outcomes)
+    return lambda driver: run_steps(outcome_steps(driver, pairs))
+
+
+def outcome_steps(driver, pairs):
+    """Flow reading the outcome_triples() pairs once; shared with the async page objects."""
+    try:
+        found = yield driver.execute_script(READ_OUTCOMES_JS, pairs)
+    except WebDriverException:
+        return False  # No document to look at yet
+    return tuple(found) if found else False
+
+
+class EventWait:
+    """Waits for a condition, re-checking it whenever the DOM changes."""
+
+    def __init__(self, driver, timeout, poll_frequency=0.5, idle_recheck=0.2,
+                 ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)):
+        """Initializes the EventWait.
+        Args:
+            driver: A Selenium WebDriver instance.
+            timeout: Seconds before a TimeoutException is raised.
+            poll_frequency: Longest sleep between checks when falling back to polling.
+            idle_recheck: Seconds after which the condition is checked again even without DOM changes
+                (for changes a MutationObserver cannot see, such as CSS transitions or the URL).
+            ignored_exceptions: Exceptions raised by the condition that count as "not yet".
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.idle_recheck = idle_recheck
+        self.ignored_exceptions = tuple(ignored_exceptions)
+
+    _sleep = staticmethod(time.sleep)
+
+    def arm(self, *css_selectors):
+        """Starts remembering the text of the next element matching each css_selector (e.g. a toast).
+
+        Matching elements already on the page when the selectors are armed, such as the
+        toast of the previous save that is still fading out, are not taken for the next one.
+        """
+        return run_steps(self._arm_steps(css_selectors))
+
+    def _arm_steps(self, css_selectors):
+        try:
+            yield self.driver.execute_script(ARM_LATCH_JS, list(css_selectors))
+        except WebDriverException:
+            pass  # toast_appeared still finds the element if it is on screen when checked
+
+    def _until(self, condition, message, expect_true):
+        return run_steps(self._wait_steps(condition, message, expect_true))
+
+    def _wait_steps(self, condition, message, expect_true):
+        """Flow of the wait loop, shared with AsyncEventWait: every driver call and sleep is a step."""
+        timeout = self.timeout
+        budget = budget_remaining()
+        if budget is not None and budget < timeout:
+            timeout = max(budget, 0.0)  # The test's time budget ends first
+            message = f"{message} (test time budget exhausted)".strip()
+        end_time = time.monotonic() + timeout
+        last_seen = None
+        fallback_sleep = 0.05
+        while True:
+            error = None
+            try:
+                value = yield condition(self.driver)
+            except self.ignored_exceptions as e:
+                value, error = False, e
+            if expect_true and value:
+                return value
+            if not expect_true and (not value or error is not None):
+                return True
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message, getattr(error, "screen", None), getattr(error, "stacktrace", None))
+            try:
+                max_wait_ms = int(min(remaining, self.idle_recheck) * 1000)
+                last_seen = yield self.driver.execute_async_script(WAIT_FOR_CHANGE_JS, last_seen, max_wait_ms)
+                fallback_sleep = 0.05
+            except WebDriverException:
+                # Page is navigating or scripts are not allowed: poll adaptively instead
+                last_seen = None
+                yield self._sleep(min(fallback_sleep, remaining))
+                fallback_sleep = min(fallback_sleep * 2, self.poll_frequency)
+
+    def until(self, method, message=""):
+        """Waits until method(driver) returns a truthy value and returns that value."""
+        return self._until(method, message, expect_true=True)
+
+    def until_not(self, method, message=""):
+        """Waits until method(driver) returns a falsy value."""
+        return self._until(method, message, expect_true=False)
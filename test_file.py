@@ -8,7 +8,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
 # Path to the employee image
-image_path = r"C:\PycharmProjects\Guvi_project1\data\profileimage.jpeg"
+image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "profileimage.jpeg")
 
 # Setup Chrome WebDriver using ChromeDriverManager
 driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
@@ -0,0 +1,676 @@
+"""
+conftest.py
+
+This module contains the shared pytest fixtures for the Orange HRM test suite.
+It keeps a pool of pre-started headless Chrome drivers that tests lease
+from, and a session-level authentication layer, so tests that only need a
+logged-in browser do not go through the login form again.
+
+Usage:
+    Request the `driver` fixture for a clean browser on the login page, or the
+    `logged_in_driver` fixture for a browser that is already on the dashboard.
+    The pool is configured with --pool-size, --pool-max-uses and --headed.
+
+    To run in parallel, install pytest-xdist and run `pytest tests -n auto`.
+    Tests are ordered longest-first from the durations of earlier runs, and
+    tests that edit or delete employees only touch the ones their own worker
+    created (tagged with the worker namespace). Those employees are created
+    through the REST API by `employee_api`, which deletes everything the
+    worker created when the session ends.
+
+    With --instrument, every page-object action is timed (wait, WebDriver
+    command and think time, round trips); the breakdown is added to each test
+    of the pytest-html report and written as JSON to reports/.
+
+    With --perf, browser-side metrics (Navigation/Resource Timing, long tasks,
+    CDP metrics, XHR latencies) are recorded at the page transitions and key
+    actions of the page objects. Each run is stored under reports/perf/runs/
+    and compared with reports/perf/baseline.json; latencies that regressed by
+    more than --perf-threshold fail the session.
+
+    The suite runs against the public demo by default. --app-url points it at
+    another deployment, and --stand-in starts a local stand-in server per
+    worker (utils/stand_in_server.py), so it runs offline and reproducibly.
+
+    --network-profile makes the browsers block fonts, avatars, media and
+    third-party requests (plus images with "minimal", and any --block pattern),
+    and --browser-cache keeps their disk caches between drivers and runs. The
+    requests and bytes each test saved are listed in the terminal summary.
+
+    --time-budget (or the time_budget marker of a test) caps the total time a
+    test may spend waiting: each wait ends at the earlier of its own timeout
+    and the end of the budget, so a failing test stops early.
+
+    With --impact, the page-object methods, locators, data files and fixtures
+    each test uses are recorded in .pytest_cache, and the next --impact run
+    only runs the tests affected by what changed since (plus new tests and
+    those that failed). --impact-all runs every test and refreshes the map.
+
+    Tests upload the sample picture data/profileimage.jpeg through the
+    `profile_image` fixture, or generated pictures of a given size and format
+    through `upload_image`. --upload-benchmark runs test_upload_benchmark,
+    which times the upload and the save of every size and format up to the
+    1 MiB limit; the medians are listed in the terminal summary and written
+    to --upload-benchmark-json.
+
+    The page objects trace their steps into an in-memory buffer that keeps the
+    last --trace-events events of each test. Only when a test fails is its
+    buffer written, with passwords and other secrets redacted, to
+    reports/traces/<worker>.jsonl; passing tests write nothing.
+"""
+import json
+import os
+import shutil
+import time
+import warnings
+from collections import Counter
+
+import pytest
+
+from data.data_generators import generate_random_name, generate_random_employee_id
+from data.data_providers import first_row, iter_params
+from data.image_generator import image_file, profile_image_path
+from pages.locators import count_stats as count_locator_stats
+from pages.login_page import LoginPage
+from pages.pim_page import PIMPage
+from pages.waits import clear_time_budget, start_time_budget
+from utils.api_client import OrangeHRMApi
+from utils.auth_session import AuthSession
+from utils.driver_pool import DriverPool
+from utils.impact import IMPACT_CACHE_KEY, Fingerprints, ImpactTracer, select_affected, update_map
+from utils.instrumentation import Instrumentation
+from utils.network_profile import PROFILES as NETWORK_PROFILES, NetworkProfile
+from utils import perf_metrics
+from utils.screenshots import MODES as SCREENSHOT_MODES, ScreenshotWriter
+from utils import trace_log
+from utils.stand_in_server import StandInServer
+from utils.parallel import (
+    DURATIONS_CACHE_KEY, longest_first, merge_durations, worker_id, worker_namespace as current_namespace
+)
+
+# Set up the source URL for the application
+src_url = "https://opensource-demo.orangehrmlive.com/"
+
+# Root of the project, the folder that holds pages/, data/, utils/ and tests/
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Key under which the session's driver pool is kept on the pytest config
+DRIVER_POOL_KEY = pytest.StashKey()
+
+# Key under which the action timings are kept on the pytest config (only set with --instrument)
+INSTRUMENTATION_KEY = pytest.StashKey()
+
+# Key under which the browser performance recorder is kept on the pytest config (only set with --perf)
+PERF_RECORDER_KEY = pytest.StashKey()
+
+# Key under which the latency regressions of this run are kept for the terminal summary
+PERF_REGRESSIONS_KEY = pytest.StashKey()
+
+# Key under which the network profile is kept on the pytest config (only set with --network-profile or --browser-cache)
+NETWORK_PROFILE_KEY = pytest.StashKey()
+
+# Key under which the step trace log is kept on the pytest config (unless --trace-events is 0)
+TRACE_LOG_KEY = pytest.StashKey()
+
+# Key under which the call tracer is kept on the pytest config (only set with --impact)
+IMPACT_TRACER_KEY = pytest.StashKey()
+
+# Key under which the counts of the impact-based selection are kept for the terminal summary
+IMPACT_SELECTION_KEY = pytest.StashKey()
+
+# Page objects whose public methods are timed with --instrument
+INSTRUMENTED_PAGES = (LoginPage, PIMPage)
+
+# Seconds spent in setup, call and teardown of each test during this run
+_test_durations = {}
+
+# Traffic saved by the network profile, per test
+_network_savings = {}
+
+# Element cache hits, misses and stale re-resolutions of the tests with a browser
+_locator_stats = Counter()
+
+# Median upload and save times of each picture, with --upload-benchmark
+_upload_timings = []
+
+# Trace files written for the failed tests
+_trace_files = {}
+
+# Dependencies recorded with --impact, per test, and the tests that failed
+_impact_dependencies = {}
+_failed_tests = set()
+
+
+def pytest_addoption(parser):
+    """Registers the command line options of the suite, one group per feature (application, driver pool, waits, ...)."""
+    group = parser.getgroup("application")
+    group.addoption("--app-url", default=src_url, help="Root URL of the Orange HRM deployment under test.")
+    group.addoption("--stand-in", action="store_true",
+                    help="Start a local stand-in server for each worker and test against it instead of --app-url.")
+    group.addoption("--stand-in-latency", type=float, default=0.0,
+                    help="Seconds of latency the stand-in server adds to every response.")
+
+    group = parser.getgroup("driver pool")
+    group.addoption("--pool-size", type=int, default=1, help="Number of pre-started Chrome drivers.")
+    group.addoption("--pool-max-uses", type=int, default=25, help="Leases after which a driver is replaced.")
+    group.addoption("--headed", action="store_true", help="Run Chrome with a visible window.")
+
+    group = parser.getgroup("network")
+    group.addoption("--network-profile", choices=sorted(NETWORK_PROFILES), default="off",
+                    help="Resource classes the browsers block: lean (fonts, avatars, media, third parties) "
+                         "or minimal (also images).")
+    group.addoption("--block", action="append", default=[], metavar="CLASS_OR_PATTERN",
+                    help="Also block a resource class or URL pattern (e.g. '*/dist/img/*'); repeatable.")
+    group.addoption("--browser-cache", default=None, metavar="DIR",
+                    help="Keep the browser disk caches in this folder, shared by the drivers and later runs.")
+
+    group = parser.getgroup("waits")
+    group.addoption("--time-budget", type=float, default=None, metavar="SECONDS",
+                    help="Seconds each test may take, from setup on; later waits are shortened to fit.")
+
+    group = parser.getgroup("impact")
+    group.addoption("--impact", action="store_true",
+                    help="Only run the tests affected by changes since their last run, and record what each test uses.")
+    group.addoption("--impact-all", action="store_true",
+                    help="With --impact, run every test anyway and refresh the recorded dependencies.")
+
+    group = parser.getgroup("test data")
+    group.addoption("--data-limit", type=int, default=None,
+                    help="Use at most this many rows of each data file in data_rows tests.")
+
+    group = parser.getgroup("images")
+    group.addoption("--upload-benchmark", action="store_true",
+                    help="Run the upload benchmark: upload and save time per profile picture size and format.")
+    group.addoption("--upload-rounds", type=int, default=3,
+                    help="Employees added per picture size and format in the upload benchmark.")
+    group.addoption("--upload-benchmark-json", default="reports/upload_benchmark.json",
+                    help="File the upload benchmark results are written to.")
+
+    group = parser.getgroup("screenshots")
+    group.addoption("--screenshots", choices=SCREENSHOT_MODES, default="always",
+                    help="Save screenshots always, only for failed tests, or never.")
+    group.addoption("--screenshot-quality", type=int, default=None,
+                    help="Store screenshots as JPEG with this quality (needs Pillow).")
+
+    group = parser.getgroup("trace")
+    group.addoption("--trace-events", type=int, default=200,
+                    help="Page-object steps kept in memory per test and written only if it fails; 0 turns tracing off.")
+    group.addoption("--trace-dir", default="reports/traces", help="Folder of the trace files of the failed tests.")
+
+    group = parser.getgroup("instrumentation")
+    group.addoption("--instrument", action="store_true",
+                    help="Time every page-object action and split it into wait, command and think time.")
+    group.addoption("--instrument-json", default="reports/action_timings_{worker}.json",
+                    help="File the action timings are written to; {worker} is replaced by the worker id.")
+
+    group = parser.getgroup("browser performance")
+    group.addoption("--perf", action="store_true",
+                    help="Record browser performance metrics at page transitions and compare them with the baseline.")
+    group.addoption("--perf-dir", default="reports/perf", help="Folder of the performance runs and baseline.")
+    group.addoption("--perf-threshold", type=float, default=0.2,
+                    help="Relative slowdown of a latency (0.2 = 20%%) reported as a regression.")
+    group.addoption("--perf-update-baseline", action="store_true",
+                    help="Store the metrics of this run as the new baseline instead of comparing.")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Keeps the report of each test phase on the item, so fixtures can see whether the test failed.
+
+    After the teardown, the trace of a failed test is written; that of a passed test is dropped.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+    log = item.config.stash.get(TRACE_LOG_KEY, None)
+    if log is not None and report.when == "teardown":
+        if any(getattr(item, f"rep_{when}", report).failed for when in ("setup", "call", "teardown")):
+            path = os.path.join(item.config.getoption("--trace-dir"), f"{worker_id()}.jsonl")
+            report.user_properties.append(("trace", log.flush(path)))
+        else:
+            log.discard()
+    tracer = item.config.stash.get(IMPACT_TRACER_KEY, None)
+    if tracer is not None and report.when == "teardown":
+        dependencies = tracer.finish_test(item.fixturenames)
+        call = getattr(item, "rep_call", None)
+        ran = call is not None and not call.skipped  # Skipped in setup or in the test: what it uses is unknown
+        report.user_properties.append(("impact", dependencies if ran else None))
+    instrumentation = item.config.stash.get(INSTRUMENTATION_KEY, None)
+    if instrumentation is not None and report.when == "call":
+        table = instrumentation.html_table(item.nodeid)
+        if table and item.config.pluginmanager.hasplugin("html"):
+            import pytest_html.extras
+            report.extras = getattr(report, "extras", []) + [pytest_html.extras.html(table)]
+
+
+def pytest_configure(config):
+    """Registers the markers of the suite."""
+    config.addinivalue_line(
+        "markers",
+        "data_rows(name, id_field=None, limit=None, **filters): "
+        "run the test once per matching row of the CSV file data/<name>, passed as the `row` fixture",
+    )
+    config.addinivalue_line(
+        "markers", "time_budget(seconds): seconds the test may take, overriding --time-budget",
+    )
+    config.addinivalue_line("markers", "upload_benchmark: only runs with --upload-benchmark")
+    if config.getoption("--instrument"):
+        instrumentation = Instrumentation()
+        instrumentation.enable(INSTRUMENTED_PAGES)
+        config.stash[INSTRUMENTATION_KEY] = instrumentation
+    if config.getoption("--perf"):
+        if not hasattr(config, "workerinput"):
+            # The controlling process starts the run with an empty folder for the workers' samples
+            shutil.rmtree(os.path.join(config.getoption("--perf-dir"), "current"), ignore_errors=True)
+        recorder = perf_metrics.PerfRecorder()
+        perf_metrics.activate(recorder)
+        config.stash[PERF_RECORDER_KEY] = recorder
+    if config.getoption("--trace-events") > 0:
+        if not hasattr(config, "workerinput"):
+            # The controlling process starts the run with an empty folder for the workers' traces
+            shutil.rmtree(config.getoption("--trace-dir"), ignore_errors=True)
+        log = trace_log.TraceLog(config.getoption("--trace-events"))
+        trace_log.activate(log)
+        config.stash[TRACE_LOG_KEY] = log
+    if config.getoption("--impact"):
+        tracer = ImpactTracer(PROJECT_ROOT)
+        tracer.start()
+        config.stash[IMPACT_TRACER_KEY] = tracer
+    block = list(NETWORK_PROFILES[config.getoption("--network-profile")]) + config.getoption("--block")
+    if block or config.getoption("--browser-cache"):
+        config.stash[NETWORK_PROFILE_KEY] = NetworkProfile(block, config.getoption("--browser-cache"))
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrizes data_rows tests with references to the rows of their data file.
+
+    The file is streamed once at collection; each row is only read again when its test runs.
+    """
+    marker = metafunc.definition.get_closest_marker("data_rows")
+    if marker is None:
+        return
+    options = dict(marker.kwargs)
+    limit = options.pop("limit", None) or metafunc.config.getoption("--data-limit")
+    metafunc.parametrize("row", list(iter_params(marker.args[0], limit=limit, **options)), indirect=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselects the tests no change affects (with --impact), and schedules the slowest tests first so parallel workers finish at about the same time."""
+    cache = getattr(config, "cache", None)  # None with -p no:cacheprovider
+    if config.getoption("--impact") and cache is not None:
+        impact_map = cache.get(IMPACT_CACHE_KEY, {})
+        selected, deselected, changed = select_affected(items, impact_map, Fingerprints(PROJECT_ROOT))
+        if config.getoption("--impact-all"):
+            selected, deselected = items, []
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        config.stash[IMPACT_SELECTION_KEY] = (len(selected), len(selected) + len(deselected), changed)
+    durations = cache.get(DURATIONS_CACHE_KEY, {}) if cache is not None else {}
+    items[:] = longest_first(items, durations)
+
+
+def pytest_runtest_setup(item):
+    """Starts the time budget of the test, and attributes the page-object actions, trace events and performance samples that follow to it."""
+    if item.get_closest_marker("upload_benchmark") and not item.config.getoption("--upload-benchmark"):
+        pytest.skip("upload benchmark, run with --upload-benchmark")
+    marker = item.get_closest_marker("time_budget")
+    start_time_budget(marker.args[0] if marker else item.config.getoption("--time-budget"))
+    instrumentation = item.config.stash.get(INSTRUMENTATION_KEY, None)
+    if instrumentation is not None:
+        instrumentation.start_test(item.nodeid)
+    recorder = item.config.stash.get(PERF_RECORDER_KEY, None)
+    if recorder is not None:
+        recorder.start_test(item.nodeid)
+    log = item.config.stash.get(TRACE_LOG_KEY, None)
+    if log is not None:
+        log.start_test(item.nodeid)
+    tracer = item.config.stash.get(IMPACT_TRACER_KEY, None)
+    if tracer is not None:
+        tracer.start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Records what each fixture uses while it is set up, so every test that uses the fixture depends on it."""
+    tracer = request.config.stash.get(IMPACT_TRACER_KEY, None)
+    if tracer is not None:
+        tracer.start_fixture()
+    yield
+    if tracer is not None:
+        tracer.finish_fixture(fixturedef.argname)
+
+
+def pytest_runtest_teardown(item):
+    """Ends the time budget of the test, so fixture teardown is not cut short."""
+    clear_time_budget()
+
+
+def pytest_runtest_logreport(report):
+    """Adds up the duration of every phase of a test, and keeps the traffic its network profile saved, the dependencies it used and its trace file."""
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+    if report.failed:
+        _failed_tests.add(report.nodeid)
+    for name, value in report.user_properties:
+        if name == "network" and value is not None:
+            _network_savings[report.nodeid] = value
+        elif name == "locators":
+            _locator_stats.update(value)
+        elif name == "upload":
+            _upload_timings.append(value)
+        elif name == "impact":
+            _impact_dependencies[report.nodeid] = value
+        elif name == "trace" and value is not None:
+            _trace_files[report.nodeid] = value
+
+
+def pytest_sessionfinish(session):
+    """Writes the action timings and the upload benchmark, and records the durations and dependencies of this run for the next one."""
+    config = session.config
+    instrumentation = config.stash.get(INSTRUMENTATION_KEY, None)
+    if instrumentation is not None:
+        instrumentation.disable()
+        if instrumentation.records:
+            instrumentation.write_json(config.getoption("--instrument-json").format(worker=worker_id()))
+    if config.stash.get(PERF_RECORDER_KEY, None) is not None:
+        _finish_perf_run(session)
+    profile = config.stash.get(NETWORK_PROFILE_KEY, None)
+    if profile is not None:
+        profile.save_sizes()
+    if config.stash.get(TRACE_LOG_KEY, None) is not None:
+        trace_log.deactivate()
+    tracer = config.stash.get(IMPACT_TRACER_KEY, None)
+    if tracer is not None:
+        tracer.stop()
+    if hasattr(config, "workerinput"):
+        return  # Only the controlling process writes the cache and the upload benchmark
+    if _upload_timings:
+        path = config.getoption("--upload-benchmark-json")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as json_file:
+            json.dump(sorted(_upload_timings, key=lambda timing: (timing["format"], timing["size"])), json_file, indent=2)
+    cache = getattr(config, "cache", None)  # None with -p no:cacheprovider
+    if cache is None:
+        return
+    if tracer is not None and _impact_dependencies:
+        runs = {nodeid: (dependencies, nodeid in _failed_tests) for nodeid, dependencies in _impact_dependencies.items()}
+        impact_map = cache.get(IMPACT_CACHE_KEY, {})
+        cache.set(IMPACT_CACHE_KEY, update_map(impact_map, runs, Fingerprints(PROJECT_ROOT)))
+    if not _test_durations:
+        return
+    durations = cache.get(DURATIONS_CACHE_KEY, {})
+    cache.set(DURATIONS_CACHE_KEY, merge_durations(durations, _test_durations))
+
+
+def _finish_perf_run(session):
+    """Stores this worker's performance samples; the controlling process then compares the run with the baseline."""
+    config = session.config
+    perf_dir = config.getoption("--perf-dir")
+    perf_metrics.deactivate()
+    current_dir = os.path.join(perf_dir, "current")
+    recorder = config.stash[PERF_RECORDER_KEY]
+    if recorder.samples:
+        recorder.write_json(os.path.join(current_dir, f"{worker_id()}.json"))
+    if hasattr(config, "workerinput"):
+        return  # Workers only store their samples
+    summary = perf_metrics.summarize(perf_metrics.load_samples(current_dir))
+    if not summary:
+        return
+    perf_metrics.write_summary(os.path.join(perf_dir, "runs", f"{time.strftime('%Y%m%d-%H%M%S')}.json"), summary)
+    baseline_path = os.path.join(perf_dir, "baseline.json")
+    baseline = perf_metrics.load_summary(baseline_path)
+    if baseline is None or config.getoption("--perf-update-baseline"):
+        perf_metrics.write_summary(baseline_path, summary)
+        return
+    regressions = perf_metrics.compare(baseline, summary, threshold=config.getoption("--perf-threshold"))
+    config.stash[PERF_REGRESSIONS_KEY] = regressions
+    if regressions and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Prints the impact-based selection, the trace files of failed tests, the upload benchmark, the element cache counts, the action timings, the latency regressions, the traffic saved per test, and the lease wait times and recycle counts of the driver pool."""
+    selection = config.stash.get(IMPACT_SELECTION_KEY, None)
+    if selection is not None:
+        selected, total, changed = selection
+        terminalreporter.write_sep("-", "impact selection")
+        terminalreporter.write_line(f"ran {selected} of {total} tests, changed dependencies: {len(changed)}")
+        for key in changed:
+            terminalreporter.write_line(f"  {key}")
+    if _trace_files:
+        terminalreporter.write_sep("-", "page-object traces of failed tests")
+        for nodeid, path in _trace_files.items():
+            terminalreporter.write_line(f"{nodeid}: {path}")
+    if _locator_stats:
+        terminalreporter.write_sep("-", "locator cache")
+        terminalreporter.write_line(
+            f"hits: {_locator_stats['hits']}, misses: {_locator_stats['misses']}, "
+            f"stale re-resolutions: {_locator_stats['stale']}"
+        )
+    instrumentation = config.stash.get(INSTRUMENTATION_KEY, None)
+    if instrumentation is not None and instrumentation.records:
+        terminalreporter.write_sep("-", "page-object actions")
+        for action, stats in instrumentation.summary().items():
+            terminalreporter.write_line(
+                f"{action}: n={stats['count']}, p50: {stats['p50']:.3f}s, p95: {stats['p95']:.3f}s, "
+                f"p99: {stats['p99']:.3f}s, wait/command/think: {stats['wait']:.2f}/{stats['command']:.2f}/"
+                f"{stats['think']:.2f}s, round trips: {stats['round_trips']}"
+            )
+    regressions = config.stash.get(PERF_REGRESSIONS_KEY, None)
+    if regressions is not None:
+        terminalreporter.write_sep("-", f"browser performance: {len(regressions)} regression(s)")
+        for regression in regressions:
+            terminalreporter.write_line(
+                f"{regression['metric']}: {regression['baseline']:.0f}ms -> {regression['current']:.0f}ms "
+                f"(+{regression['change']:.0%})", red=True
+            )
+    if _upload_timings:
+        terminalreporter.write_sep("-", "upload benchmark (median per employee)")
+        for timing in sorted(_upload_timings, key=lambda timing: (timing["format"], timing["size"])):
+            terminalreporter.write_line(
+                f"{timing['format']:<5}{timing['size'] / 1024:>7.0f} KiB: upload {timing['upload']:.3f}s, "
+                f"save {timing['save']:.3f}s ({timing['rounds']} rounds)"
+            )
+    if _network_savings:
+        terminalreporter.write_sep("-", "network profile")
+        for nodeid, traffic in _network_savings.items():
+            terminalreporter.write_line(
+                f"{nodeid}: {traffic['requests']} requests ({traffic['bytes'] / 1024:.0f} KiB), "
+                f"saved: {traffic['blocked']} blocked, {traffic['cached']} from cache, "
+                f"{traffic['bytes_saved'] / 1024:.0f} KiB"
+            )
+    pool = config.stash.get(DRIVER_POOL_KEY, None)
+    if pool is None:
+        return
+    stats = pool.stats()
+    terminalreporter.write_sep("-", "driver pool")
+    terminalreporter.write_line(
+        f"leases: {stats['leases']}, lease wait mean: {stats['lease_wait_mean']:.3f}s, "
+        f"max: {stats['lease_wait_max']:.3f}s, total: {stats['lease_wait_total']:.3f}s"
+    )
+    terminalreporter.write_line(
+        f"recycled after max uses: {stats['recycled_max_uses']}, recycled after crash: {stats['recycled_crash']}, "
+        f"failed starts: {stats['launch_failures']}"
+    )
+
+
+@pytest.fixture(scope="function")
+def row(request):
+    """Returns the data row a data_rows test runs with."""
+    return request.param.load()
+
+
+@pytest.fixture(scope="session")
+def app_url(request):
+    """Returns the root URL of the application, starting this worker's stand-in server with --stand-in."""
+    config = request.config
+    if not config.getoption("--stand-in"):
+        yield config.getoption("--app-url")
+        return
+    with StandInServer(latency=config.getoption("--stand-in-latency")) as server:
+        yield server.url
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, app_url):
+    """Starts the pool of headless Chrome drivers once per worker."""
+    config = request.config
+    headless = not config.getoption("--headed")
+    profile = config.stash.get(NETWORK_PROFILE_KEY, None)
+    pool = DriverPool(
+        app_url,
+        size=config.getoption("--pool-size"),
+        max_uses=config.getoption("--pool-max-uses"),
+        headless=headless,
+        driver_factory=profile.driver_factory(headless) if profile is not None else None,
+    )
+    config.stash[DRIVER_POOL_KEY] = pool
+    pool.start()  # Launch all browsers before the first test needs one
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
+    """Leases a clean Chrome driver on the source URL for one test, counting the element cache use of its page objects.
+
+    Replacement drivers that could not be started since the last lease are reported as warnings of the test.
+    """
+    profile = request.config.stash.get(NETWORK_PROFILE_KEY, None)
+    locator_stats = Counter()
+    count_locator_stats(locator_stats)
+    try:
+        with driver_pool.lease() as driver:  # The pool resets or replaces the driver after the test
+            for error in driver_pool.pop_launch_errors():
+                warnings.warn(f"A replacement pooled driver could not be started: {error!r}", RuntimeWarning)
+            if profile is not None:
+                profile.start_test(driver)
+            yield driver
+            if profile is not None:
+                request.node.user_properties.append(("network", profile.collect(driver)))
+    finally:
+        count_locator_stats(None)
+        request.node.user_properties.append(("locators", dict(locator_stats)))
+
+
+@pytest.fixture(scope="session")
+def auth_session(app_url):
+    """Creates the authenticated session shared by all tests of this worker.
+
+    The real login only happens the first time the session is applied to a driver.
+    """
+    valid_data = first_row("login_data.csv", expected="pass")  # Get valid data
+    return AuthSession(app_url, valid_data['username'], valid_data['password'])
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, auth_session):
+    """Returns a driver that is already logged in and on the dashboard."""
+    auth_session.apply(driver)  # Inject the stored session, logging in again only if it expired
+    return driver
+
+
+@pytest.fixture(scope="session")
+def worker_namespace():
+    """Returns the tag that marks the employees created by this worker."""
+    return current_namespace()
+
+
+@pytest.fixture(scope="session")
+def employee_api(auth_session):
+    """Returns the API client used to seed employees, and deletes everything it created at the end.
+
+    The client reuses the cookies of the worker's authenticated session, if a browser has
+    logged in already; otherwise, and whenever the session expires, it logs in through the
+    login endpoint itself, so it never waits for a driver of the pool.
+    """
+    api = OrangeHRMApi.from_auth_session(auth_session)
+    if not auth_session.has_state():
+        api.login(auth_session.username, auth_session.password)
+    yield api
+    api.cleanup()  # Remove every employee this worker created
+    api.close()
+
+
+@pytest.fixture(scope="function")
+def worker_employee(employee_api, worker_namespace):
+    """Creates an employee owned by this worker through the API and returns its details.
+
+    The employee ID comes from this worker's ID range and the middle name carries
+    the worker namespace, so tests running in parallel never act on each other's records.
+    """
+    first_name, middle_name, last_name = generate_random_name()
+    employee = {
+        "first_name": first_name,
+        "middle_name": f"{middle_name} {worker_namespace}",
+        "last_name": last_name,
+        "employee_id": generate_random_employee_id(),  # Drawn from this worker's own ID range
+    }
+    created = employee_api.create_employee(
+        employee["first_name"], employee["middle_name"], employee["last_name"], employee["employee_id"]
+    )
+    employee["emp_number"] = created["empNumber"]
+    return employee
+
+
+@pytest.fixture(scope="session")
+def profile_image():
+    """Returns the absolute path of the sample profile picture data/profileimage.jpeg."""
+    return profile_image_path()
+
+
+@pytest.fixture(scope="session")
+def upload_image(request):
+    """Returns a function giving the path of a generated profile picture of a size (bytes) and format.
+
+    Pictures are kept in the pytest cache, so each one is only generated by the first run that needs it.
+    """
+    cache = getattr(request.config, "cache", None)
+    cache_dir = str(cache.mkdir("images")) if cache is not None else None
+
+    def picture(size, image_format="jpeg"):
+        return image_file(size, image_format, cache_dir)
+
+    return picture
+
+
+def _warn_screenshot_failures(writer):
+    """Reports the screenshots the writer could not save as warnings of the current test."""
+    for name, error in writer.pop_failures():
+        warnings.warn(f"Screenshot {name} could not be saved: {error!r}", RuntimeWarning)
+
+
+@pytest.fixture(scope="session")
+def screenshot_writer(request):
+    """Starts the background screenshot writer of this worker."""
+    config = request.config
+    writer = ScreenshotWriter(
+        "screenshots", mode=config.getoption("--screenshots"), jpeg_quality=config.getoption("--screenshot-quality")
+    )
+    yield writer
+    writer.close()  # Write whatever is still queued
+    _warn_screenshot_failures(writer)
+
+
+@pytest.fixture(scope="function")
+def capture_screenshot(request, screenshot_writer):
+    """Returns a function that captures a screenshot for the current test without blocking on disk.
+
+    When the test fails, the last frame of its browser is captured as well. Screenshots the
+    writer could not save since the last test are reported as warnings of this test.
+    """
+    test_id = request.node.name
+
+    def capture(driver, prefix):
+        screenshot_writer.capture(driver, prefix, test_id)
+
+    yield capture
+    failed = any(getattr(getattr(request.node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+    if failed:
+        for name in ("logged_in_driver", "driver"):
+            driver = request.node.funcargs.get(name)
+            if driver is not None:
+                capture(driver, "failure")
+                break
+    screenshot_writer.finish_test(test_id, failed)
+    _warn_screenshot_failures(screenshot_writer)
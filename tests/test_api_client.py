@@ -0,0 +1,83 @@
+"""
+test_api_client.py
+
+This module contains test cases for the REST API client, run against the local
+stand-in server: logging in without a browser, the employee calls and their
+cleanup, logging in again after the session expired, and parallel creation.
+"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from utils.api_client import OrangeHRMApi, OrangeHRMApiError, OrangeHRMLoginError
+from utils.stand_in_server import StandInServer
+
+
+@pytest.fixture
+def server():
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def api(server):
+    auth_session = SimpleNamespace(base_url=server.url, cookies=[], username="Admin", password="admin123")
+    client = OrangeHRMApi.from_auth_session(auth_session)
+    client.login("Admin", "admin123")
+    yield client
+    client.close()
+
+
+def test_login_without_a_browser(server):
+    """The login endpoint gives session cookies the API accepts; wrong credentials raise."""
+    api = OrangeHRMApi(server.url, [])
+    with pytest.raises(OrangeHRMApiError) as error:
+        api.find_employees("Linda")
+    assert error.value.status_code == 401
+    with pytest.raises(OrangeHRMLoginError):
+        api.login("Admin", "wrong")
+    cookies = api.login("Admin", "admin123")
+    assert [cookie["name"] for cookie in cookies] == ["orangehrm"]
+    assert [employee["employeeId"] for employee in api.find_employees("Linda")] == ["0001"]
+    api.close()
+
+
+def test_employees_are_created_updated_and_cleaned_up(server, api):
+    """Created and tracked employees are all deleted by cleanup(), even if one was deleted already."""
+    created = api.create_employee("Ann", "", "Lee", "API001")
+    api.update_personal_details(created["empNumber"], drivingLicenseNo="DL001")
+    assert api.get_personal_details(created["empNumber"])["drivingLicenseNo"] == "DL001"
+    other = api.create_employee("Bob", "", "Ray", "API002")
+    ui_created = server.state.create_employee({"firstName": "Cy", "lastName": "Ng", "employeeId": "API003"})
+    api.track("API003")
+    api.delete_employees([other["empNumber"]])
+
+    api.cleanup()
+    assert api.created == {}
+    remaining = {employee["employeeId"] for employee in server.state.employees.values()}
+    assert remaining == {"0001", "0002", "0003"}
+    assert ui_created["empNumber"] not in server.state.employees
+
+
+def test_expired_session_logs_in_again(server, api):
+    """A 401 makes the client log in through the endpoint again and repeat the request."""
+    server.state.reset()  # Ends every session
+    assert [employee["employeeId"] for employee in api.find_employees("Peter")] == ["0002"]
+    assert len(server.state.sessions) == 1
+
+
+def test_parallel_creation_uses_one_session_per_thread(api):
+    """Employees are created in parallel in the order given, and each thread has its own HTTP session."""
+    records = [{"first_name": f"User{number}", "middle_name": "", "last_name": "Load", "employee_id": f"PAR{number:03d}"}
+               for number in range(12)]
+    employees = api.create_employees(records, max_workers=4)
+    assert [employee["employeeId"] for employee in employees] == [record["employee_id"] for record in records]
+    assert len(api.created) == 12
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(api.session))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not api.session
+    assert sessions[0].cookies.get("orangehrm") == api.session.cookies.get("orangehrm")
@@ -0,0 +1,163 @@
+"""
+test_async_webdriver.py
+
+This module contains test cases for the asyncio WebDriver client and the async
+page objects. They run against a fake driver server speaking the W3C
+WebDriver protocol over HTTP/1.1, which records the commands it receives.
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from pages.async_pages import AsyncEventWait, AsyncLoginPage
+from pages.waits import clear_time_budget, start_time_budget
+from utils.async_webdriver import ELEMENT_KEY, AsyncWebDriver
+
+
+class FakeDriverServer(ThreadingHTTPServer):
+    """Answers session commands with elements for known selectors and a prepared script result."""
+
+    def __init__(self, selectors=(), script_result=None):
+        super().__init__(("127.0.0.1", 0), FakeDriverHandler)
+        self.selectors = set(selectors)
+        self.script_result = script_result
+        self.commands = []
+        self.connections = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def respond(self, method, path, payload):
+        self.commands.append((method, path.split("/", 3)[-1], payload))
+        if path == "/session":
+            return 200, {"sessionId": "s1", "capabilities": {"browserName": "chrome"}}
+        if path.endswith("/element"):
+            if payload["value"] not in self.selectors:
+                return 404, {"error": "no such element", "message": f"Unable to locate {payload['value']}"}
+            return 200, {ELEMENT_KEY: payload["value"]}
+        if path.endswith(("/displayed", "/enabled")):
+            return 200, True
+        if path.endswith("/execute/sync"):
+            return 200, self.script_result
+        return 200, None
+
+
+class FakeDriverHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length)) if length else None
+        status, value = self.server.respond(self.command, self.path, payload)
+        body = json.dumps({"value": value}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server():
+    servers = []
+
+    def start(**kwargs):
+        server = FakeDriverServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_commands_reuse_keep_alive_connections(fake_server):
+    """Sequential commands of a session travel over one connection; concurrent ones over at most two."""
+    server = fake_server(selectors={'[name="username"]'})
+
+    async def scenario():
+        driver = await AsyncWebDriver.create(server.url)
+        for _ in range(10):
+            await driver.title()
+        assert driver.pool.opened == 1
+        await asyncio.gather(*(driver.title() for _ in range(10)))
+        assert driver.pool.opened <= 2
+        await driver.quit()
+        return driver
+
+    driver = asyncio.run(scenario())
+    assert driver.session_id == "s1"
+    assert server.commands[0][2]["capabilities"]["alwaysMatch"]["browserName"] == "chrome"
+    assert server.commands[-1][:2] == ("DELETE", "s1")
+    assert server.connections <= 3  # One for the new session, the pool of the session for the rest
+
+
+def test_elements_are_wrapped_and_errors_mapped(fake_server):
+    """Found elements come back as AsyncElement; driver errors raise the matching Selenium exception."""
+    server = fake_server(selectors={'[name="username"]'})
+
+    async def scenario():
+        driver = AsyncWebDriver(server.url, "s1")
+        element = await driver.find_element(By.NAME, "username")
+        await element.send_keys("Admin")
+        with pytest.raises(NoSuchElementException, match="Unable to locate"):
+            await driver.find_element(By.ID, "missing")
+        await driver.pool.close()
+        return element
+
+    element = asyncio.run(scenario())
+    assert element.id == '[name="username"]'
+    assert ("POST", f"element/{element.id}/value", {"text": "Admin", "value": list("Admin")}) in server.commands
+
+
+def test_async_login_page_reuses_the_login_signals(fake_server):
+    """AsyncLoginPage types the credentials, arms the login outcomes and reads the one that appeared."""
+    server = fake_server(selectors={'[name="username"]', '[name="password"]', 'button[type="submit"]'},
+                         script_result=["success", "Dashboard"])
+
+    async def scenario():
+        page = AsyncLoginPage(AsyncWebDriver(server.url, "s1"), timeout=2)
+        await page.login("Admin", "admin123")
+        return await page.wait_for_outcome()
+
+    assert asyncio.run(scenario()) == ("success", "Dashboard")
+    paths = [path for _, path, _ in server.commands]
+    assert paths.index("execute/sync") < paths.index('element/button[type="submit"]/click')
+
+
+class NavigatingDriver:
+    """Async driver whose page never settles, so the wait falls back to polling."""
+
+    async def execute_async_script(self, script, *args):
+        raise WebDriverException("navigating")
+
+
+def test_async_wait_ends_with_the_time_budget():
+    """AsyncEventWait runs the EventWait loop, so it also ends when the test's time budget runs out."""
+    async def never(driver):
+        return False
+
+    start_time_budget(0.05)
+    try:
+        with pytest.raises(TimeoutException, match="budget exhausted"):
+            asyncio.run(asyncio.wait_for(AsyncEventWait(NavigatingDriver(), 20).until(never, "never"), 2))
+    finally:
+        clear_time_budget()
@@ -0,0 +1,160 @@
+"""
+test_auth_session.py
+
+This module contains test cases for the AuthSession class: logging in once,
+injecting the stored session into other browsers, logging in again when the
+session expired on the server or was invalidated. A fake browser plays a
+minimal Orange HRM whose dashboard needs a valid session cookie.
+"""
+import time
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.auth_session import READ_STORAGE_JS, WRITE_STORAGE_JS, AuthSession
+
+BASE_URL = "http://hrm.test/"
+
+
+class FakeApp:
+    """Server side of the fake application: the sessions it accepts."""
+
+    def __init__(self):
+        self.sessions = set()
+        self.started = 0
+
+    def new_session(self):
+        self.started += 1
+        self.sessions.add(f"session-{self.started}")
+        return f"session-{self.started}"
+
+
+class FakeBrowser:
+    """Browser with cookies and web storage, whose login form starts a session for Admin/admin123."""
+
+    _is_remote = False
+
+    def __init__(self, app, auth):
+        self.app = app
+        self.auth = auth
+        self.current_url = "about:blank"
+        self.cookies = {}
+        self.storage = {"local": {}, "session": {}}
+        self.typed = {}
+
+    def get(self, url):
+        cookie = self.cookies.get("orangehrm")
+        if url == self.auth.dashboard_url and (cookie is None or cookie["value"] not in self.app.sessions):
+            url = self.auth.login_url  # The application redirects to the login form
+        self.current_url = url
+
+    def delete_all_cookies(self):
+        self.cookies = {}
+
+    def add_cookie(self, cookie):
+        self.cookies[cookie["name"]] = dict(cookie)
+
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self.cookies.values()]
+
+    def execute_script(self, script, *args):
+        if script == READ_STORAGE_JS:
+            return {name: dict(items) for name, items in self.storage.items()}
+        if script == WRITE_STORAGE_JS:
+            self.storage = {name: dict(items) for name, items in args[0].items()}
+        return True  # isDisplayed of a form element, arming the outcome latch
+
+    def execute_async_script(self, script, *args):
+        raise JavascriptException("not supported")  # The wait polls instead
+
+    def find_element(self, by, value):
+        return WebElement(self, value)
+
+    def execute(self, command, params):
+        if command == Command.CLEAR_ELEMENT:
+            self.typed[params["id"]] = ""
+        elif command == Command.SEND_KEYS_TO_ELEMENT:
+            self.typed[params["id"]] += params["text"]
+        elif command == Command.CLICK_ELEMENT:
+            self.submit()
+        return {"value": True}
+
+    def submit(self):
+        if (self.typed.get('[name="username"]'), self.typed.get('[name="password"]')) == ("Admin", "admin123"):
+            self.cookies["orangehrm"] = {"name": "orangehrm", "value": self.app.new_session(), "path": "/",
+                                         "sameSite": "no_restriction"}
+            self.storage["local"]["orangehrm.user"] = "Admin"
+            self.current_url = self.auth.dashboard_url
+
+
+@pytest.fixture
+def app():
+    return FakeApp()
+
+
+@pytest.fixture
+def auth():
+    return AuthSession(BASE_URL, "Admin", "admin123", timeout=0.5)
+
+
+def test_first_apply_logs_in_and_keeps_the_session(app, auth):
+    """Without stored state the login form is used once and the cookies and web storage are captured."""
+    assert not auth.has_state()
+    browser = FakeBrowser(app, auth)
+    auth.apply(browser)
+    assert browser.current_url == auth.dashboard_url
+    assert auth.login_count == 1
+    assert [cookie["value"] for cookie in auth.cookies] == ["session-1"]
+    assert auth.storage == {"local": {"orangehrm.user": "Admin"}, "session": {}}
+    assert auth.has_state()
+
+
+def test_stored_session_is_injected_into_other_browsers(app, auth):
+    """Other browsers get the cookies and storage without a login; unknown sameSite values are dropped."""
+    auth.apply(FakeBrowser(app, auth))
+    other = FakeBrowser(app, auth)
+    other.cookies["stale"] = {"name": "stale", "value": "x"}
+    other.storage["session"]["leftover"] = "1"
+
+    auth.apply(other, url=BASE_URL + "web/index.php/pim/viewEmployeeList")
+    assert other.current_url.endswith("pim/viewEmployeeList")
+    assert auth.login_count == 1
+    assert other.cookies == {"orangehrm": {"name": "orangehrm", "value": "session-1", "path": "/"}}
+    assert other.storage == {"local": {"orangehrm.user": "Admin"}, "session": {}}
+
+
+def test_session_expired_on_the_server_logs_in_again(app, auth):
+    """When the application still shows the login form after injecting, a new session is captured."""
+    auth.apply(FakeBrowser(app, auth))
+    app.sessions.clear()
+    browser = FakeBrowser(app, auth)
+    auth.apply(browser)
+    assert browser.current_url == auth.dashboard_url
+    assert auth.login_count == 2
+    assert [cookie["value"] for cookie in auth.cookies] == ["session-2"]
+
+
+def test_invalidated_or_expired_state_is_not_injected(app, auth):
+    """invalidate() and an expired cookie both make the next apply() log in through the form."""
+    auth.apply(FakeBrowser(app, auth))
+    auth.invalidate()
+    assert not auth.has_state() and auth.storage == {"local": {}, "session": {}}
+    auth.apply(FakeBrowser(app, auth))
+    assert auth.login_count == 2
+
+    auth.cookies[0]["expiry"] = time.time() - 1
+    assert not auth.has_state()
+    auth.apply(FakeBrowser(app, auth))
+    assert auth.login_count == 3
+
+
+def test_wrong_credentials_time_out_on_the_login_form(app):
+    """A login that never reaches the dashboard raises TimeoutException and keeps no state."""
+    auth = AuthSession(BASE_URL, "Admin", "wrong", timeout=0.2)
+    browser = FakeBrowser(app, auth)
+    with pytest.raises(TimeoutException):
+        auth.apply(browser)
+    assert browser.current_url == auth.login_url
+    assert not auth.has_state() and auth.login_count == 0
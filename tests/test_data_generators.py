@@ -0,0 +1,59 @@
+"""
+test_data_generators.py
+
+This module contains test cases for the employee data generators in
+data/data_generators.py.
+"""
+
+import csv
+
+import pytest
+
+from data.data_generators import EMPLOYEE_FIELDS, EmployeeDataGenerator, generate_random_employee_id
+
+
+def test_employee_ids_never_repeat():
+    """Every ID of a small ID space is generated exactly once."""
+    generator = EmployeeDataGenerator(seed=7, id_width=4)
+    ids = generator.employee_ids(0, generator.capacity()).tolist()
+    assert len(set(ids)) == 10_000
+    assert all(len(employee_id) == 4 for employee_id in ids)
+
+
+def test_workers_get_disjoint_ranges():
+    """Two workers sharing one seed never produce the same ID."""
+    first = EmployeeDataGenerator(seed=7, worker=0, workers=2, id_width=4)
+    second = EmployeeDataGenerator(seed=7, worker=1, workers=2, id_width=4)
+    assert not set(first.employee_ids(0, 5_000).tolist()) & set(second.employee_ids(0, 5_000).tolist())
+
+
+def test_same_seed_gives_same_records():
+    """Records are reproducible from the seed."""
+    first = list(EmployeeDataGenerator(seed=3).iter_records(50))
+    second = list(EmployeeDataGenerator(seed=3).iter_records(50))
+    assert first == second
+    assert first != list(EmployeeDataGenerator(seed=4).iter_records(50))
+
+
+def test_exhausted_range_raises():
+    """Asking for more records than the worker's range holds is an error."""
+    generator = EmployeeDataGenerator(seed=1, worker=0, workers=4, id_width=2)
+    generator.reserve(25)
+    with pytest.raises(ValueError):
+        generator.reserve(1)
+
+
+def test_to_csv_writes_header_and_rows(tmp_path):
+    """The CSV export has one row per record under the field header."""
+    path = EmployeeDataGenerator(seed=5).to_csv(tmp_path / "employees.csv", 1_000, batch_size=300)
+    with open(path, newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows[0] == EMPLOYEE_FIELDS
+    assert len(rows) == 1_001
+    assert len({row[0] for row in rows[1:]}) == 1_000
+
+
+def test_generate_random_employee_id_is_unique():
+    """The default generator hands out distinct IDs."""
+    ids = {generate_random_employee_id() for _ in range(1_000)}
+    assert len(ids) == 1_000
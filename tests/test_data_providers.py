@@ -0,0 +1,68 @@
+"""
+test_data_providers.py
+
+This module contains test cases for the CSV data providers in data/data_providers.py.
+"""
+
+import os
+
+from data import data_providers
+from data.data_providers import first_row, iter_params, load_rows
+
+
+def write_csv(path, rows):
+    path.write_text("username,password,expected\n" + "".join(f"{row}\n" for row in rows))
+    return str(path)
+
+
+def count_opens(monkeypatch):
+    """Counts the files the data providers open."""
+    opened = []
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(data_providers, "open", counting_open, raising=False)
+    return opened
+
+
+def test_load_rows_filters_and_caches(tmp_path, monkeypatch):
+    """Rows are filtered by column value; the file is parsed once for load_rows, first_row and row references."""
+    path = write_csv(tmp_path / "login.csv", ["Admin,admin123,pass", "Admin,wrong,fail", "User,pw,fail"])
+    params = list(iter_params(path, expected="fail"))
+    opened = count_opens(monkeypatch)
+    assert [row["password"] for row in load_rows(path, expected="fail")] == ["wrong", "pw"]
+    assert load_rows(path, expected="pass")[0]["username"] == "Admin"
+    assert first_row(path, expected="fail")["password"] == "wrong"
+    assert [param.values[0].load()["password"] for param in params] == ["wrong", "pw"]
+    assert opened == [path]
+
+    load_rows(path)[0]["password"] = "changed"  # Callers get copies, the cache stays intact
+    assert first_row(path)["password"] == "admin123"
+
+
+def test_cache_is_refreshed_when_the_file_changes(tmp_path, monkeypatch):
+    """A file whose size or modification time changed is parsed again."""
+    path = write_csv(tmp_path / "login.csv", ["Admin,admin123,pass"])
+    assert first_row(path)["password"] == "admin123"
+    write_csv(tmp_path / "login.csv", ["Admin,newpass1,pass"])  # Same size
+    os.utime(path, ns=(0, 0))
+    opened = count_opens(monkeypatch)
+    assert first_row(path)["password"] == "newpass1"
+    assert len(opened) == 1
+
+
+def test_first_row_returns_first_match(tmp_path):
+    path = write_csv(tmp_path / "login.csv", ["Admin,admin123,pass", "Other,secret,pass"])
+    assert first_row(path, expected="pass")["password"] == "admin123"
+
+
+def test_params_reference_rows_and_load_them_later(tmp_path):
+    """Parameters carry only a row reference; loading it gives back the full row."""
+    rows = [f"user{number},pw{number},{'pass' if number % 2 else 'fail'}" for number in range(100_000)]
+    path = write_csv(tmp_path / "matrix.csv", rows)
+    params = list(iter_params(path, id_field="username", limit=3, expected="pass"))
+    assert [param.id for param in params] == ["user1-1", "user3-2", "user5-3"]
+    assert params[2].values[0].load() == {"username": "user5", "password": "pw5", "expected": "pass"}
+    assert len(list(iter_params(path, expected="fail"))) == 50_000
@@ -0,0 +1,111 @@
+"""
+test_driver_pool.py
+
+This module contains test cases for the DriverPool class. A fake driver is used
+in place of Chrome so the leasing, resetting and recycling logic can be checked
+without starting a browser.
+"""
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils.driver_pool import DriverPool, DriverPoolError
+
+
+class FakeDriver:
+    """Minimal stand-in for a WebDriver that records the calls made on it."""
+
+    def __init__(self):
+        self.visited = []
+        self.cookies_cleared = 0
+        self.quit_called = False
+        self.crashed = False
+
+    def get(self, url):
+        if self.crashed:
+            raise WebDriverException("browser crashed")
+        self.visited.append(url)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def execute_script(self, script, *args):
+        return None
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(size=1, max_uses=25, failing_starts=()):
+    """Creates and starts a pool of fake drivers; the starts numbered in failing_starts (from 0) raise."""
+    created = []
+    starts = []
+
+    def factory():
+        starts.append(len(starts))
+        if starts[-1] in failing_starts:
+            raise WebDriverException("chromedriver could not be started")
+        created.append(FakeDriver())
+        return created[-1]
+
+    pool = DriverPool("http://app.local/", size=size, max_uses=max_uses, driver_factory=factory, lease_timeout=5)
+    return pool.start(), created
+
+
+def test_lease_resets_driver_between_tests():
+    """A driver returned to the pool is cleared and sent back to the base URL."""
+    pool, created = make_pool()
+    with pool.lease() as driver:
+        driver.get("http://app.local/web/index.php/pim/viewEmployeeList")
+    assert created[0].cookies_cleared == 1
+    assert created[0].visited[-1] == "http://app.local/"
+    with pool.lease() as driver:
+        assert driver is created[0]
+    assert pool.stats()["leases"] == 2
+    pool.close()
+
+
+def test_driver_recycled_after_max_uses():
+    """A driver is replaced once it has been leased max_uses times."""
+    pool, created = make_pool(max_uses=2)
+    for _ in range(2):
+        with pool.lease():
+            pass
+    with pool.lease() as driver:
+        assert driver is created[1]
+    assert created[0].quit_called
+    assert pool.stats()["recycled_max_uses"] == 1
+    pool.close()
+
+
+def test_crashed_driver_is_replaced():
+    """A driver that fails its reset is counted as crashed and replaced."""
+    pool, created = make_pool()
+    with pool.lease():
+        created[0].crashed = True
+    with pool.lease() as driver:
+        assert driver is created[1]
+    assert pool.stats()["recycled_crash"] == 1
+    pool.close()
+
+
+def test_failed_start_is_raised():
+    """start() raises the error of a driver that could not be started."""
+    with pytest.raises(WebDriverException, match="chromedriver"):
+        make_pool(size=2, failing_starts=(1,))
+
+
+def test_lease_fails_at_once_when_no_driver_is_left():
+    """Once the only driver is gone and its replacement failed, a lease fails without waiting for the timeout."""
+    pool, created = make_pool(max_uses=1, failing_starts=(1,))
+    with pool.lease():
+        pass
+    started = time.perf_counter()
+    with pytest.raises(DriverPoolError) as error:
+        pool.acquire()
+    assert time.perf_counter() - started < 1
+    assert isinstance(error.value.__cause__, WebDriverException)
+    assert len(pool.pop_launch_errors()) == 1
+    assert pool.stats()["launch_failures"] == 1
+    pool.close()
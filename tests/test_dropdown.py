@@ -0,0 +1,90 @@
+"""
+test_dropdown.py
+
+This module contains test cases for the Dropdown component. A fake driver plays
+the part of the browser so option caching and direct selection can be checked
+without Chrome.
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages import dropdown
+from pages.dropdown import Dropdown
+
+
+class FakeField:
+    def __init__(self):
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class FakeDriver:
+    """Answers the read and select scripts of the Dropdown from a fixed option list."""
+
+    session_id = "session-1"
+
+    def __init__(self, options):
+        self.options = options
+        self.selected = []
+        self.script_calls = 0
+
+    def execute_script(self, script, field, *args):
+        self.script_calls += 1
+        if not args:
+            return list(self.options)
+        index, expected = args
+        self.selected.append(self.options[index])
+        return self.options[index]
+
+
+class FakeWait:
+    def __init__(self, driver, field):
+        self.driver = driver
+        self.field = field
+
+    def until(self, condition):
+        if callable(condition) and condition.__name__ == "<lambda>":
+            return condition(self.driver)
+        return self.field
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    dropdown.clear_option_cache()
+    yield
+    dropdown.clear_option_cache()
+
+
+def make_dropdown(options):
+    driver = FakeDriver(options)
+    field = FakeField()
+    return Dropdown(driver, FakeWait(driver, field), (By.CSS_SELECTOR, ".select"), "nationality"), driver, field
+
+
+def test_select_picks_option_by_index_in_two_script_calls():
+    """Options are read once and the target is selected directly."""
+    select, driver, _ = make_dropdown(["-- Select --", "American", "Indian"])
+    select.select("Indian")
+    assert driver.selected == ["Indian"]
+    assert driver.script_calls == 2
+
+
+def test_options_are_cached_per_session():
+    """A second selection does not read the options again."""
+    select, driver, _ = make_dropdown(["-- Select --", "American", "Indian"])
+    select.select("Indian")
+    select.select("American")
+    assert driver.script_calls == 3
+
+
+def test_missing_value_raises_without_opening_dropdown():
+    """With a cached list, an unknown value fails before the field is clicked."""
+    select, _, field = make_dropdown(["-- Select --", "American", "Indian"])
+    select.options()
+    clicks = field.clicks
+    with pytest.raises(ValueError):
+        select.select("Atlantean")
+    assert field.clicks == clicks
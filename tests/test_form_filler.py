@@ -0,0 +1,95 @@
+"""
+test_form_filler.py
+
+This module contains test cases for the FormFiller class. A fake driver answers
+the fill script with a chosen status per field, so the statuses kept and the
+fields typed key by key through Selenium can be checked without Chrome.
+"""
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.form_filler import FormFiller, to_script_locator
+
+
+class FakeField:
+    """Records what Selenium typed into it."""
+
+    def __init__(self):
+        self.value = "old"
+        self.typed = []
+
+    def is_displayed(self):
+        return True
+
+    def clear(self):
+        self.value = ""
+
+    def send_keys(self, value):
+        self.typed.append(value)
+        self.value += value
+
+
+class FakeDriver:
+    """Answers the fill script with the status given for each selector and finds fallback fields."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.fields = {}
+        self.scripts = []
+
+    def execute_script(self, script, entries):
+        self.scripts.append(entries)
+        return [self.statuses[selector] for _, selector, _ in entries]
+
+    def find_element(self, by, value):
+        return self.fields.setdefault((by, value), FakeField())
+
+
+class FakeWait:
+    """Checks the condition once, like a wait whose element is already there."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def until(self, condition):
+        return condition(self.driver)
+
+
+def test_fields_set_by_the_script_are_not_typed():
+    """Filled and unchanged fields keep their status, and the whole form takes one script call."""
+    driver = FakeDriver({'[name="firstName"]': "filled", '[name="lastName"]': "unchanged"})
+    results = FormFiller(driver, FakeWait(driver)).fill(
+        {(By.NAME, "firstName"): "Alice", (By.NAME, "lastName"): "Smith"}
+    )
+    assert results == {(By.NAME, "firstName"): "filled", (By.NAME, "lastName"): "unchanged"}
+    assert driver.scripts == [[["css", '[name="firstName"]', "Alice"], ["css", '[name="lastName"]', "Smith"]]]
+    assert driver.fields == {}
+
+
+def test_missing_and_fallback_fields_are_typed_key_by_key():
+    """Fields the script could not find or set are cleared and typed through Selenium."""
+    driver = FakeDriver({'[name="firstName"]': "filled", "//input[@type='file']": "fallback", "#late": "missing"})
+    fields = {(By.NAME, "firstName"): "Alice", (By.XPATH, "//input[@type='file']"): "/tmp/a.png",
+              (By.CSS_SELECTOR, "#late"): "0042"}
+    results = FormFiller(driver, FakeWait(driver)).fill(fields)
+
+    assert results == {(By.NAME, "firstName"): "filled", (By.XPATH, "//input[@type='file']"): "typed",
+                       (By.CSS_SELECTOR, "#late"): "typed"}
+    assert set(driver.fields) == {(By.XPATH, "//input[@type='file']"), (By.CSS_SELECTOR, "#late")}
+    assert driver.fields[(By.XPATH, "//input[@type='file']")].typed == ["/tmp/a.png"]
+    assert driver.fields[(By.CSS_SELECTOR, "#late")].value == "0042"
+
+
+def test_empty_form_makes_no_script_call():
+    """Filling nothing returns no statuses without a round trip."""
+    driver = FakeDriver({})
+    assert FormFiller(driver, FakeWait(driver)).fill({}) == {}
+    assert driver.scripts == []
+
+
+def test_locators_are_converted_for_the_script():
+    """Name, ID and class locators become CSS selectors; other strategies are rejected."""
+    assert to_script_locator((By.ID, "save")) == ["css", '[id="save"]']
+    assert to_script_locator((By.CLASS_NAME, "oxd-input")) == ["css", ".oxd-input"]
+    with pytest.raises(ValueError, match="link text"):
+        to_script_locator((By.LINK_TEXT, "Save"))
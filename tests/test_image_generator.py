@@ -0,0 +1,60 @@
+"""
+test_image_generator.py
+
+This module contains test cases for the generated profile pictures: exact
+sizes, valid headers of each format, and reuse of the cached files.
+"""
+import os
+import struct
+import zlib
+
+import pytest
+
+from data.image_generator import (
+    MAX_UPLOAD_BYTES, generate_image, image_file, image_matrix, profile_image_path
+)
+
+
+def png_chunks(data):
+    offset, chunks = 8, []
+    while offset < len(data):
+        length, = struct.unpack(">I", data[offset:offset + 4])
+        chunk_type, body = data[offset + 4:offset + 8], data[offset + 8:offset + 8 + length]
+        assert struct.unpack(">I", data[offset + 8 + length:offset + 12 + length])[0] == zlib.crc32(chunk_type + body)
+        chunks.append(chunk_type)
+        offset += 12 + length
+    return chunks
+
+
+@pytest.mark.parametrize("size", [16 * 1024, 65537 + 11899, MAX_UPLOAD_BYTES])
+def test_pictures_have_the_exact_size_and_stay_valid(size):
+    """Every format is padded to the byte, keeping the signature and structure decoders expect."""
+    jpeg, png, gif = (generate_image(size, image_format) for image_format in ("jpeg", "png", "gif"))
+    assert len(jpeg) == len(png) == len(gif) == size
+
+    with open(profile_image_path(), "rb") as sample:
+        picture = sample.read()
+    assert jpeg[:2] == b"\xff\xd8" and jpeg[2:4] == b"\xff\xfe" and jpeg.endswith(picture[2:])
+    assert png_chunks(png) == [b"IHDR", b"IDAT", b"paDd", b"IEND"]
+    assert gif.startswith(b"GIF89a") and gif.endswith(b"\x00\x3b")
+
+
+def test_too_small_or_unknown_pictures_are_rejected():
+    """A picture cannot be smaller than its unpadded image, and only accepted formats are generated."""
+    with pytest.raises(ValueError):
+        generate_image(1024, "jpeg")
+    with pytest.raises(ValueError):
+        generate_image(16 * 1024, "bmp")
+
+
+def test_pictures_are_generated_once_per_cache_folder(tmp_path):
+    """The matrix writes each picture the first time and reuses the file afterwards."""
+    matrix = image_matrix(sizes=(4096, 8192), formats=("png", "gif"), cache_dir=str(tmp_path))
+    assert [(image_format, size) for image_format, size, _ in matrix] == [
+        ("png", 4096), ("png", 8192), ("gif", 4096), ("gif", 8192),
+    ]
+    path = matrix[0][2]
+    assert os.path.getsize(path) == 4096
+    os.utime(path, (0, 0))
+    assert image_file(4096, "png", str(tmp_path)) == path
+    assert os.path.getmtime(path) == 0  # Not written again
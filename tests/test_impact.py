@@ -0,0 +1,128 @@
+"""
+test_impact.py
+
+This module contains test cases for the impact-based test selection. A small
+page module is written to a temporary project, traced while it runs, and then
+edited to check which changes select which tests.
+"""
+import importlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from utils.impact import Fingerprints, ImpactTracer, select_affected, update_map
+
+PAGE_SOURCE = '''
+from data.data_providers import first_row
+from pages.locators import LocatorRegistry
+
+LOCATORS = {"buy": ("id", "buy"), "cart": ("id", "cart")}
+BUY_JS = "return 1;"
+CART_SELECTOR = ".cart-count"
+CART_OUTCOMES = {"items": CART_SELECTOR}  # Reads CART_SELECTOR only through this constant
+
+
+class ShopPage:
+    def __init__(self):
+        self.locators = LocatorRegistry(None, None, LOCATORS)
+
+    def buy(self, users_file):
+        first_row(users_file)
+        return self.locators.locator("buy"), BUY_JS
+
+    def open_cart(self):
+        return self.locators.locator("cart"), CART_OUTCOMES
+'''
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "shop_page.py").write_text(PAGE_SOURCE)
+    (tmp_path / "users.csv").write_text("username\nAdmin\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    sys.modules.pop("shop_page", None)  # The next test imports its own copy
+
+
+def trace(root, function, fixture_names=()):
+    tracer = ImpactTracer(root)
+    tracer.start()
+    try:
+        tracer.start_test()
+        function()
+        return tracer.finish_test(fixture_names)
+    finally:
+        tracer.stop()
+
+
+def test_tracer_records_methods_locators_and_data_files(project):
+    """Page methods, the locators they resolve and the data files they read are recorded."""
+    shop_page = importlib.import_module("shop_page")
+    page = shop_page.ShopPage()
+    dependencies = trace(project, lambda: page.buy(str(project / "users.csv")))
+    assert dependencies == [
+        "shop_page.py::LOCATORS[buy]", "shop_page.py::ShopPage.buy", "users.csv",
+    ]
+
+
+def test_fixture_dependencies_are_inherited_by_later_tests(project):
+    """What a fixture used while it was set up counts for every test that uses the fixture."""
+    page = importlib.import_module("shop_page").ShopPage()
+    tracer = ImpactTracer(project)
+    tracer.start()
+    try:
+        tracer.start_test()
+        tracer.start_fixture()
+        page.open_cart()
+        tracer.finish_fixture("cart")
+        assert "shop_page.py::ShopPage.open_cart" in tracer.finish_test(["cart"])
+        tracer.start_test()  # The fixture is cached, so it is not set up again
+        assert tracer.finish_test(["cart"]) == ["shop_page.py::LOCATORS[cart]", "shop_page.py::ShopPage.open_cart"]
+    finally:
+        tracer.stop()
+
+
+def test_only_tests_with_changed_dependencies_are_selected(project):
+    """Editing a locator, a constant or a data file selects the tests using it; comments do not count."""
+    buy = ["shop_page.py::LOCATORS[buy]", "shop_page.py::ShopPage.buy", "users.csv"]
+    cart = ["shop_page.py::LOCATORS[cart]", "shop_page.py::ShopPage.open_cart"]
+    runs = {"test_buy": (buy, False), "test_cart": (cart, False), "test_flaky": (cart, True)}
+    impact_map = update_map({}, runs, Fingerprints(project))
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in ("test_buy", "test_cart", "test_flaky", "test_new")]
+
+    def selection():
+        selected, _, changed = select_affected(items, impact_map, Fingerprints(project))
+        return [item.nodeid for item in selected], changed
+
+    assert selection() == (["test_flaky", "test_new"], [])
+    page = project / "shop_page.py"
+    page.write_text(PAGE_SOURCE.replace("    def open_cart", "    # Opens the cart\n    def open_cart"))
+    assert selection() == (["test_flaky", "test_new"], [])
+    page.write_text(PAGE_SOURCE.replace('("id", "cart")', '("css selector", ".cart")'))
+    assert selection() == (["test_cart", "test_flaky", "test_new"], ["shop_page.py::LOCATORS[cart]"])
+    page.write_text(PAGE_SOURCE.replace("return 1;", "return 2;"))
+    assert selection() == (["test_buy", "test_flaky", "test_new"], ["shop_page.py::ShopPage.buy"])
+    (project / "users.csv").write_text("username\nAdmin\nEss\n")
+    assert selection()[1] == ["shop_page.py::ShopPage.buy", "users.csv"]
+
+
+def test_skipped_tests_are_selected_until_they_run(project):
+    """A test whose body did not run has no known dependencies, so it is selected again next time."""
+    cart = ["shop_page.py::LOCATORS[cart]", "shop_page.py::ShopPage.open_cart"]
+    impact_map = update_map({}, {"test_cart": (cart, False), "test_benchmark": (cart, False)}, Fingerprints(project))
+    impact_map = update_map(impact_map, {"test_benchmark": (None, False)}, Fingerprints(project))
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in ("test_cart", "test_benchmark")]
+    selected, deselected, _ = select_affected(items, impact_map, Fingerprints(project))
+    assert [item.nodeid for item in selected] == ["test_benchmark"]
+    assert [item.nodeid for item in deselected] == ["test_cart"]
+
+
+def test_constants_read_through_other_constants_are_part_of_the_fingerprint(project):
+    """Editing a constant a method only reaches through another constant selects the tests of that method."""
+    cart = ["shop_page.py::LOCATORS[cart]", "shop_page.py::ShopPage.open_cart"]
+    impact_map = update_map({}, {"test_cart": (cart, False)}, Fingerprints(project))
+    (project / "shop_page.py").write_text(PAGE_SOURCE.replace('".cart-count"', '".cart-badge"'))
+    selected, _, changed = select_affected([SimpleNamespace(nodeid="test_cart")], impact_map, Fingerprints(project))
+    assert [item.nodeid for item in selected] == ["test_cart"]
+    assert changed == ["shop_page.py::ShopPage.open_cart"]
@@ -0,0 +1,109 @@
+"""
+test_instrumentation.py
+
+This module contains test cases for the Instrumentation class. A WebDriver whose
+command executor answers locally stands in for the browser, and a small page
+object plays the part of LoginPage/PIMPage.
+"""
+
+import json
+import time
+
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.waits import EventWait
+from utils.instrumentation import Instrumentation, percentile
+
+
+class FakeExecutor:
+    """Answers every WebDriver command after a short delay."""
+
+    def execute(self, command, params):
+        time.sleep(0.01)
+        return {"status": 0, "value": None}
+
+
+class FakeDriver(WebDriver):
+    """WebDriver that never starts a browser."""
+
+    def __init__(self):
+        self.session_id = "fake"
+        self.command_executor = FakeExecutor()
+        self.error_handler = ErrorHandler()
+        self._websocket_connection = None
+
+    def execute_async_script(self, script, *args):
+        return 1  # The page changed, re-check the wait condition
+
+
+class FakePage:
+    """Page object issuing two commands and one wait per action."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def open(self):
+        self.driver.execute("getTitle")
+        EventWait(self.driver, 1).until(lambda driver: driver.execute("getTitle"))
+        self.driver.execute("getTitle")
+
+    def open_twice(self):
+        self.open()
+        self.open()
+
+
+def test_actions_are_split_into_wait_command_and_think_time():
+    """Commands inside waits count as wait time, and nested actions are part of the outer one."""
+    instrumentation = Instrumentation()
+    instrumentation.enable([FakePage])
+    try:
+        instrumentation.start_test("test_open")
+        page = FakePage(FakeDriver())
+        page.open()
+        page.open_twice()
+    finally:
+        instrumentation.disable()
+
+    first, second = instrumentation.test_records("test_open")
+    assert first["action"] == "FakePage.open"
+    assert first["round_trips"] == 3
+    assert first["command"] >= 0.02
+    assert first["wait"] >= 0.01
+    assert first["total"] >= first["wait"] + first["command"]
+    assert second["action"] == "FakePage.open_twice"
+    assert second["round_trips"] == 6
+
+
+def test_disable_restores_original_methods():
+    """Once disabled, nothing is wrapped or recorded any more."""
+    original_open, original_execute = FakePage.open, WebDriver.execute
+    instrumentation = Instrumentation()
+    instrumentation.enable([FakePage])
+    assert FakePage.open is not original_open
+    instrumentation.disable()
+    assert FakePage.open is original_open
+    assert WebDriver.execute is original_execute
+    FakePage(FakeDriver()).open()
+    assert instrumentation.records == []
+
+
+def test_summary_and_json(tmp_path):
+    """The JSON holds the session summary and the actions of each test."""
+    instrumentation = Instrumentation()
+    instrumentation.enable([FakePage])
+    try:
+        for test_id in ("test_a", "test_b"):
+            instrumentation.start_test(test_id)
+            FakePage(FakeDriver()).open()
+    finally:
+        instrumentation.disable()
+
+    path = instrumentation.write_json(str(tmp_path / "timings.json"))
+    with open(path) as json_file:
+        timings = json.load(json_file)
+    assert timings["session"]["FakePage.open"]["count"] == 2
+    assert set(timings["tests"]) == {"test_a", "test_b"}
+    assert "FakePage.open" in instrumentation.html_table("test_a")
+    assert percentile([1, 2, 3, 4], 0.5) == 2
+    assert percentile([1, 2, 3, 4], 0.99) == 4
@@ -0,0 +1,128 @@
+"""
+test_load_test.py
+
+This module contains test cases for the load-test runner. Scenarios that only
+sleep, and drivers that do nothing, stand in for the browser flows.
+"""
+
+import json
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils.load_test import AsyncVirtualUser, LoadResults, run_load_test, write_report
+
+
+class FakeDriver:
+    """Driver of a virtual user; only remembers that it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def get(self, url):
+        raise WebDriverException("net::ERR_CONNECTION_REFUSED")  # Nothing is served at the base URL
+
+    def quit(self):
+        self.closed = True
+
+
+def fast_scenario(user):
+    """Scenario with one short, successful transaction."""
+    with user.transaction("fast"):
+        time.sleep(0.005)
+
+
+def failing_scenario(user):
+    """Scenario whose transaction always fails, like a rejected save."""
+    with user.transaction("failing"):
+        raise ValueError("Employee Id already exists\nmore details")
+
+
+def dashboard_scenario(user):
+    """Scenario that opens the dashboard before its transaction, like the PIM scenarios."""
+    user.open_dashboard()
+    fast_scenario(user)
+
+
+def adding_scenario(user):
+    """Scenario that leaves an employee behind for the cleanup."""
+    with user.transaction("fast"):
+        user.employees.append("LT0001")
+
+
+def test_weighted_scenarios_are_run_and_recorded():
+    """Every user runs its scenarios until the end of the run, and failures are counted as errors."""
+    drivers = []
+
+    def driver_factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    results, elapsed = run_load_test(
+        "http://127.0.0.1:1/", users=3, ramp_up=0.03, duration=0.3, weights={"fast": 3, "failing": 1},
+        think_time=0.005, credentials=("Admin", "admin123"), seed=7, driver_factory=driver_factory,
+        scenarios={"fast": fast_scenario, "failing": failing_scenario},
+    )
+
+    assert len(drivers) == 3 and all(driver.closed for driver in drivers)
+    summary = results.summary(elapsed)
+    assert summary["fast"]["count"] > summary["failing"]["count"] > 0
+    assert summary["fast"]["error_rate"] == 0.0
+    assert summary["failing"]["error_rate"] == 1.0
+    assert summary["fast"]["throughput"] > 0
+    assert list(results.errors()) == ["failing: ValueError: Employee Id already exists"]
+
+
+def test_unknown_scenario_is_rejected():
+    """Weights must name known scenarios."""
+    with pytest.raises(ValueError, match="Unknown scenarios"):
+        run_load_test(weights={"checkout": 1}, credentials=("Admin", "admin123"))
+
+
+def test_timeline_and_report(tmp_path):
+    """Transactions are grouped into intervals by their start time."""
+    results = LoadResults()
+    for offset, duration in ((0.5, 1.0), (1.5, 2.0), (12.0, 3.0)):
+        results.record("add_employee", results.started + offset, duration)
+    results.record("add_employee", results.started + 13.0, 0.5, "TimeoutException")
+
+    timeline = results.timeline(10)
+    assert [interval["start"] for interval in timeline] == [0, 10]
+    assert timeline[0]["transactions"]["add_employee"]["throughput"] == 0.2
+    assert timeline[1]["transactions"]["add_employee"]["errors"] == 1
+
+    path = write_report(str(tmp_path / "load.json"), results, 20.0, 10, {"users": 1})
+    with open(path) as json_file:
+        report = json.load(json_file)
+    assert report["summary"]["add_employee"]["p50"] == 2.0
+    assert report["summary"]["add_employee"]["count"] == 4
+
+
+def test_failed_set_up_and_cleanup_are_recorded():
+    """Set-up steps outside the timed transactions and the cleanup of the employees left behind count as errors."""
+    drivers = []
+
+    def driver_factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    results, elapsed = run_load_test(
+        "http://127.0.0.1:1/", users=2, duration=0.1, weights={"dashboard": 1, "adding": 1},
+        think_time=0.005, credentials=("Admin", "admin123"), seed=7, driver_factory=driver_factory,
+        scenarios={"dashboard": dashboard_scenario, "adding": adding_scenario},
+    )
+
+    assert all(driver.closed for driver in drivers)
+    summary = results.summary(elapsed)
+    assert summary["setup"]["count"] > 0 and summary["setup"]["error_rate"] == 1.0
+    assert summary["fast"]["error_rate"] == 0.0  # The dashboard scenario stopped before its transaction
+    assert summary["cleanup"] == dict(summary["cleanup"], count=2, errors=2)
+    assert "setup: WebDriverException: Message: net::ERR_CONNECTION_REFUSED" in results.errors()
+
+
+def test_async_user_pages_wait_as_long_as_its_session():
+    """The async login page of a user waits for the timeout of the user's AuthSession."""
+    user = AsyncVirtualUser(0, "http://127.0.0.1:1/", ("Admin", "admin123"), LoadResults(), None, None)
+    user.auth.timeout = 3
+    assert user.login_page().wait.timeout == 3
@@ -0,0 +1,93 @@
+"""
+test_locators.py
+
+This module contains test cases for the LocatorRegistry: locator compilation,
+element caching and re-resolution of stale elements.
+"""
+
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.locators import LocatorRegistry, compile_locator, count_stats
+
+
+class FakeDriver:
+    """Driver whose elements go stale once after `stale_once` is set."""
+
+    def __init__(self):
+        self.found = 0
+        self.stale_once = False
+
+    def find_element(self, by, value):
+        self.found += 1
+        return WebElement(self, f"element-{self.found}")
+
+    def execute_script(self, script, *args):
+        if self.stale_once:  # is_displayed() runs a script on the element
+            self.stale_once = False
+            raise StaleElementReferenceException("stale")
+        return True
+
+    def execute(self, command, params):
+        if self.stale_once:
+            self.stale_once = False
+            raise StaleElementReferenceException("stale")
+        return {"value": params["id"]}
+
+
+class FakeWait:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def until(self, condition):
+        return condition(self.driver)
+
+
+def test_simple_locators_compile_to_css():
+    """Simple XPaths and NAME/ID locators become CSS selectors, complex XPaths stay."""
+    assert compile_locator((By.XPATH, "//input[@type='file']")) == (By.CSS_SELECTOR, 'input[type="file"]')
+    assert compile_locator((By.XPATH, "//button")) == (By.CSS_SELECTOR, "button")
+    assert compile_locator((By.NAME, "username")) == (By.CSS_SELECTOR, '[name="username"]')
+    assert compile_locator((By.ID, "app")) == (By.CSS_SELECTOR, "#app")
+    complex_xpath = (By.XPATH, "//span[text()='PIM']")
+    assert compile_locator(complex_xpath) == complex_xpath
+
+
+def test_cached_element_is_reused_until_invalidated():
+    """A second lookup is a cache hit; invalidate() forces a new lookup."""
+    driver = FakeDriver()
+    registry = LocatorRegistry(driver, FakeWait(driver), {"file": (By.XPATH, "//input[@type='file']")})
+    first = registry.element("file", "present")
+    assert registry.element("file", "present") is first
+    registry.invalidate()
+    assert registry.element("file", "present") is not first
+    assert registry.stats() == {"hits": 1, "misses": 2, "stale": 0}
+
+
+def test_stale_element_is_resolved_again():
+    """A command on a stale element looks the element up again and is retried."""
+    driver = FakeDriver()
+    registry = LocatorRegistry(driver, FakeWait(driver), {"file": (By.XPATH, "//input[@type='file']")})
+    element = registry.element("file", "present")
+    driver.stale_once = True
+    assert element._execute("getElementTagName")["value"] == "element-2"
+    assert registry.stats()["stale"] == 1
+
+
+def test_stale_element_is_resolved_again_when_checking_its_state():
+    """A cached element that went stale before its visibility check is looked up again and counted."""
+    driver = FakeDriver()
+    registry = LocatorRegistry(driver, FakeWait(driver), {"save": (By.XPATH, "//button")})
+    counter = Counter()
+    count_stats(counter)
+    try:
+        registry.element("save")
+        driver.stale_once = True
+        assert registry.element("save").id == "element-2"
+    finally:
+        count_stats(None)
+    assert registry.stats() == {"hits": 0, "misses": 2, "stale": 1}
+    assert counter == Counter(registry.stats())
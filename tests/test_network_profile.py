@@ -0,0 +1,76 @@
+"""
+test_network_profile.py
+
+This module contains test cases for the NetworkProfile class. CDP Network
+events are fed to it as Chrome's performance log would contain them.
+"""
+import json
+from types import SimpleNamespace
+
+from utils.network_profile import NetworkProfile, block_patterns
+
+
+def request(request_id, url):
+    return {"method": "Network.requestWillBeSent", "params": {"requestId": request_id, "request": {"url": url}}}
+
+
+def finished(request_id, size):
+    return {"method": "Network.loadingFinished", "params": {"requestId": request_id, "encodedDataLength": size}}
+
+
+class FakeDriver:
+    """Records the CDP commands sent to it and returns a prepared performance log."""
+
+    def __init__(self, events=()):
+        self.commands = []
+        self.log = [{"message": json.dumps({"message": event})} for event in events]
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+
+def test_classes_expand_to_patterns_and_are_blocked_through_cdp():
+    """Resource class names become their URL patterns, other entries are used as patterns."""
+    patterns = block_patterns(["font", "*/dist/img/*", "font"])
+    assert patterns[0] == "*.woff2*" and patterns[-1] == "*/dist/img/*"
+    assert len(patterns) == len(set(patterns))
+
+    driver = FakeDriver()
+    NetworkProfile(["avatar"]).apply(driver)
+    assert driver.commands[-1] == ("Network.setBlockedURLs", {"urls": ["*/pim/viewPhoto/*", "*/buzz/photo/*"]})
+
+
+def test_traffic_counts_downloads_blocked_and_cached_requests():
+    """Sizes learned from downloads are credited when the same resource is later blocked or cached."""
+    profile = NetworkProfile(["font"])
+    logo, font = "https://hrm.test/dist/logo.svg?v=1", "https://hrm.test/dist/font.woff2"
+    assert profile.traffic([request("1", logo), finished("1", 4000), request("2", font), finished("2", 30000)]) == {
+        "requests": 2, "bytes": 34000, "blocked": 0, "cached": 0, "bytes_saved": 0,
+    }
+    driver = FakeDriver([
+        request("3", logo + "0"),
+        {"method": "Network.requestServedFromCache", "params": {"requestId": "3"}},
+        finished("3", 0),
+        request("4", font),
+        {"method": "Network.loadingFailed", "params": {"requestId": "4", "blockedReason": "inspector"}},
+    ])
+    assert profile.collect(driver) == {"requests": 0, "bytes": 0, "blocked": 1, "cached": 1, "bytes_saved": 34000}
+
+
+def test_cache_folders_are_reused_after_their_browser_exits(tmp_path):
+    """Running browsers each get their own cache folder; sizes are kept in it for the next run."""
+    profile = NetworkProfile(cache_dir=str(tmp_path))
+    first, second = profile.cache_folder(), profile.cache_folder()
+    assert first != second
+
+    exited = SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(poll=lambda: 0)))
+    profile._cache_folders[first] = exited
+    assert profile.cache_folder() == first
+
+    profile.sizes["https://hrm.test/app.js"] = 1200
+    profile.save_sizes()
+    assert NetworkProfile(cache_dir=str(tmp_path)).sizes == {"https://hrm.test/app.js": 1200}
@@ -0,0 +1,35 @@
+"""
+test_parallel.py
+
+This module contains test cases for the scheduling helpers in utils/parallel.py.
+"""
+
+from utils.parallel import longest_first, merge_durations, worker_namespace
+
+
+class Item:
+    """Stand-in for a collected pytest item."""
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+def test_longest_first_puts_unknown_tests_first():
+    """Unknown tests go first, then known tests by descending duration."""
+    items = [Item("a"), Item("b"), Item("c"), Item("d")]
+    ordered = longest_first(items, {"a": 2.0, "b": 9.5, "d": 4.0})
+    assert [item.nodeid for item in ordered] == ["c", "b", "d", "a"]
+
+
+def test_merge_durations_blends_new_measurements():
+    """A new measurement is averaged with the recorded one."""
+    merged = merge_durations({"a": 10.0, "b": 3.0}, {"a": 20.0, "c": 1.0})
+    assert merged == {"a": 15.0, "b": 3.0, "c": 1.0}
+
+
+def test_worker_namespace_follows_xdist_worker(monkeypatch):
+    """Each xdist worker gets its own namespace."""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert worker_namespace() == "w3"
+    monkeypatch.delenv("PYTEST_XDIST_WORKER")
+    assert worker_namespace() == "w0"
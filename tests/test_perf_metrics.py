@@ -0,0 +1,110 @@
+"""
+test_perf_metrics.py
+
+This module contains test cases for the browser performance recorder and the
+baseline comparison. A fake driver returns what the collection script would.
+"""
+import time
+
+from selenium.common.exceptions import JavascriptException
+
+from utils import perf_metrics
+
+
+class FakeDriver:
+    """Returns one page load with a single XHR request, and has no CDP support."""
+
+    def __init__(self, xhr_ms=100.0):
+        self.xhr_ms = xhr_ms
+        self.scripts = 0
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        return {
+            "url": "https://hrm.test/web/index.php/pim/viewEmployeeList",
+            "navigation": {"ttfb_ms": 120.0, "dom_content_loaded_ms": 400.0, "load_ms": 650.0, "transfer_bytes": 900},
+            "resources": {"count": 2, "transfer_bytes": 5000},
+            "xhr": [{"url": "https://hrm.test/web/index.php/api/v2/pim/employees/7/personal-details?x=1",
+                     "duration_ms": self.xhr_ms}],
+            "longTasks": [60.0, 70.0],
+        }
+
+
+def test_checkpoints_do_nothing_when_recording_is_off():
+    """Page objects can call the hooks unconditionally."""
+    driver = FakeDriver()
+    perf_metrics.perf_checkpoint(driver, "save_toast")
+    with perf_metrics.perf_transition(driver, "login"):
+        pass
+    assert driver.scripts == 0
+
+
+def test_checkpoint_records_sample_for_current_test():
+    """A checkpoint stores the page metrics under the label and test."""
+    recorder = perf_metrics.PerfRecorder()
+    perf_metrics.activate(recorder)
+    try:
+        recorder.start_test("test_add_employee")
+        perf_metrics.perf_checkpoint(FakeDriver(), "save_toast")
+    finally:
+        perf_metrics.deactivate()
+    sample, = recorder.samples
+    assert sample["test"] == "test_add_employee"
+    assert sample["long_tasks"] == {"count": 2, "total_ms": 130.0}
+    assert sample["cdp"] == {}
+
+
+class RejectedActionDriver(FakeDriver):
+    """Stays on the same document after the action and shows the outcomes it is asked about."""
+
+    def __init__(self):
+        super().__init__()
+        self.checked_outcomes = []
+
+    def execute_script(self, script, *args):
+        if script == "return performance.timeOrigin;":
+            return 1000.0
+        if script == perf_metrics._ACTION_DONE_JS:
+            previous_origin, pairs = args
+            self.checked_outcomes.append(pairs)
+            return bool(pairs)  # No new document; the field message is on screen
+        return super().execute_script(script, *args)
+
+    def execute_async_script(self, script, *args):
+        raise JavascriptException("not supported")  # The wait polls instead
+
+
+def test_transition_ends_when_the_action_shows_an_outcome():
+    """An action that stays on the page is recorded once it shows an outcome, not after navigation_timeout."""
+    recorder = perf_metrics.PerfRecorder(navigation_timeout=15)
+    driver = RejectedActionDriver()
+    started = time.monotonic()
+    with recorder.transition(driver, "login", {"success": ".header", "validation": ".field-error"}):
+        pass
+    assert time.monotonic() - started < 1
+    assert driver.checked_outcomes == [[["success", ".header", False], ["validation", ".field-error", True]]]
+    assert [sample["label"] for sample in recorder.samples] == ["login"]
+
+
+def test_summary_groups_xhr_paths_and_takes_medians():
+    """Numeric path segments share one metric, and each metric is reduced to its median."""
+    recorder = perf_metrics.PerfRecorder()
+    for xhr_ms in (100.0, 300.0, 200.0):
+        recorder.checkpoint(FakeDriver(xhr_ms), "pim_list")
+    summary = perf_metrics.summarize(recorder.samples)
+    assert summary["xhr /web/index.php/api/v2/pim/employees/{id}/personal-details"] == {"median": 200.0, "count": 3}
+    assert summary["pim_list.load_ms"]["median"] == 650.0
+
+
+def test_compare_reports_only_significant_latency_regressions(tmp_path):
+    """Slowdowns above the threshold and the noise floor are regressions; sizes are ignored."""
+    baseline = {"login.load_ms": {"median": 500.0, "count": 1}, "xhr /a": {"median": 100.0, "count": 1},
+                "login.resource_bytes": {"median": 1000, "count": 1}, "xhr /b": {"median": 10.0, "count": 1}}
+    current = {"login.load_ms": {"median": 800.0, "count": 1}, "xhr /a": {"median": 110.0, "count": 1},
+               "login.resource_bytes": {"median": 5000, "count": 1}, "xhr /b": {"median": 40.0, "count": 1}}
+    regressions = perf_metrics.compare(baseline, current, threshold=0.2, min_delta_ms=50)
+    assert [regression["metric"] for regression in regressions] == ["login.load_ms"]
+
+    path = perf_metrics.write_summary(str(tmp_path / "baseline.json"), baseline)
+    assert perf_metrics.load_summary(path) == baseline
+    assert perf_metrics.load_summary(str(tmp_path / "missing.json")) is None
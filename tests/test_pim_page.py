@@ -0,0 +1,122 @@
+"""
+test_pim_page.py
+
+This module contains behaviour tests for the batch and employee list methods of
+PIMPage: adding and deleting several employees, paging through the list,
+finding and opening employees by ID, reporting a duplicate ID shown while it is
+typed, and keeping the employee index in step with changes made through the UI
+and the API.
+
+They need a browser and the stand-in server, whose list shows 50 employees per
+page like Orange HRM: run them with `pytest tests/test_pim_page.py --stand-in`.
+"""
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from data.data_generators import generate_random_employee_id, generate_random_name
+from pages.pim_page import VALIDATION_MESSAGE, PIMPage
+
+
+# Skipped before any fixture (and browser) is set up unless the suite runs against the stand-in server
+pytestmark = pytest.mark.skipif(
+    "not config.getoption('--stand-in')", reason="needs the stand-in server, run with --stand-in"
+)
+
+
+@pytest.fixture
+def pim_page(logged_in_driver):
+    """Returns a PIMPage on the employee list of the stand-in server."""
+    page = PIMPage(logged_in_driver)
+    page.navigate_to_pim()
+    return page
+
+
+def new_employees(employee_api, worker_namespace, count):
+    """Creates employees of this worker through the API and returns their employee IDs."""
+    records = []
+    for _ in range(count):
+        first_name, middle_name, last_name = generate_random_name()
+        records.append({
+            "first_name": first_name,
+            "middle_name": f"{middle_name} {worker_namespace}",
+            "last_name": last_name,
+            "employee_id": generate_random_employee_id(),
+        })
+    return [employee["employeeId"] for employee in employee_api.create_employees(records)]
+
+
+def test_pages_are_read_in_order_and_indexed(pim_page, employee_api, worker_namespace):
+    """Every page of a list longer than one page is read once, and employees on later pages are found."""
+    employee_ids = new_employees(employee_api, worker_namespace, 55)
+    pim_page.navigate_to_pim()  # Show the list with the new employees
+
+    pages = list(pim_page.iter_employee_pages())
+    assert [page for page, _ in pages] == list(range(1, len(pages) + 1))
+    assert len(pages) >= 2
+    listed = [row["employee_id"] for _, rows in pages for row in rows]
+    assert len(listed) == len(set(listed))
+    assert set(employee_ids) <= set(listed)
+
+    last_id = employee_ids[-1]
+    assert pim_page.find_employee(last_id)["employee_id"] == last_id
+    pim_page.open_employee(last_id)
+    assert "viewPersonalDetails" in pim_page.driver.current_url
+
+
+def test_missing_employee_is_not_found(pim_page):
+    """An ID that is not listed is reported as missing, and opening it raises ValueError."""
+    assert pim_page.find_employee("NO-SUCH-ID") is None
+    assert pim_page.employee_index.complete
+    with pytest.raises(ValueError, match="NO-SUCH-ID"):
+        pim_page.open_employee("NO-SUCH-ID")
+
+
+def test_index_is_refreshed_after_changes(pim_page, employee_api, worker_namespace):
+    """Employees created through the API after the whole list was indexed are found once the list is opened again."""
+    assert pim_page.find_employee("NO-SUCH-ID") is None  # The whole list is now indexed
+    employee_id, = new_employees(employee_api, worker_namespace, 1)
+    pim_page.navigate_to_pim()
+    assert pim_page.find_employee(employee_id)["employee_id"] == employee_id
+
+    pim_page.delete_employees([employee_id])
+    assert pim_page.find_employee(employee_id) is None
+
+
+def test_batch_add_reports_each_outcome_and_batch_delete_removes_them(pim_page, employee_api, worker_namespace):
+    """A save the application rejects is reported as such, and the saved employees are deleted together."""
+    employees = []
+    for _ in range(2):
+        first_name, middle_name, last_name = generate_random_name()
+        employees.append({"first_name": first_name, "middle_name": f"{middle_name} {worker_namespace}",
+                          "last_name": last_name, "employee_id": generate_random_employee_id()})
+    employees.append(dict(employees[0], first_name="Duplicate"))  # Same employee ID as the first one
+    for employee in employees:
+        employee_api.track(employee["employee_id"])
+
+    results = pim_page.add_employees(employees)
+    assert [result["outcome"] for result in results] == ["success", "success", "validation"]
+    assert results[2]["message"] == "Employee Id already exists"
+
+    saved = [employee["employee_id"] for employee in employees[:2]]
+    pim_page.navigate_to_pim()
+    assert sorted(pim_page.delete_employees(saved)) == sorted(saved)
+    assert all(pim_page.find_employee(employee_id) is None for employee_id in saved)
+    with pytest.raises(ValueError, match=saved[0]):
+        pim_page.delete_employees(saved[:1])
+
+
+def test_duplicate_id_shown_while_typing_is_the_outcome_of_the_save(pim_page, employee_api, worker_namespace):
+    """The "Employee Id already exists" message shown before Save is clicked is reported at once as a validation."""
+    employee_id, = new_employees(employee_api, worker_namespace, 1)
+    pim_page.click_add_employee()
+    pim_page.enter_employee_details("Dup", worker_namespace, "Licate", employee_id)
+    pim_page.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, VALIDATION_MESSAGE)))  # Before saving
+
+    started = time.monotonic()
+    pim_page.click_save()
+    assert pim_page.get_toast_message() == "Employee Id already exists"
+    assert pim_page.last_outcome == "validation"
+    assert time.monotonic() - started < 5  # Not the 20 s timeout of the wait
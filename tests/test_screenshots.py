@@ -0,0 +1,84 @@
+"""
+test_screenshots.py
+
+This module contains test cases for the background ScreenshotWriter.
+"""
+
+import os
+import sys
+
+import pytest
+
+from utils.screenshots import ScreenshotWriter
+
+
+class FakeDriver:
+    """Returns the frames given to it, one per screenshot."""
+
+    def __init__(self, *frames):
+        self.frames = list(frames)
+
+    def get_screenshot_as_png(self):
+        return self.frames.pop(0)
+
+
+def test_identical_frames_are_written_once(tmp_path):
+    """Frames with the same content are deduplicated and names never collide."""
+    writer = ScreenshotWriter(str(tmp_path), mode="always")
+    driver = FakeDriver(b"frame-a", b"frame-a", b"frame-b")
+    for _ in range(3):
+        writer.capture(driver, "login_success", "test_login")
+    writer.close()
+    assert len(writer.saved) == 2
+    assert writer.skipped_duplicates == 1
+    assert len(set(os.listdir(tmp_path))) == 2
+
+
+def test_on_failure_mode_only_writes_failed_tests(tmp_path):
+    """Frames of a passing test are dropped, frames of a failing test are written."""
+    writer = ScreenshotWriter(str(tmp_path), mode="on-failure")
+    writer.capture(FakeDriver(b"passed"), "step", "test_passes")
+    writer.finish_test("test_passes", failed=False)
+    writer.capture(FakeDriver(b"failed"), "step", "test_fails")
+    writer.finish_test("test_fails", failed=True)
+    writer.close()
+    assert len(writer.saved) == 1
+    assert "test_fails" in writer.saved[0]
+
+
+def test_reruns_do_not_overwrite_earlier_screenshots(tmp_path):
+    """The run id is part of every file name, so the same capture in two runs gives two files."""
+    for run_id in ("20240101-090000", "20240101-100000"):
+        writer = ScreenshotWriter(str(tmp_path), mode="always", run_id=run_id)
+        writer.capture(FakeDriver(b"frame"), "login_success", "test_login")
+        writer.close()
+        assert run_id in os.path.basename(writer.saved[0])
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_failed_saves_are_kept_for_the_report(tmp_path):
+    """A frame that cannot be written is returned once by pop_failures() and the writer keeps going."""
+    blocked = tmp_path / "not-a-folder"
+    blocked.write_text("")
+    writer = ScreenshotWriter(str(blocked), mode="always", run_id="run1")
+    writer.capture(FakeDriver(b"frame"), "login_success", "test_login")
+    writer.flush()
+    (name, error), = writer.pop_failures()
+    assert name.startswith("login_success_run1_") and "test_login" in name
+    assert isinstance(error, OSError)
+    assert writer.pop_failures() == []
+
+    writer.directory = str(tmp_path / "screenshots")
+    writer.capture(FakeDriver(b"other"), "login_success", "test_login")
+    writer.close()
+    assert len(writer.saved) == 1
+
+
+def test_jpeg_quality_without_pillow_warns_and_keeps_png(tmp_path, monkeypatch):
+    """A JPEG quality that cannot be applied is reported when the writer is created, not ignored."""
+    monkeypatch.setitem(sys.modules, "PIL", None)  # Makes `import PIL` fail
+    with pytest.warns(RuntimeWarning, match="Pillow is not installed"):
+        writer = ScreenshotWriter(str(tmp_path), mode="always", jpeg_quality=70)
+    writer.capture(FakeDriver(b"frame"), "login_success", "test_login")
+    writer.close()
+    assert writer.jpeg_quality is None and writer.saved[0].endswith(".png")
@@ -0,0 +1,88 @@
+"""
+test_stand_in_server.py
+
+This module contains test cases for the local Orange HRM stand-in server. They
+talk to it over HTTP with requests, like the frontend and the API client do.
+"""
+import json
+import time
+
+import pytest
+import requests
+
+from utils.stand_in_server import StandInServer
+
+API = "web/index.php/api/v2/pim/employees"
+
+
+@pytest.fixture
+def server():
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+def login(server, password="admin123"):
+    session = requests.Session()
+    session.post(server.url + "web/index.php/auth/validate", data={"username": "Admin", "password": password})
+    return session
+
+
+def test_login_requires_valid_credentials(server):
+    """Wrong credentials show the alert on the login page; valid ones open the dashboard."""
+    rejected = login(server, password="wrong")
+    page = rejected.get(server.url + "web/index.php/dashboard/index")
+    assert page.url.endswith("/auth/login")
+    assert rejected.get(server.url + API).status_code == 401
+
+    session = login(server)
+    page = session.get(server.url + "web/index.php/pim/viewPimModule")
+    assert page.url.endswith("/pim/viewEmployeeList")
+    assert "oxd-table" in page.text
+
+
+def test_employee_crud_is_deterministic(server):
+    """Employees get numbers and IDs in order, and are found, updated and deleted through the API."""
+    session = login(server)
+    created = session.post(server.url + API, json={"firstName": "Ann", "middleName": "", "lastName": "Lee",
+                                                   "employeeId": ""}).json()["data"]
+    assert created["empNumber"] == 4
+    details = f"{server.url}{API}/{created['empNumber']}/personal-details"
+    updated = session.put(details, json={"firstName": "Ann", "lastName": "Park", "nationalityId": 1, "gender": 2})
+    assert updated.json()["data"]["nationality"]["id"] == 1
+    found = session.get(server.url + API, params={"nameOrId": "Park"}).json()
+    assert [employee["empNumber"] for employee in found["data"]] == [4]
+    assert session.delete(server.url + API, json={"ids": [4]}).json()["data"] == [4]
+
+    session.post(server.url + "__stand-in/reset")  # Also ends every session
+    assert login(server).get(server.url + API).json()["meta"]["total"] == 3
+
+
+def test_invalid_employee_returns_validation_messages(server):
+    """Missing names, taken IDs and oversized pictures give the messages the application shows."""
+    session = login(server)
+    response = session.post(server.url + API, json={
+        "firstName": "", "lastName": "Lee", "employeeId": "0001",
+        "empPicture": {"name": "big.jpg", "type": "image/jpeg", "size": 2 * 1024 * 1024, "base64": ""},
+    })
+    assert response.status_code == 422
+    assert response.json()["error"]["data"]["invalidParamKeys"] == {
+        "firstName": "Required", "employeeId": "Employee Id already exists", "empPicture": "Attachment Size Exceeded",
+    }
+
+
+def test_latency_and_recorded_responses(tmp_path):
+    """Injected latency applies per kind of request, and unknown URLs are replayed from the HAR file."""
+    har = {"log": {"entries": [{
+        "request": {"method": "GET", "url": "https://demo.test/web/dist/img/orangehrm-logo.svg?v=1"},
+        "response": {"status": 200, "headers": [{"name": "Content-Type", "value": "image/svg+xml"}],
+                     "content": {"text": "<svg/>"}},
+    }]}}
+    recording = tmp_path / "session.har"
+    recording.write_text(json.dumps(har))
+    with StandInServer(latency={"replay": 0.2}, recording=str(recording)) as server:
+        start = time.perf_counter()
+        response = requests.get(server.url + "web/dist/img/orangehrm-logo.svg?v=2")
+        assert time.perf_counter() - start >= 0.2
+        assert response.text == "<svg/>"
+        assert response.headers["Content-Type"] == "image/svg+xml"
+        assert requests.get(server.url + "web/index.php/not/recorded").status_code == 404
@@ -0,0 +1,72 @@
+"""
+test_steps.py
+
+This module contains test cases for the flow runners shared by the synchronous
+and the async page objects. Plain functions and coroutines stand in for the
+driver calls.
+"""
+import asyncio
+
+import pytest
+
+from utils.steps import run_async_steps, run_steps
+
+
+def greeting_flow(page, log):
+    """Flow that uses the result of one call in the next, and notes whether its calls failed."""
+    try:
+        name = yield page.read_name()
+        yield page.write(f"Hello {name}")
+    except LookupError as e:
+        log.append(f"failed: {e}")
+        raise
+    return "done"
+
+
+class SyncPage:
+    def __init__(self, name=None):
+        self.name = name
+        self.written = []
+
+    def read_name(self):
+        if self.name is None:
+            raise LookupError("no name")
+        return self.name
+
+    def write(self, text):
+        self.written.append(text)
+
+
+class AsyncPage(SyncPage):
+    async def read_name(self):
+        await asyncio.sleep(0)
+        return super().read_name()
+
+    async def write(self, text):
+        super().write(text)
+
+
+def test_sync_flow_gets_the_results_of_its_calls():
+    """Each call result is sent back into the flow, and the flow's return value is returned."""
+    page = SyncPage("Ann")
+    assert run_steps(greeting_flow(page, [])) == "done"
+    assert page.written == ["Hello Ann"]
+
+
+def test_async_flow_awaits_its_calls_and_sees_their_exceptions():
+    """Coroutines are awaited, and an exception they raise is raised inside the flow at the yield."""
+    page = AsyncPage("Bob")
+    assert asyncio.run(run_async_steps(greeting_flow(page, []))) == "done"
+    assert page.written == ["Hello Bob"]
+
+    log = []
+    with pytest.raises(LookupError, match="no name"):
+        asyncio.run(run_async_steps(greeting_flow(AsyncPage(), log)))
+    assert log == ["failed: no name"]
+
+
+def test_async_runner_accepts_synchronous_calls():
+    """Values that cannot be awaited, such as the result of a synchronous helper, are sent back as they are."""
+    page = SyncPage("Cy")
+    assert asyncio.run(run_async_steps(greeting_flow(page, []))) == "done"
+    assert page.written == ["Hello Cy"]
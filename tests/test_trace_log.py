@@ -0,0 +1,61 @@
+"""
+test_trace_log.py
+
+This module contains test cases for the step trace log: the bounded buffer,
+the redaction of secrets and writing the trace only for failed tests.
+"""
+import json
+
+from utils import trace_log
+
+
+def recorded(capacity, events):
+    log = trace_log.TraceLog(capacity)
+    trace_log.activate(log)
+    try:
+        log.start_test("tests/test_pages.py::test_add_employee")
+        for event, fields in events:
+            trace_log.trace(event, **fields)
+    finally:
+        trace_log.deactivate()
+    return log
+
+
+def test_buffer_keeps_the_last_events_and_tracing_is_off_by_default(tmp_path):
+    """Only the newest events of a test are kept; without an active log trace() records nothing."""
+    trace_log.trace("pim.save")  # Nothing active, nothing recorded
+    log = recorded(3, [("pim.field", {"field": "first_name", "value": str(number)}) for number in range(10)])
+    assert [event["fields"]["value"] for event in log.events()] == ["7", "8", "9"]
+
+    path = log.flush(str(tmp_path / "main.jsonl"))
+    header, *events = [json.loads(line) for line in open(path)]
+    assert header == {"test": "tests/test_pages.py::test_add_employee", "events": 3, "dropped": 7}
+    assert [event["event"] for event in events] == ["pim.field"] * 3
+    assert log.events() == []  # Flushing empties the buffer
+
+
+def test_secrets_are_redacted_wherever_they_appear():
+    """A secret field is masked, and so is its value inside the other fields of the test."""
+    log = recorded(10, [
+        ("login.username", {"username": "Admin"}),
+        ("pim.employee_details", {"entered": ["Admin", "s3cret!"]}),
+        ("login.password", {"password": "s3cret!"}),
+        ("api.request", {"headers": {"Cookie": "orangehrm=abc"}, "message": "token orangehrm=abc expired"}),
+    ])
+    log.add_secret("Admin")
+    fields = [event["fields"] for event in log.events()]
+    assert fields == [
+        {"username": "***"},
+        {"entered": ["***", "***"]},
+        {"password": "***"},
+        {"headers": {"Cookie": "***"}, "message": "token *** expired"},
+    ]
+
+
+def test_passed_tests_write_nothing(tmp_path):
+    """Discarding the trace of a passed test touches no file; the next test starts with an empty buffer."""
+    log = recorded(10, [("login.submit", {})])
+    log.discard()
+    assert not list(tmp_path.iterdir())
+    assert log.flush(str(tmp_path / "main.jsonl")) is None
+    assert not list(tmp_path.iterdir())
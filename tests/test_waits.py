@@ -0,0 +1,197 @@
+"""
+test_waits.py
+
+This module contains test cases for the EventWait class. A fake driver stands in
+for the browser and counts how the wait re-checks its condition.
+
+The page-watcher scripts themselves run in Node.js, when it is installed,
+against a minimal fake document.
+"""
+import json
+import shutil
+import subprocess
+import time
+
+import pytest
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
+
+from pages.waits import (
+    EventWait, budget_remaining, clear_time_budget, latched_selectors, outcome_appeared, start_time_budget
+)
+
+
+NODE = shutil.which("node")
+
+# Runs each script sent on stdin against a fake document whose elements are {selector, innerText} records;
+# document.add() appends one and notifies the MutationObservers, like the application showing a toast.
+# Elements are visible unless added with visible=false
+_FAKE_DOCUMENT_JS = r"""
+globalThis.window = globalThis;
+const observers = [];
+globalThis.MutationObserver = class {
+    constructor(callback) { this.callback = callback; observers.push(this); }
+    observe() {}
+};
+const nodes = [];
+globalThis.document = {
+    querySelectorAll: selector => nodes.filter(node => node.selector === selector),
+    querySelector: selector => nodes.find(node => node.selector === selector) || null,
+    add: (selector, text, visible = true) => {
+        nodes.push({selector, innerText: text, getClientRects: () => (visible ? [{}] : [])});
+        observers.forEach(o => o.callback([]));
+    },
+};
+require('readline').createInterface({input: process.stdin}).on('line', line => {
+    const {script, args} = JSON.parse(line);
+    let reply;
+    try {
+        const result = Function(script).apply(null, args);
+        reply = {result: result === undefined ? null : result};
+    } catch (e) {
+        reply = {error: String(e)};
+    }
+    process.stdout.write(JSON.stringify(reply) + '\n');
+});
+"""
+
+
+class FakeDriver:
+    """Returns immediately from the change-watching script, like a page that keeps changing."""
+
+    def __init__(self, fail_scripts=False):
+        self.fail_scripts = fail_scripts
+        self.async_calls = 0
+
+    def execute_async_script(self, script, last_seen, max_wait_ms):
+        self.async_calls += 1
+        if self.fail_scripts:
+            raise JavascriptException("document unloaded")
+        return (last_seen or 0) + 1
+
+
+class NodeDriver:
+    """Runs the synchronous scripts of the wait in Node.js; the change-watching script is not available."""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [NODE, "-e", _FAKE_DOCUMENT_JS], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+
+    def execute_script(self, script, *args):
+        self.process.stdin.write(json.dumps({"script": script, "args": list(args)}) + "\n")
+        self.process.stdin.flush()
+        reply = json.loads(self.process.stdout.readline())
+        if "error" in reply:
+            raise JavascriptException(reply["error"])
+        return reply["result"]
+
+    def execute_async_script(self, script, *args):
+        raise JavascriptException("not supported")  # The wait polls instead
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+@pytest.fixture
+def node_driver():
+    if NODE is None:
+        pytest.skip("needs Node.js to run the page scripts")
+    driver = NodeDriver()
+    yield driver
+    driver.close()
+
+
+def condition_true_after(checks):
+    """Returns a condition that is false for the given number of checks."""
+    calls = {"count": 0}
+
+    def condition(driver):
+        calls["count"] += 1
+        if calls["count"] <= checks:
+            raise NoSuchElementException("not yet")
+        return "ready"
+
+    return condition
+
+
+def test_until_returns_when_dom_changes():
+    """The condition is re-checked after each DOM change and its value returned."""
+    driver = FakeDriver()
+    assert EventWait(driver, 5).until(condition_true_after(3)) == "ready"
+    assert driver.async_calls == 3
+
+
+def test_until_falls_back_to_polling():
+    """A page where the watcher cannot run is polled instead."""
+    driver = FakeDriver(fail_scripts=True)
+    assert EventWait(driver, 5, poll_frequency=0.01).until(condition_true_after(2)) == "ready"
+
+
+def test_until_times_out_with_message():
+    """A condition that never holds raises TimeoutException after the timeout."""
+    with pytest.raises(TimeoutException, match="never"):
+        EventWait(FakeDriver(), 0.05).until(lambda driver: False, "never")
+
+
+def test_until_not_returns_true_when_condition_fails():
+    """until_not treats an ignored exception as the condition being false."""
+    assert EventWait(FakeDriver(), 1).until_not(condition_true_after(1)) is True
+
+
+def test_outcome_appeared_returns_first_signal_and_ignores_navigation():
+    """The first outcome the page reports is returned; a page being replaced counts as no outcome yet."""
+    class OutcomeDriver(FakeDriver):
+        def __init__(self):
+            super().__init__()
+            self.results = [JavascriptException("document unloaded"), None, ["validation", "Required"]]
+
+        def execute_script(self, script, outcomes):
+            result = self.results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    outcomes = {"success": ".toast--success", "validation": ".field-error"}
+    assert EventWait(OutcomeDriver(), 5).until(outcome_appeared(outcomes)) == ("validation", "Required")
+
+
+def test_time_budget_shortens_waits():
+    """A wait ends when the test's time budget runs out, even if its own timeout is longer."""
+    start_time_budget(0.05)
+    try:
+        started = time.monotonic()
+        with pytest.raises(TimeoutException, match="budget exhausted"):
+            EventWait(FakeDriver(), 20).until(lambda driver: False, "never")
+        assert time.monotonic() - started < 1
+    finally:
+        clear_time_budget()
+    assert budget_remaining() is None
+
+
+def test_arming_ignores_a_toast_that_is_already_on_screen(node_driver):
+    """The toast of the previous save is not taken for the outcome of the next one; a new toast is."""
+    outcomes = {"success": ".toast--success", "error": ".toast--error"}
+    node_driver.execute_script("document.add('.toast--success', 'Successfully Saved')")
+    wait = EventWait(node_driver, 0.2, poll_frequency=0.01)
+    wait.arm(*outcomes.values())
+    with pytest.raises(TimeoutException):
+        wait.until(outcome_appeared(outcomes))
+    node_driver.execute_script("document.add('.toast--error', 'Failed to Save')")
+    assert wait.until(outcome_appeared(outcomes)) == ("error", "Failed to Save")
+
+    wait.arm(*outcomes.values())  # Both toasts are still on screen
+    node_driver.execute_script("document.add('.toast--success', 'Successfully Updated')")
+    assert wait.until(outcome_appeared(outcomes)) == ("success", "Successfully Updated")
+
+
+def test_validation_message_shown_before_the_action_is_its_outcome(node_driver):
+    """A field message shown while the form was filled in is reported at once; hidden ones are not outcomes."""
+    outcomes = {"success": ".toast--success", "validation": ".field-error"}
+    node_driver.execute_script("document.add('.field-error', 'Hidden', false)")
+    node_driver.execute_script("document.add('.toast--success', 'Successfully Saved')")  # Of the previous save
+    node_driver.execute_script("document.add('.field-error', 'Employee Id already exists')")  # Shown while typing
+    wait = EventWait(node_driver, 0.2, poll_frequency=0.01)
+    wait.arm(*latched_selectors(outcomes))
+    assert latched_selectors(outcomes) == [".toast--success"]
+    assert wait.until(outcome_appeared(outcomes)) == ("validation", "Employee Id already exists")
@@ -0,0 +1,251 @@
+"""
+api_client.py
+
+This module defines the OrangeHRMApi class, which creates, updates and deletes
+employees through the REST endpoints the Orange HRM frontend itself uses. Tests
+use it to prepare and clean up their data in milliseconds, so the browser is
+only needed for the UI step actually under test.
+
+The client reuses the cookies of an authenticated browser session (see
+AuthSession), or logs in itself through the login form endpoint, on pooled
+keep-alive HTTP sessions (one per thread, as requests sessions are not
+thread-safe). When the session expires it logs in again the same way, so it
+never needs a browser. It remembers every employee it created so they can all
+be removed with one call at the end of the run.
+
+Usage:
+    api = OrangeHRMApi.from_auth_session(auth_session)
+    api.login("Admin", "admin123")  # Only needed if the AuthSession has not logged in
+    employee = api.create_employee("Alice", "Lee", "Smith", "00012345")
+    api.update_personal_details(employee["empNumber"], drivingLicenseNo="DL00012345")
+    api.cleanup()
+"""
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+EMPLOYEES_PATH = "web/index.php/api/v2/pim/employees"
+LOGIN_PATH = "web/index.php/auth/login"
+VALIDATE_PATH = "web/index.php/auth/validate"
+
+# CSRF token of the login form: a prop of the login component, or a hidden input
+_LOGIN_TOKEN = re.compile(r':token="&quot;([^&"]+)&quot;"|name="_token"[^>]*value="([^"]+)"')
+
+
+class OrangeHRMApiError(Exception):
+    """Raised when an Orange HRM API call does not succeed."""
+
+    def __init__(self, response):
+        self.status_code = response.status_code
+        super().__init__(f"{response.request.method} {response.url} failed with {response.status_code}: {response.text[:200]}")
+
+
+class OrangeHRMLoginError(Exception):
+    """Raised when logging in through the login form endpoint fails."""
+
+
+class OrangeHRMApi:
+    """Pooled HTTP client for the employee endpoints of the Orange HRM API."""
+
+    def __init__(self, base_url, cookies, pool_size=10, timeout=15, reauthenticate=None):
+        """Initializes the client.
+        Args:
+            base_url: Root URL of the application.
+            cookies: Cookies of a logged-in browser session, as returned by driver.get_cookies().
+            pool_size: Number of keep-alive connections kept open per thread.
+            timeout: Seconds before a request is abandoned.
+            reauthenticate: Optional callable returning fresh cookies when the session has expired.
+        """
+        self.base_url = base_url.rstrip("/") + "/"
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.reauthenticate = reauthenticate
+        self.created = {}  # empNumber -> employeeId of every employee created or tracked by this client
+        self._tracked_ids = set()  # Employee IDs created through the UI, resolved at cleanup
+        self._lock = threading.Lock()
+        self._local = threading.local()  # HTTP session of each thread
+        self._sessions = []  # Every thread's session, closed together
+        self._cookies = []
+        self._cookies_version = 0  # Changed by set_cookies(), so each thread's session picks the cookies up
+        self.set_cookies(cookies)
+
+    @classmethod
+    def from_auth_session(cls, auth_session, **kwargs):
+        """Builds a client from the cookies of an AuthSession.
+
+        Unless another reauthenticate callable is given, the client logs in again with the
+        credentials of the AuthSession when its session expires.
+        """
+        api = cls(auth_session.base_url, auth_session.cookies, **kwargs)
+        if api.reauthenticate is None:
+            api.reauthenticate = lambda: api.login(auth_session.username, auth_session.password)
+        return api
+
+    @property
+    def session(self):
+        """Returns the keep-alive HTTP session of the calling thread, with the current cookies."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
+            self._local.session = session
+            self._local.cookies_version = None
+            with self._lock:
+                self._sessions.append(session)
+        if self._local.cookies_version != self._cookies_version:
+            with self._lock:
+                cookies, self._local.cookies_version = self._cookies, self._cookies_version
+            session.cookies.clear()
+            for cookie in cookies:
+                session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        return session
+
+    def set_cookies(self, cookies):
+        """Replaces the session cookies of every thread with the given browser cookies."""
+        with self._lock:
+            self._cookies = [dict(cookie) for cookie in cookies]
+            self._cookies_version += 1
+
+    def login(self, username, password):
+        """Logs in through the endpoint of the login form, without a browser, and uses the new session cookies.
+        Returns:
+            list: The session cookies, in the format of driver.get_cookies().
+        Raises:
+            OrangeHRMLoginError: If the application shows the login form again.
+        """
+        session = requests.Session()  # Starts without the expired cookies
+        try:
+            form = session.get(self.base_url + LOGIN_PATH, timeout=self.timeout)
+            match = _LOGIN_TOKEN.search(form.text)
+            data = {"username": username, "password": password}
+            if match:
+                data["_token"] = match.group(1) or match.group(2)
+            response = session.post(self.base_url + VALIDATE_PATH, data=data, timeout=self.timeout)
+            if "/auth/login" in response.url:
+                raise OrangeHRMLoginError(f"Could not log in to {self.base_url} as {username}")
+            cookies = [{"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path}
+                       for cookie in session.cookies]
+        finally:
+            session.close()
+        self.set_cookies(cookies)
+        return cookies
+
+    def _request(self, method, path, **kwargs):
+        """Sends one request, logging in again once if the session has expired."""
+        url = self.base_url + path
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        if response.status_code == 401 and self.reauthenticate is not None:
+            self.set_cookies(self.reauthenticate())
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        if not response.ok:
+            raise OrangeHRMApiError(response)
+        return response.json().get("data")
+
+    def create_employee(self, first_name, middle_name, last_name, employee_id):
+        """Creates an employee and returns its data, including the empNumber."""
+        employee = self._request("POST", EMPLOYEES_PATH, json={
+            "firstName": first_name,
+            "middleName": middle_name,
+            "lastName": last_name,
+            "employeeId": str(employee_id),
+            "empPicture": None,
+        })
+        with self._lock:
+            self.created[employee["empNumber"]] = employee["employeeId"]
+        return employee
+
+    def create_employees(self, records, max_workers=4):
+        """Creates several employees over parallel pooled connections.
+        Args:
+            records: Dicts with first_name, middle_name, last_name and employee_id.
+            max_workers: Number of requests in flight at once.
+        Returns:
+            list: The created employees, in the order of records.
+        """
+        def create(record):
+            return self.create_employee(record["first_name"], record["middle_name"], record["last_name"], record["employee_id"])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(create, records))
+
+    def get_personal_details(self, emp_number):
+        """Returns the personal details of an employee."""
+        return self._request("GET", f"{EMPLOYEES_PATH}/{emp_number}/personal-details")
+
+    def update_personal_details(self, emp_number, **fields):
+        """Updates personal details, keeping the fields that are not given.
+        Args:
+            emp_number: Internal number of the employee.
+            fields: API field names and new values, e.g. drivingLicenseNo="DL123", birthday="2002-01-01".
+        """
+        current = self.get_personal_details(emp_number)
+        details = {
+            "firstName": current.get("firstName"),
+            "middleName": current.get("middleName"),
+            "lastName": current.get("lastName"),
+            "employeeId": current.get("employeeId"),
+            "otherId": current.get("otherId"),
+            "drivingLicenseNo": current.get("drivingLicenseNo"),
+            "drivingLicenseExpiredDate": current.get("drivingLicenseExpiredDate"),
+            "gender": current.get("gender"),
+            "maritalStatus": current.get("maritalStatus"),
+            "birthday": current.get("birthday"),
+            "nationalityId": (current.get("nationality") or {}).get("id"),
+        }
+        details.update(fields)
+        return self._request("PUT", f"{EMPLOYEES_PATH}/{emp_number}/personal-details", json=details)
+
+    def find_employees(self, name_or_id, limit=50):
+        """Returns the employees whose name or ID matches."""
+        return self._request("GET", EMPLOYEES_PATH, params={"nameOrId": name_or_id, "limit": limit, "offset": 0}) or []
+
+    def delete_employees(self, emp_numbers):
+        """Deletes several employees with one request."""
+        emp_numbers = list(emp_numbers)
+        if not emp_numbers:
+            return []
+        deleted = self._request("DELETE", EMPLOYEES_PATH, json={"ids": emp_numbers})
+        with self._lock:
+            for emp_number in emp_numbers:
+                self.created.pop(emp_number, None)
+        return deleted
+
+    def track(self, employee_id):
+        """Registers an employee created some other way (e.g. through the UI) for cleanup."""
+        with self._lock:
+            self._tracked_ids.add(str(employee_id))
+
+    def _resolve_tracked(self):
+        """Looks up the empNumber of every tracked employee ID that still exists."""
+        for employee_id in list(self._tracked_ids):
+            for employee in self.find_employees(employee_id):
+                if employee.get("employeeId") == employee_id:
+                    self.created[employee["empNumber"]] = employee_id
+        self._tracked_ids.clear()
+
+    def cleanup(self):
+        """Deletes every employee this client created or tracked that still exists."""
+        self._resolve_tracked()
+        emp_numbers = list(self.created)
+        try:
+            self.delete_employees(emp_numbers)
+        except OrangeHRMApiError:
+            # Some were already deleted (e.g. by a delete test): remove the rest one by one
+            for emp_number in emp_numbers:
+                try:
+                    self.delete_employees([emp_number])
+                except OrangeHRMApiError:
+                    self.created.pop(emp_number, None)
+
+    def close(self):
+        """Closes the pooled connections of every thread."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
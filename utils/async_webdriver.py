@@ -0,0 +1,375 @@
+"""
+async_webdriver.py
+
+This module defines a small asyncio client for the W3C WebDriver protocol, so
+one Python process can drive dozens of browser sessions at once without a
+thread per browser.
+
+Every AsyncWebDriver talks to the driver server (chromedriver) over its own
+pool of keep-alive HTTP/1.1 connections, opened with asyncio streams: a
+command is one request on an already open socket, and while one session waits
+for its browser the event loop serves the others. One ChromeDriverServer hosts
+all the sessions, instead of one chromedriver per Selenium WebDriver.
+
+Errors reported by the driver raise the same exceptions as Selenium
+(NoSuchElementException, StaleElementReferenceException, ...), and locators are
+the usual (By, value) tuples, so the scripts and locators of the synchronous
+page objects are reused by the async ones (pages/async_pages.py). Unlike
+Selenium, every call is a coroutine method, including the ones Selenium has
+as properties: `await element.text()` for `element.text`, `await
+driver.current_url()` for `driver.current_url`.
+
+Usage:
+    async with ChromeDriverServer() as server:
+        drivers = await asyncio.gather(*(server.new_session() for _ in range(20)))
+        await asyncio.gather(*(driver.get(url) for driver in drivers))
+        element = await drivers[0].find_element(By.NAME, "username")
+        await element.send_keys("Admin")
+        await asyncio.gather(*(driver.quit() for driver in drivers))
+"""
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+from utils.driver_pool import headless_chrome_options
+
+# Key of element references in W3C WebDriver payloads
+ELEMENT_KEY = "element-6066-11e4-a52f-4a5c4b4f8f8b"
+
+# Locator strategies without a W3C equivalent, translated to CSS selectors like Selenium does
+_CSS_STRATEGIES = {
+    By.ID: lambda value: f'[id="{value}"]',
+    By.NAME: lambda value: f'[name="{value}"]',
+    By.CLASS_NAME: lambda value: f".{value}",
+}
+
+_error_handler = ErrorHandler()
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection to the driver server."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, method, host, path, payload):
+        """Sends one request and returns (status, decoded JSON body)."""
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nAccept: application/json\r\n"
+                f"Content-Type: application/json;charset=UTF-8\r\nContent-Length: {len(body)}\r\n"
+                "Connection: keep-alive\r\n\r\n")
+        self.writer.write(head.encode("ascii") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("The driver server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunks()
+        else:
+            data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, json.loads(data) if data else {}
+
+    async def _read_chunks(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readline()  # Blank line after the last chunk
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+    @property
+    def closed(self):
+        return self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+
+class KeepAlivePool:
+    """Keep-alive connections to the driver server, reused command after command."""
+
+    def __init__(self, url, max_connections=2):
+        """Initializes the pool without opening a connection.
+        Args:
+            url: Root URL of the driver server, e.g. "http://localhost:9515".
+            max_connections: Connections opened at most; further concurrent commands wait for one.
+        """
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.max_connections = max_connections
+        self.opened = 0  # Connections opened so far, including replaced ones
+        self._idle = []
+        self._open = 0
+        self._available = asyncio.Condition()
+
+    async def _acquire(self):
+        async with self._available:
+            while True:
+                while self._idle:
+                    connection = self._idle.pop()
+                    if not connection.closed:
+                        return connection
+                    self._open -= 1
+                if self._open < self.max_connections:
+                    self._open += 1
+                    break
+                await self._available.wait()
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        except OSError:
+            async with self._available:
+                self._open -= 1
+                self._available.notify()
+            raise
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    async def _release(self, connection):
+        async with self._available:
+            if connection.closed:
+                self._open -= 1
+            else:
+                self._idle.append(connection)
+            self._available.notify()
+
+    async def request(self, method, path, payload=None):
+        """Sends a request on a pooled connection, reconnecting once if an idle connection was dropped."""
+        for attempt in (1, 2):
+            connection = await self._acquire()
+            try:
+                return await connection.request(method, f"{self.host}:{self.port}", self.base_path + path, payload)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                connection.close()
+                if attempt == 2:
+                    raise
+            finally:
+                await self._release(connection)
+
+    async def close(self):
+        """Closes every idle connection."""
+        async with self._available:
+            for connection in self._idle:
+                connection.close()
+            self._open -= len(self._idle)
+            self._idle.clear()
+
+
+def _check(status, body):
+    """Raises the Selenium exception matching an error response."""
+    if status >= 400:
+        _error_handler.check_response({"status": status, "value": json.dumps(body)})
+        raise WebDriverException(f"WebDriver request failed with HTTP {status}: {body}")
+
+
+def _wrap(value, driver):
+    """Turns element references in a response into AsyncElement objects."""
+    if isinstance(value, list):
+        return [_wrap(item, driver) for item in value]
+    if isinstance(value, dict):
+        if ELEMENT_KEY in value:
+            return AsyncElement(driver, value[ELEMENT_KEY])
+        return {key: _wrap(item, driver) for key, item in value.items()}
+    return value
+
+
+def _unwrap(value):
+    """Turns AsyncElement arguments into element references."""
+    if isinstance(value, AsyncElement):
+        return {ELEMENT_KEY: value.id}
+    if isinstance(value, (list, tuple)):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _w3c_locator(by, value):
+    """Returns the W3C strategy and selector of a (By, value) locator."""
+    if by in _CSS_STRATEGIES:
+        return By.CSS_SELECTOR, _CSS_STRATEGIES[by](value)
+    return by, value
+
+
+class AsyncElement:
+    """An element of an AsyncWebDriver session."""
+
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    def _command(self, method, command, payload=None):
+        return self.driver.command(method, f"/element/{self.id}/{command}", payload)
+
+    async def click(self):
+        await self._command("POST", "click", {})
+
+    async def clear(self):
+        await self._command("POST", "clear", {})
+
+    async def send_keys(self, text):
+        text = str(text)
+        await self._command("POST", "value", {"text": text, "value": list(text)})
+
+    async def text(self):
+        """Returns the visible text of the element; a coroutine method, where Selenium has the `text` property."""
+        return await self._command("GET", "text")
+
+    async def get_property(self, name):
+        return await self._command("GET", f"property/{name}")
+
+    async def get_attribute(self, name):
+        return await self._command("GET", f"attribute/{name}")
+
+    async def is_displayed(self):
+        return await self._command("GET", "displayed")
+
+    async def is_enabled(self):
+        return await self._command("GET", "enabled")
+
+    async def is_selected(self):
+        return await self._command("GET", "selected")
+
+    async def find_element(self, by, value):
+        using, selector = _w3c_locator(by, value)
+        return await self._command("POST", "element", {"using": using, "value": selector})
+
+    def __eq__(self, other):
+        return isinstance(other, AsyncElement) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class AsyncWebDriver:
+    """One browser session driven over asyncio."""
+
+    def __init__(self, server_url, session_id, capabilities=None, max_connections=2):
+        """Wraps an existing session; use ChromeDriverServer.new_session() or AsyncWebDriver.create().
+        Args:
+            server_url: Root URL of the driver server.
+            session_id: Id of the WebDriver session.
+            capabilities: Capabilities the session was created with.
+            max_connections: Keep-alive connections of this session.
+        """
+        self.session_id = session_id
+        self.capabilities = capabilities or {}
+        self.pool = KeepAlivePool(server_url, max_connections)
+
+    @classmethod
+    async def create(cls, server_url, options=None, max_connections=2):
+        """Starts a new session on the driver server with the given Selenium options."""
+        options = options or headless_chrome_options()
+        pool = KeepAlivePool(server_url, 1)
+        try:
+            status, body = await pool.request("POST", "/session",
+                                              {"capabilities": {"alwaysMatch": options.to_capabilities()}})
+        finally:
+            await pool.close()
+        _check(status, body)
+        return cls(server_url, body["value"]["sessionId"], body["value"].get("capabilities"), max_connections)
+
+    async def command(self, method, path, payload=None):
+        """Sends a command of this session and returns its value."""
+        status, body = await self.pool.request(method, f"/session/{self.session_id}{path}", payload)
+        _check(status, body)
+        return _wrap(body.get("value"), self)
+
+    async def get(self, url):
+        await self.command("POST", "/url", {"url": url})
+
+    async def current_url(self):
+        return await self.command("GET", "/url")
+
+    async def title(self):
+        return await self.command("GET", "/title")
+
+    async def find_element(self, by, value):
+        using, selector = _w3c_locator(by, value)
+        return await self.command("POST", "/element", {"using": using, "value": selector})
+
+    async def find_elements(self, by, value):
+        using, selector = _w3c_locator(by, value)
+        return await self.command("POST", "/elements", {"using": using, "value": selector})
+
+    async def execute_script(self, script, *args):
+        return await self.command("POST", "/execute/sync", {"script": script, "args": _unwrap(list(args))})
+
+    async def execute_async_script(self, script, *args):
+        return await self.command("POST", "/execute/async", {"script": script, "args": _unwrap(list(args))})
+
+    async def get_cookies(self):
+        return await self.command("GET", "/cookie")
+
+    async def add_cookie(self, cookie):
+        await self.command("POST", "/cookie", {"cookie": cookie})
+
+    async def delete_all_cookies(self):
+        await self.command("DELETE", "/cookie")
+
+    async def quit(self):
+        """Ends the session and closes its connections."""
+        try:
+            await self.command("DELETE", "")
+        finally:
+            await self.pool.close()
+
+
+class ChromeDriverServer:
+    """One chromedriver process hosting any number of AsyncWebDriver sessions."""
+
+    def __init__(self, headless=True, max_connections=2):
+        """Initializes the server without starting it.
+        Args:
+            headless: Whether the browsers of new sessions run headless.
+            max_connections: Keep-alive connections of each session.
+        """
+        self.headless = headless
+        self.max_connections = max_connections
+        self.service = Service()
+
+    @property
+    def url(self):
+        return self.service.service_url
+
+    def start(self):
+        """Starts chromedriver, found the same way webdriver.Chrome finds it."""
+        options = headless_chrome_options(self.headless)
+        self.service.path = self.service.env_path() or DriverFinder(self.service, options).get_driver_path()
+        self.service.start()
+        return self
+
+    async def new_session(self, options=None):
+        """Starts a browser and returns its AsyncWebDriver."""
+        return await AsyncWebDriver.create(self.url, options or headless_chrome_options(self.headless),
+                                           self.max_connections)
+
+    def stop(self):
+        """Stops chromedriver (browsers of sessions that were not quit are closed with it)."""
+        self.service.stop()
+
+    async def __aenter__(self):
+        return await asyncio.to_thread(self.start)
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.to_thread(self.stop)
@@ -0,0 +1,139 @@
+"""
+auth_session.py
+
+This module defines the AuthSession class, which logs in to the Orange HRM
+application once through the LoginPage and keeps the resulting session state
+(cookies, localStorage and sessionStorage) so it can be injected into other
+browser sessions without going through the login form again.
+
+Usage:
+    Create one AuthSession per worker with the base URL and valid credentials,
+    then call apply(driver) on every new or reset driver. The session logs in
+    again on its own when the stored state has expired.
+"""
+import threading
+import time
+
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.login_page import LoginPage
+from pages.waits import EventWait
+from utils.steps import run_steps
+
+LOGIN_PATH = "web/index.php/auth/login"
+DASHBOARD_PATH = "web/index.php/dashboard/index"
+
+# Dumps both web storages of the current origin as {"local": {...}, "session": {...}}
+READ_STORAGE_JS = """
+const dump = (store) => {
+    const items = {};
+    for (let i = 0; i < store.length; i++) {
+        const key = store.key(i);
+        items[key] = store.getItem(key);
+    }
+    return items;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+WRITE_STORAGE_JS = """
+const state = arguments[0];
+window.localStorage.clear();
+window.sessionStorage.clear();
+for (const [key, value] of Object.entries(state.local || {})) window.localStorage.setItem(key, value);
+for (const [key, value] of Object.entries(state.session || {})) window.sessionStorage.setItem(key, value);
+"""
+
+
+class AuthSession:
+    """Holds the authenticated state of one user and injects it into drivers."""
+
+    def __init__(self, base_url, username, password, timeout=10):
+        """Initializes the AuthSession.
+        Args:
+            base_url: Root URL of the application, e.g. "https://opensource-demo.orangehrmlive.com/".
+            username: Username used for the one real login.
+            password: Password used for the one real login.
+            timeout: Seconds to wait for the dashboard after logging in.
+        """
+        self.base_url = base_url.rstrip("/") + "/"
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.cookies = []  # Cookies captured after the last login
+        self.storage = {"local": {}, "session": {}}  # Web storage captured after the last login
+        self.login_count = 0  # Number of times the login form was actually used
+        self._lock = threading.Lock()
+
+    @property
+    def login_url(self):
+        return self.base_url + LOGIN_PATH
+
+    @property
+    def dashboard_url(self):
+        return self.base_url + DASHBOARD_PATH
+
+    def has_state(self):
+        """Returns True if a session was captured and none of its cookies has expired."""
+        if not self.cookies:
+            return False
+        now = time.time()
+        return all(cookie.get("expiry") is None or cookie["expiry"] > now for cookie in self.cookies)
+
+    def invalidate(self):
+        """Forgets the stored state, so the next apply() logs in again."""
+        self.cookies = []
+        self.storage = {"local": {}, "session": {}}
+
+    def login(self, driver):
+        """Logs in through the LoginPage form and captures the session state."""
+        driver.get(self.login_url)
+        LoginPage(driver).login(self.username, self.password)
+        EventWait(driver, self.timeout).until(EC.url_contains("/dashboard"))
+        self.capture(driver)
+        self.login_count += 1
+
+    def capture(self, driver):
+        """Stores the cookies and web storage of the driver's current session."""
+        run_steps(self.capture_steps(driver))
+
+    def capture_steps(self, driver):
+        """Flow of capture() for a synchronous or an async driver (see utils.steps)."""
+        cookies = yield driver.get_cookies()
+        self.storage = yield driver.execute_script(READ_STORAGE_JS)
+        self.cookies = cookies
+
+    def is_authenticated(self, driver):
+        """Returns True if the driver is on an application page instead of the login form."""
+        return "/auth/login" not in driver.current_url
+
+    def apply(self, driver, url=None):
+        """Makes the driver authenticated and leaves it on the given URL (the dashboard by default).
+
+        The stored cookies and storage are injected when they are still valid. If the
+        application still redirects to the login form, the session has expired on the
+        server side, so a fresh login is done with this driver and its state is kept.
+        """
+        target = url or self.dashboard_url
+        with self._lock:
+            if not self.has_state():
+                self.login(driver)
+            else:
+                run_steps(self.inject_steps(driver))
+            driver.get(target)
+            if not self.is_authenticated(driver):
+                self.login(driver)
+                driver.get(target)
+        return driver
+
+    def inject_steps(self, driver):
+        """Flow that copies the stored cookies and web storage into a synchronous or an async driver."""
+        # Cookies and storage can only be set for the origin that is currently loaded
+        yield driver.get(self.login_url)
+        yield driver.delete_all_cookies()
+        for cookie in self.cookies:
+            cookie = dict(cookie)
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)  # Chrome rejects unknown sameSite values
+            yield driver.add_cookie(cookie)
+        yield driver.execute_script(WRITE_STORAGE_JS, self.storage)
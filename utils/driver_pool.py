@@ -0,0 +1,234 @@
+"""
+driver_pool.py
+
+This module defines the DriverPool class, which keeps a number of headless
+Chrome instances running so tests can lease a ready browser instead of paying
+the browser start-up cost for every test.
+
+A leased driver is reset before it is handed out again (cookies and storage
+cleared, back on the start URL). A driver is replaced by a fresh one after it
+has been used a configured number of times, or as soon as it stops responding.
+
+A driver that cannot be started is not silently left out: start() raises the
+error, a lease fails at once when no driver is running or starting any more,
+and the failures of background replacements are kept for the caller to report
+(pop_launch_errors()).
+
+Usage:
+    pool = DriverPool("https://opensource-demo.orangehrmlive.com/", size=2, max_uses=20)
+    pool.start()
+    with pool.lease() as driver:
+        ...
+    print(pool.stats())
+    pool.close()
+"""
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+# Clears web storage of whatever origin the driver is currently on
+_CLEAR_STORAGE_JS = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def headless_chrome_options(headless=True):
+    """Returns the Chrome options used for pooled drivers."""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")  # Keep the desktop layout the locators were written for
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    return options
+
+
+class DriverPoolError(Exception):
+    """Raised when the pool has no driver left to lease."""
+
+
+class PooledDriver:
+    """A driver owned by the pool together with its usage count."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """Pool of pre-started Chrome drivers that are leased to tests."""
+
+    def __init__(self, base_url, size=1, max_uses=25, headless=True, driver_factory=None, lease_timeout=120):
+        """Initializes the pool without starting any browser.
+        Args:
+            base_url: URL every driver is reset to before it is leased.
+            size: Number of drivers kept running.
+            max_uses: Number of leases after which a driver is replaced.
+            headless: Whether Chrome runs headless.
+            driver_factory: Callable returning a new WebDriver; defaults to headless Chrome.
+            lease_timeout: Seconds a lease waits for a free driver before giving up.
+        """
+        self.base_url = base_url
+        self.size = size
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+        self.driver_factory = driver_factory or (lambda: webdriver.Chrome(options=headless_chrome_options(headless)))
+        self._idle = queue.Queue()
+        self._all = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._starting = 0  # Drivers being launched
+        self._launch_errors = []  # Failed launches not reported yet
+        self.last_launch_error = None
+        self.launch_failures = 0
+        self.lease_waits = []  # Seconds each lease waited for a driver
+        self.recycles = {"max_uses": 0, "crash": 0}  # Replaced drivers, by reason
+
+    def start(self):
+        """Launches all drivers in parallel and waits until they are ready.
+
+        Raises:
+            Exception: The error of the first driver that could not be started; the others are quit.
+        """
+        threads = [self._start_launch() for _ in range(self.size)]
+        for thread in threads:
+            thread.join()
+        errors = self.pop_launch_errors()
+        if errors:
+            self.close()
+            raise errors[0]
+        return self
+
+    def _start_launch(self):
+        """Launches one driver on a background thread."""
+        with self._lock:
+            self._starting += 1
+        thread = threading.Thread(target=self._launch, daemon=True)
+        thread.start()
+        return thread
+
+    def _launch(self):
+        """Starts one driver, opens the base URL and puts it in the idle queue."""
+        driver = None
+        try:
+            driver = self.driver_factory()
+            driver.get(self.base_url)
+        except Exception as e:
+            with self._lock:
+                self._starting -= 1
+                self._launch_errors.append(e)
+                self.last_launch_error = e
+                self.launch_failures += 1
+            if driver is not None:
+                self._quit(driver)
+            return
+        pooled = PooledDriver(driver)
+        with self._lock:
+            self._starting -= 1
+            if self._closed:
+                driver.quit()
+                return
+            self._all.add(pooled)
+        self._idle.put(pooled)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass  # A crashed browser may already be gone
+
+    def pop_launch_errors(self):
+        """Returns the errors of the driver launches that failed since the last call."""
+        with self._lock:
+            errors, self._launch_errors = self._launch_errors, []
+        return errors
+
+    def _recycle(self, pooled, reason):
+        """Quits a driver and starts its replacement in the background."""
+        with self._lock:
+            self.recycles[reason] += 1
+            self._all.discard(pooled)
+        self._quit(pooled.driver)
+        if not self._closed:
+            self._start_launch()
+
+    def reset(self, driver):
+        """Clears cookies and storage of the driver and navigates back to the base URL."""
+        driver.delete_all_cookies()
+        driver.execute_script(_CLEAR_STORAGE_JS)
+        driver.get(self.base_url)
+
+    def acquire(self):
+        """Takes a ready driver from the pool, waiting for one if all are leased.
+
+        Raises:
+            DriverPoolError: At once if no driver is running or starting, e.g. because their replacements failed.
+            TimeoutError: If no driver became free within the lease timeout.
+        """
+        start = time.perf_counter()
+        deadline = start + self.lease_timeout
+        while True:
+            try:
+                pooled = self._idle.get(timeout=min(max(deadline - time.perf_counter(), 0), 0.1))
+                break
+            except queue.Empty:
+                pass
+            with self._lock:
+                exhausted = not self._all and not self._starting
+            if exhausted and self._idle.empty():
+                raise DriverPoolError("No pooled driver is running or starting") from self.last_launch_error
+            if time.perf_counter() >= deadline:
+                raise TimeoutError(f"No pooled driver became free within {self.lease_timeout} seconds")
+        self.lease_waits.append(time.perf_counter() - start)
+        pooled.uses += 1
+        return pooled
+
+    def release(self, pooled):
+        """Returns a driver to the pool, replacing it if it is worn out or has crashed."""
+        if pooled.uses >= self.max_uses:
+            self._recycle(pooled, "max_uses")
+            return
+        try:
+            self.reset(pooled.driver)
+        except WebDriverException:
+            self._recycle(pooled, "crash")
+            return
+        self._idle.put(pooled)
+
+    @contextmanager
+    def lease(self):
+        """Context manager yielding a driver that goes back to the pool afterwards."""
+        pooled = self.acquire()
+        try:
+            yield pooled.driver
+        finally:
+            self.release(pooled)
+
+    def stats(self):
+        """Returns lease wait times and recycle counts of the pool."""
+        waits = self.lease_waits
+        return {
+            "size": self.size,
+            "leases": len(waits),
+            "lease_wait_total": sum(waits),
+            "lease_wait_mean": sum(waits) / len(waits) if waits else 0.0,
+            "lease_wait_max": max(waits) if waits else 0.0,
+            "recycled_max_uses": self.recycles["max_uses"],
+            "recycled_crash": self.recycles["crash"],
+            "launch_failures": self.launch_failures,
+        }
+
+    def close(self):
+        """Quits every driver owned by the pool."""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._all)
+            self._all.clear()
+        for pooled in drivers:
+            self._quit(pooled.driver)
@@ -0,0 +1,307 @@
+"""
+impact.py
+
+This module selects the tests affected by a change, so a local run only
+repeats the browser tests that can notice it.
+
+While the suite runs, an ImpactTracer records what each test exercises: the
+functions and methods of the project it calls (page-object methods, helpers,
+fixtures, the test itself), the page-object locators it resolves and the data
+files it reads. The map of test -> dependencies is kept between runs together
+with the fingerprint each dependency had when the test ran.
+
+On the next run a test is selected if one of its dependencies has a different
+fingerprint now, if it failed or was skipped last time, or if it is new; the
+other tests are deselected. Fingerprints are taken from the syntax tree, so comments and
+formatting are not changes, while the module constants a function refers to
+(page scripts, outcome selectors), and the constants those are built from, are
+part of its fingerprint. Every entry of a
+LOCATORS dictionary has a fingerprint of its own, so changing one locator only
+reruns the tests that resolve it.
+
+Dependency keys are paths relative to the project root:
+    "pages/pim_page.py::PIMPage.click_save"     a function or method
+    "pages/pim_page.py::LOCATORS[submit_button]" a locator of a page module
+    "data/login_data.csv"                        a data file
+
+Usage:
+    tracer = ImpactTracer(root)
+    tracer.start()
+    tracer.start_test()
+    ...  # Run the test
+    dependencies = tracer.finish_test(fixture_names)
+    tracer.stop()
+
+    fingerprints = Fingerprints(root)
+    impact_map = update_map(impact_map, {nodeid: (dependencies, failed)}, fingerprints)
+    selected, deselected, changed = select_affected(items, impact_map, fingerprints)
+"""
+import ast
+import hashlib
+import os
+import re
+import sys
+
+from data import data_providers
+from pages.locators import LocatorRegistry
+
+# Cache key under which the test -> dependencies map is kept between runs (in .pytest_cache)
+IMPACT_CACHE_KEY = "orangehrm/impact"
+
+# Module-level dictionary whose entries are fingerprinted one by one
+_LOCATORS_NAME = "LOCATORS"
+
+_LOCATOR_KEY = re.compile(rf"{_LOCATORS_NAME}\[(.+)\]")
+
+
+def _digest(*parts):
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class ImpactTracer:
+    """Records the project code, locators and data files each test uses, through a profile hook."""
+
+    def __init__(self, root):
+        """Initializes the tracer without installing it.
+        Args:
+            root: Project root; only code and data files below it are recorded.
+        """
+        self.root = os.path.abspath(root)
+        self.fixture_dependencies = {}  # Fixture name -> dependencies recorded while it was set up
+        self._stack = []  # Dependencies being recorded: the test's, then those of fixtures being set up
+        self._keys = {}  # Code object -> dependency key, or None for code outside the project
+        self._previous = None
+        # Functions whose arguments name what is used, rather than the function itself
+        self._argument_readers = {
+            LocatorRegistry.element.__code__: self._locator_key,
+            LocatorRegistry.locator.__code__: self._locator_key,
+            data_providers.data_path.__code__: self._data_file_key,
+            data_providers.RowRef.load.__code__: self._data_file_key,
+        }
+
+    def _path_key(self, path):
+        """Returns the path relative to the root, or None outside the project or in installed packages."""
+        if not os.path.isabs(path):
+            return None  # Frozen modules, code compiled from strings
+        path = os.path.normpath(path)
+        if not path.startswith(self.root + os.sep) or f"{os.sep}site-packages{os.sep}" in path:
+            return None
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def _code_key(self, code):
+        path = self._path_key(code.co_filename)
+        qualname = code.co_qualname.split(".<locals>", 1)[0]  # Closures and comprehensions count as their function
+        if path is None or qualname.startswith("<") or code.co_filename == __file__:
+            return None  # Module-level code, code outside the project, or the tracer's own bookkeeping
+        return f"{path}::{qualname}"
+
+    def _locator_key(self, frame):
+        caller = frame.f_back
+        if caller is None or caller.f_code.co_filename == frame.f_code.co_filename:
+            return None  # The registry looking up its own element again
+        path = self._path_key(caller.f_code.co_filename)
+        return f"{path}::{_LOCATORS_NAME}[{frame.f_locals['name']}]" if path else None
+
+    def _data_file_key(self, frame):
+        arguments = frame.f_locals
+        path = arguments["self"].path if "self" in arguments else data_providers.data_path(arguments["name"])
+        return self._path_key(path)
+
+    def _profile(self, frame, event, arg):
+        if event != "call" or not self._stack:
+            return
+        code = frame.f_code
+        recorded = self._stack[-1]
+        reader = self._argument_readers.get(code)
+        if reader is not None:
+            try:
+                key = reader(frame)
+            except Exception:
+                key = None  # Never break the test being traced
+            if key:
+                recorded.add(key)
+        try:
+            key = self._keys[code]
+        except KeyError:
+            key = self._keys[code] = self._code_key(code)
+        if key is not None:
+            recorded.add(key)
+
+    def start(self):
+        """Installs the profile hook on the current thread."""
+        self._previous = sys.getprofile()
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        """Removes the profile hook."""
+        sys.setprofile(self._previous)
+
+    def start_test(self):
+        """Starts recording the dependencies of a test."""
+        self._stack = [set()]
+
+    def start_fixture(self):
+        """Records what follows for a fixture being set up, so later tests using it inherit it."""
+        self._stack.append(set())
+
+    def finish_fixture(self, name):
+        """Stores what the fixture that was being set up used."""
+        if self._stack:
+            self.fixture_dependencies.setdefault(name, set()).update(self._stack.pop())
+
+    def finish_test(self, fixture_names):
+        """Stops recording and returns the dependencies of the test, including those of its fixtures.
+        Args:
+            fixture_names: Names of all fixtures the test uses (directly or through other fixtures).
+        Returns:
+            list: Sorted dependency keys.
+        """
+        recorded = set(self._stack[0]) if self._stack else set()
+        for name in fixture_names:
+            recorded |= self.fixture_dependencies.get(name, set())
+        self._stack = []
+        return sorted(recorded)
+
+
+class _ParsedModule:
+    """Syntax trees of the definitions, constants and locators of one Python file."""
+
+    def __init__(self, source):
+        tree = ast.parse(source)
+        self.definitions = {}  # Qualified name -> FunctionDef / ClassDef node
+        self.class_attributes = {}  # Class name -> dump of its statements other than definitions
+        self.constants = {}  # Module-level name -> dump of the statement assigning it
+        self.constant_names = {}  # Module-level name -> names its assignment reads
+        self.locators = {}  # Locator name -> dump of its entry in LOCATORS
+        self.class_names = {}  # Class name -> names its statements other than definitions read
+        self._add_definitions(tree.body, "")
+        for statement in tree.body:
+            targets = statement.targets if isinstance(statement, ast.Assign) else (
+                [statement.target] if isinstance(statement, ast.AnnAssign) else [])
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    self.constants[target.id] = ast.dump(statement)
+                    self.constant_names[target.id] = _loaded_names(statement)
+                    if target.id == _LOCATORS_NAME and isinstance(statement.value, ast.Dict):
+                        for key, value in zip(statement.value.keys, statement.value.values):
+                            if isinstance(key, ast.Constant):
+                                self.locators[str(key.value)] = ast.dump(value)
+
+    def _add_definitions(self, body, prefix):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                self.definitions[prefix + node.name] = node
+            if isinstance(node, ast.ClassDef):
+                self._add_definitions(node.body, f"{prefix}{node.name}.")
+                attributes = [statement for statement in node.body
+                              if not isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))]
+                self.class_attributes[prefix + node.name] = "\n".join(ast.dump(statement) for statement in attributes)
+                self.class_names[prefix + node.name] = set().union(*map(_loaded_names, attributes))
+
+    def _constants_read(self, names):
+        """Returns the module constants among names and, recursively, those their assignments read."""
+        found = set()
+        pending = [name for name in names if name in self.constants]
+        while pending:
+            name = pending.pop()
+            if name in found or name == _LOCATORS_NAME:
+                continue  # Locators have fingerprints of their own
+            found.add(name)
+            pending.extend(read for read in self.constant_names[name] if read in self.constants)
+        return found
+
+    def fingerprint(self, qualname):
+        """Returns the fingerprint of a definition with the module constants it reads, or None if it is gone."""
+        locator = _LOCATOR_KEY.fullmatch(qualname)
+        if locator:
+            dump = self.locators.get(locator.group(1))
+            return _digest(dump) if dump is not None else None
+        node = self.definitions.get(qualname)
+        if node is None:
+            return None
+        owner = qualname.rpartition(".")[0]
+        names = self._constants_read(_loaded_names(node) | self.class_names.get(owner, set()))
+        constants = [self.constants[name] for name in sorted(names)]
+        return _digest(ast.dump(node), self.class_attributes.get(owner, ""), *constants)
+
+
+def _loaded_names(node):
+    """Returns the names a syntax tree reads."""
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load)}
+
+
+class Fingerprints:
+    """Current fingerprints of dependency keys, computed from the files on disk once per key."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._modules = {}
+        self._values = {}
+
+    def _module(self, path):
+        if path not in self._modules:
+            try:
+                with open(path, encoding="utf-8") as source:
+                    self._modules[path] = _ParsedModule(source.read())
+            except (OSError, SyntaxError, ValueError):
+                self._modules[path] = None
+        return self._modules[path]
+
+    def _compute(self, key):
+        relative, _, qualname = key.partition("::")
+        path = os.path.join(self.root, relative)
+        if not qualname:
+            try:
+                with open(path, "rb") as data_file:
+                    return hashlib.sha1(data_file.read()).hexdigest()[:16]
+            except OSError:
+                return None
+        module = self._module(path)
+        return module.fingerprint(qualname) if module is not None else None
+
+    def get(self, key):
+        """Returns the fingerprint of a dependency key, or None if what it names no longer exists."""
+        if key not in self._values:
+            self._values[key] = self._compute(key)
+        return self._values[key]
+
+
+def update_map(impact_map, runs, fingerprints):
+    """Records the dependencies of the tests that ran, with their current fingerprints.
+    Args:
+        impact_map: Map of earlier runs (node id -> {"dependencies": {key: fingerprint}, "failed": bool,
+            "skipped": bool}).
+        runs: Node id -> (dependency keys, whether the test failed) of the tests of this run; the keys are
+            None for a test whose body did not run (skipped, or failed in setup).
+        fingerprints: Fingerprints of the code the run used.
+    Returns:
+        dict: The updated map; tests that were not collected keep their entries.
+    """
+    updated = dict(impact_map or {})
+    for nodeid, (dependencies, failed) in runs.items():
+        updated[nodeid] = {
+            "dependencies": {key: fingerprints.get(key) for key in dependencies or ()},
+            "failed": failed,
+            "skipped": dependencies is None,  # What the test uses is unknown, so it runs next time
+        }
+    return updated
+
+
+def select_affected(items, impact_map, fingerprints):
+    """Splits test items into those affected by changes since they last ran and the others.
+    Returns:
+        tuple: (selected items, deselected items, sorted keys of the dependencies that changed)
+    """
+    selected, deselected, changed = [], [], set()
+    for item in items:
+        entry = impact_map.get(item.nodeid)
+        if entry is None or entry.get("failed") or entry.get("skipped"):
+            selected.append(item)  # New, or failed or skipped last time
+            continue
+        item_changes = [key for key, fingerprint in entry["dependencies"].items() if fingerprints.get(key) != fingerprint]
+        if item_changes:
+            selected.append(item)
+            changed.update(item_changes)
+        else:
+            deselected.append(item)
+    return selected, deselected, sorted(changed)
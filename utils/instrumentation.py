@@ -0,0 +1,224 @@
+"""
+instrumentation.py
+
+This module times every page-object action (each public method of LoginPage,
+PIMPage, ...) and splits its duration into:
+
+    - wait: time spent inside explicit waits (EventWait / WebDriverWait),
+    - command: time spent in WebDriver commands issued outside those waits,
+    - think: everything else (Python work between commands).
+
+It also counts the WebDriver round trips of each action. Records are grouped
+per test, summarised as p50/p95/p99 per action and written as JSON.
+
+Nothing is patched until enable() is called, so with instrumentation off the
+page objects and the driver run their original, unwrapped code.
+
+Usage:
+    instrumentation = Instrumentation()
+    instrumentation.enable([LoginPage, PIMPage])
+    instrumentation.start_test("test_add_employee")
+    ...
+    print(instrumentation.summary())
+    instrumentation.write_json("reports/action_timings.json")
+    instrumentation.disable()
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.waits import EventWait
+
+# Wait classes whose until/until_not calls count as wait time
+WAIT_CLASSES = (EventWait, WebDriverWait)
+
+
+def percentile(values, fraction):
+    """Returns the nearest-rank percentile of values (fraction between 0 and 1)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class _ActionFrame:
+    """Timing of the page-object action running on the current thread."""
+
+    __slots__ = ("wait", "command", "round_trips", "wait_depth")
+
+    def __init__(self):
+        self.wait = 0.0
+        self.command = 0.0
+        self.round_trips = 0
+        self.wait_depth = 0
+
+
+class Instrumentation:
+    """Collects per-action timings of page objects."""
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []  # One dict per top-level action
+        self.current_test = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._originals = []  # (owner, attribute name, original function) of everything patched
+
+    def _frame(self):
+        return getattr(self._local, "frame", None)
+
+    def _patch(self, owner, name, wrapper_factory):
+        original = owner.__dict__[name]
+        self._originals.append((owner, name, original))
+        setattr(owner, name, wrapper_factory(original))
+
+    def enable(self, page_classes):
+        """Starts timing the public methods of the given page classes and the driver's commands."""
+        if self.enabled:
+            return
+        self._patch(WebDriver, "execute", self._wrap_command)
+        for wait_class in WAIT_CLASSES:
+            for name in ("until", "until_not"):
+                self._patch(wait_class, name, self._wrap_wait)
+        for page_class in page_classes:
+            for name, member in list(vars(page_class).items()):
+                if callable(member) and not name.startswith("_"):
+                    self._patch(page_class, name, functools.partial(self._wrap_action, f"{page_class.__name__}.{name}"))
+        self.enabled = True
+
+    def disable(self):
+        """Restores every patched method."""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def _wrap_command(self, original):
+        instrumentation = self
+
+        @functools.wraps(original)
+        def execute(driver, driver_command, params=None):
+            frame = instrumentation._frame()
+            if frame is None:
+                return original(driver, driver_command, params)
+            started = time.perf_counter()
+            try:
+                return original(driver, driver_command, params)
+            finally:
+                frame.round_trips += 1
+                if frame.wait_depth == 0:
+                    frame.command += time.perf_counter() - started
+
+        return execute
+
+    def _wrap_wait(self, original):
+        instrumentation = self
+
+        @functools.wraps(original)
+        def until(wait, *args, **kwargs):
+            frame = instrumentation._frame()
+            if frame is None:
+                return original(wait, *args, **kwargs)
+            frame.wait_depth += 1
+            started = time.perf_counter()
+            try:
+                return original(wait, *args, **kwargs)
+            finally:
+                frame.wait_depth -= 1
+                if frame.wait_depth == 0:
+                    frame.wait += time.perf_counter() - started
+
+        return until
+
+    def _wrap_action(self, action, original):
+        instrumentation = self
+
+        @functools.wraps(original)
+        def run_action(*args, **kwargs):
+            if instrumentation._frame() is not None:
+                return original(*args, **kwargs)  # Nested action: counted in the outer one
+            frame = instrumentation._local.frame = _ActionFrame()
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - started
+                instrumentation._local.frame = None
+                instrumentation._record(action, total, frame)
+
+        return run_action
+
+    def _record(self, action, total, frame):
+        with self._lock:
+            self.records.append({
+                "test": self.current_test,
+                "action": action,
+                "total": total,
+                "wait": frame.wait,
+                "command": frame.command,
+                "think": max(0.0, total - frame.wait - frame.command),
+                "round_trips": frame.round_trips,
+            })
+
+    def start_test(self, test_id):
+        """Attributes the following actions to the given test."""
+        self.current_test = test_id
+
+    def test_records(self, test_id):
+        """Returns the action records of one test."""
+        return [record for record in self.records if record["test"] == test_id]
+
+    def summary(self, records=None):
+        """Returns count, mean, p50, p95, p99 and the time split per action."""
+        records = self.records if records is None else records
+        by_action = {}
+        for record in records:
+            by_action.setdefault(record["action"], []).append(record)
+        summary = {}
+        for action, action_records in sorted(by_action.items()):
+            totals = [record["total"] for record in action_records]
+            summary[action] = {
+                "count": len(totals),
+                "mean": sum(totals) / len(totals),
+                "p50": percentile(totals, 0.50),
+                "p95": percentile(totals, 0.95),
+                "p99": percentile(totals, 0.99),
+                "wait": sum(record["wait"] for record in action_records),
+                "command": sum(record["command"] for record in action_records),
+                "think": sum(record["think"] for record in action_records),
+                "round_trips": sum(record["round_trips"] for record in action_records),
+            }
+        return summary
+
+    def write_json(self, path):
+        """Writes the per-test and per-session summaries to a JSON file."""
+        tests = {}
+        for record in self.records:
+            tests.setdefault(record["test"], []).append(record)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as json_file:
+            json.dump({
+                "session": self.summary(),
+                "tests": {test: {"actions": records, "summary": self.summary(records)} for test, records in tests.items()},
+            }, json_file, indent=2)
+        return path
+
+    def html_table(self, test_id):
+        """Returns the timing breakdown of one test as an HTML table for the pytest-html report."""
+        rows = "".join(
+            f"<tr><td>{record['action']}</td><td>{record['total']:.3f}</td><td>{record['wait']:.3f}</td>"
+            f"<td>{record['command']:.3f}</td><td>{record['think']:.3f}</td><td>{record['round_trips']}</td></tr>"
+            for record in self.test_records(test_id)
+        )
+        if not rows:
+            return ""
+        return (
+            "<table class='action-timings'><tr><th>Action</th><th>Total (s)</th><th>Wait (s)</th>"
+            "<th>Command (s)</th><th>Think (s)</th><th>Round trips</th></tr>" + rows + "</table>"
+        )
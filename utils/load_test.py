@@ -0,0 +1,527 @@
+"""
+load_test.py
+
+This module is the load-test entry point of the suite. It measures how many
+login, add-employee, edit-employee and delete-employee transactions per second
+an Orange HRM deployment handles, using the same LoginPage and PIMPage flows as
+the functional tests.
+
+N virtual users are started on a linear ramp-up schedule. Each user drives its
+own browser with its own authenticated session and repeatedly runs a scenario
+picked by weight, with a randomised think time in between. Every transaction is
+timed; the run reports throughput, error rate and p50/p95/p99 latency per
+transaction, for the whole run and per time interval, and writes them as JSON.
+Employees created by a user are deleted through the REST API when it stops.
+
+With --backend asyncio the users are coroutines instead of threads: one
+chromedriver hosts all browsers, each driven by an AsyncWebDriver with its own
+keep-alive connections, and the flows run on AsyncLoginPage and AsyncPIMPage.
+A single process then drives dozens of browsers with a fraction of the memory
+and CPU of a thread and a chromedriver per browser.
+
+Usage:
+    python -m utils.load_test --users 10 --ramp-up 60 --duration 300 \\
+        --scenario add_employee=3 --scenario edit_employee=2 --scenario delete_employee=1 --scenario login=1
+    python -m utils.load_test --base-url http://127.0.0.1:8080/ --users 4 --duration 60
+    python -m utils.load_test --backend asyncio --users 40 --ramp-up 20 --duration 120
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import threading
+import time
+
+from selenium import webdriver
+
+from data.data_generators import EmployeeDataGenerator
+from data.data_providers import first_row
+from pages.async_pages import AsyncLoginPage, AsyncPIMPage
+from pages.login_page import LoginPage
+from pages.pim_page import PIMPage
+from utils.api_client import OrangeHRMApi
+from utils.async_webdriver import ChromeDriverServer
+from utils.auth_session import AuthSession
+from utils.driver_pool import headless_chrome_options
+from utils.instrumentation import percentile
+from utils.steps import run_async_steps, run_steps
+
+DEFAULT_BASE_URL = "https://opensource-demo.orangehrmlive.com/"
+
+# Relative frequency of each scenario when none are given on the command line
+DEFAULT_WEIGHTS = {"login": 1, "add_employee": 3, "edit_employee": 2, "delete_employee": 1}
+
+
+def _describe(error):
+    """Returns the exception type and the first line of its message."""
+    message = str(error).strip()
+    return f"{type(error).__name__}: {message.splitlines()[0]}" if message else type(error).__name__
+
+
+class LoadResults:
+    """Thread-safe collection of the transactions of a load run."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.transactions = []  # (seconds since start, name, duration, ok, error)
+        self._lock = threading.Lock()
+
+    def record(self, name, started, duration, error=None):
+        """Records one transaction that began at the monotonic time `started`."""
+        with self._lock:
+            self.transactions.append((started - self.started, name, duration, error is None, error))
+
+    def _stats(self, transactions, seconds):
+        durations = [duration for _, _, duration, ok, _ in transactions if ok]
+        errors = sum(1 for _, _, _, ok, _ in transactions if not ok)
+        return {
+            "count": len(transactions),
+            "errors": errors,
+            "error_rate": errors / len(transactions) if transactions else 0.0,
+            "throughput": len(durations) / seconds if seconds else 0.0,  # Successful transactions per second
+            "p50": percentile(durations, 0.50),
+            "p95": percentile(durations, 0.95),
+            "p99": percentile(durations, 0.99),
+        }
+
+    def _by_name(self, transactions):
+        grouped = {}
+        for transaction in transactions:
+            grouped.setdefault(transaction[1], []).append(transaction)
+        return grouped
+
+    def summary(self, elapsed):
+        """Returns the statistics of each transaction over the whole run of `elapsed` seconds."""
+        return {name: self._stats(transactions, elapsed) for name, transactions in sorted(self._by_name(self.transactions).items())}
+
+    def timeline(self, interval):
+        """Returns the statistics of each transaction per interval of `interval` seconds."""
+        buckets = {}
+        for transaction in self.transactions:
+            buckets.setdefault(int(transaction[0] // interval), []).append(transaction)
+        return [
+            {"start": bucket * interval,
+             "transactions": {name: self._stats(transactions, interval)
+                              for name, transactions in sorted(self._by_name(buckets[bucket]).items())}}
+            for bucket in sorted(buckets)
+        ]
+
+    def errors(self, limit=20):
+        """Returns the most frequent error messages with their counts."""
+        counts = {}
+        for _, name, _, ok, error in self.transactions:
+            if not ok:
+                counts[f"{name}: {error}"] = counts.get(f"{name}: {error}", 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit])
+
+
+class VirtualUser:
+    """One simulated user with its own browser, session and employee IDs."""
+
+    def __init__(self, number, base_url, credentials, results, generator, driver_factory):
+        """Initializes the user without starting its browser.
+        Args:
+            number: Index of the user, also written into the middle name of its employees.
+            base_url: Root URL of the application.
+            credentials: (username, password) to log in with.
+            results: LoadResults the transactions are recorded in.
+            generator: EmployeeDataGenerator reserved for this user.
+            driver_factory: Callable returning a new WebDriver.
+        """
+        self.number = number
+        self.results = results
+        self.generator = generator
+        self.driver_factory = driver_factory
+        self.auth = AuthSession(base_url, *credentials)
+        self.driver = None
+        self.employees = []  # IDs of the employees this user added that still exist
+
+    @contextlib.contextmanager
+    def transaction(self, name):
+        """Times the wrapped steps as one transaction; a raised exception counts as an error."""
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.results.record(name, started, time.monotonic() - started, _describe(e))
+            raise
+        self.results.record(name, started, time.monotonic() - started)
+
+    def start(self):
+        """Starts the user's browser."""
+        self.driver = self.driver_factory()
+
+    def login_page(self):
+        """Returns the login page object for the user's browser."""
+        return LoginPage(self.driver)
+
+    def pim_page(self):
+        """Returns the PIM page object for the user's browser."""
+        return PIMPage(self.driver)
+
+    def open_dashboard(self):
+        """Makes sure the browser is logged in and on the dashboard, recorded as a "setup" transaction."""
+        with self.transaction("setup"):
+            self.auth.apply(self.driver)
+
+    def new_employee(self):
+        """Returns the data of a new employee with an ID from this user's range."""
+        return next(self.generator.iter_records(1))
+
+    def stop(self):
+        """Deletes the employees this user left behind, as a "cleanup" transaction, and closes its browser."""
+        try:
+            if self.employees:
+                with self.transaction("cleanup"):
+                    api = OrangeHRMApi.from_auth_session(self.auth)  # Logs in again if the session has expired
+                    try:
+                        for employee_id in self.employees:
+                            api.track(employee_id)
+                        api.cleanup()
+                    finally:
+                        api.close()
+        except Exception:
+            pass  # Recorded as a failed cleanup; the browser is closed all the same
+        finally:
+            if self.driver is not None:
+                self.driver.quit()
+
+
+# The scenarios are flows (see utils.steps): every call on the driver, the page objects or
+# user.open_dashboard() is yielded, so the same flow runs a VirtualUser and an AsyncVirtualUser.
+
+def _login_steps(user):
+    """Fills in the login form and keeps the new session, which later scenarios reuse."""
+    login_page = user.login_page()
+    yield login_page.login(user.auth.username, user.auth.password)
+    outcome, message = yield login_page.wait_for_outcome()
+    if outcome != "success":
+        raise AssertionError(f"Login failed: {message}")
+    yield from user.auth.capture_steps(user.driver)
+
+
+def _expect_toast(message, expected):
+    """Raises AssertionError unless the toast message contains the expected text."""
+    if expected not in message.lower():
+        raise AssertionError(f"Unexpected toast: {message}")
+
+
+def login_flow(user):
+    """Logs in through the login form."""
+    with user.transaction("setup"):
+        yield user.driver.delete_all_cookies()
+        yield user.driver.get(user.auth.login_url)
+    with user.transaction("login"):
+        yield from _login_steps(user)
+
+
+def add_employee_flow(user):
+    """Adds an employee through the Add Employee form."""
+    yield user.open_dashboard()
+    employee = user.new_employee()
+    pim_page = user.pim_page()
+    with user.transaction("add_employee"):
+        yield pim_page.navigate_to_pim()
+        yield pim_page.click_add_employee()
+        yield pim_page.enter_employee_details(employee["first_name"], f"{employee['middle_name']} u{user.number}",
+                                              employee["last_name"], employee["employee_id"])
+        yield pim_page.click_save()
+        _expect_toast((yield pim_page.get_toast_message()), "successfully saved")
+    user.employees.append(employee["employee_id"])
+
+
+def edit_employee_flow(user):
+    """Edits the personal details of an employee this user added."""
+    if not user.employees:
+        yield from add_employee_flow(user)
+    yield user.open_dashboard()
+    employee_id = user.employees[-1]
+    details = user.new_employee()  # Fresh values; the employee keeps its ID
+    pim_page = user.pim_page()
+    with user.transaction("edit_employee"):
+        yield pim_page.navigate_to_pim()
+        yield pim_page.search_employee_by_id(employee_id)
+        yield pim_page.select_first_employee()
+        yield pim_page.edit_employee_details(
+            first_name=details["first_name"],
+            middle_name=f"{details['middle_name']} u{user.number}",
+            last_name=details["last_name"],
+            employee_id=employee_id,
+            license_number=details["license_number"],
+            dob=details["dob"],
+            nationality=details["nationality"],
+            marital_status=details["marital_status"],
+            gender=details["gender"].lower(),
+        )
+        yield pim_page.click_save2()
+        _expect_toast((yield pim_page.get_toast_message()), "successfully updated")
+
+
+def delete_employee_flow(user):
+    """Deletes an employee this user added."""
+    if not user.employees:
+        yield from add_employee_flow(user)
+    yield user.open_dashboard()
+    employee_id = user.employees[-1]
+    pim_page = user.pim_page()
+    with user.transaction("delete_employee"):
+        yield pim_page.navigate_to_pim()
+        yield pim_page.search_employee_by_id(employee_id)
+        yield pim_page.delete_employee_details()
+        _expect_toast((yield pim_page.get_toast_message()), "successfully deleted")
+    user.employees.remove(employee_id)
+
+
+FLOWS = {
+    "login": login_flow,
+    "add_employee": add_employee_flow,
+    "edit_employee": edit_employee_flow,
+    "delete_employee": delete_employee_flow,
+}
+
+
+def _scenario(flow):
+    """Returns the scenario function(user) that runs a flow with a VirtualUser."""
+    def scenario(user):
+        return run_steps(flow(user))
+
+    scenario.__doc__ = flow.__doc__
+    return scenario
+
+
+SCENARIOS = {name: _scenario(flow) for name, flow in FLOWS.items()}
+
+
+def _run_user(user, deadline, weights, scenarios, think_time, rng):
+    """Runs weighted scenarios for one user until the deadline."""
+    names = list(weights)
+    try:
+        user.start()
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights=[weights[name] for name in names])[0]
+            try:
+                scenarios[name](user)
+            except Exception:
+                # Already recorded as a failed transaction (set-up steps included): start over clean
+                user.auth.invalidate()
+            time.sleep(min(rng.uniform(0.5, 1.5) * think_time, max(0.0, deadline - time.monotonic())))
+    except Exception as e:
+        user.results.record("start_user", time.monotonic(), 0.0, _describe(e))  # The browser did not start
+    finally:
+        user.stop()
+
+
+class AsyncVirtualUser(VirtualUser):
+    """A virtual user whose browser is driven by an AsyncWebDriver; its methods are coroutines."""
+
+    async def start(self):
+        """Starts the user's browser."""
+        self.driver = await self.driver_factory()
+
+    def login_page(self):
+        """Returns the async login page object for the user's browser."""
+        return AsyncLoginPage(self.driver, self.auth.timeout)
+
+    def pim_page(self):
+        """Returns the async PIM page object for the user's browser."""
+        return AsyncPIMPage(self.driver)
+
+    async def login(self):
+        """Logs in through the login form and keeps the session state in self.auth."""
+        await self.driver.delete_all_cookies()
+        await self.driver.get(self.auth.login_url)
+        await run_async_steps(_login_steps(self))
+        self.auth.login_count += 1
+
+    async def open_dashboard(self):
+        """Makes sure the browser is logged in and on the dashboard, like AuthSession.apply().
+
+        Recorded as a "setup" transaction.
+        """
+        with self.transaction("setup"):
+            if not self.auth.has_state():
+                await self.login()
+            else:
+                await run_async_steps(self.auth.inject_steps(self.driver))
+            await self.driver.get(self.auth.dashboard_url)
+            if "/auth/login" in await self.driver.current_url():
+                await self.login()
+                await self.driver.get(self.auth.dashboard_url)
+
+    async def stop(self):
+        """Deletes the employees this user left behind and closes its browser."""
+        driver, self.driver = self.driver, None
+        await asyncio.to_thread(super().stop)  # The REST API clean-up is synchronous
+        if driver is not None:
+            await driver.quit()
+
+
+def _async_scenario(flow):
+    """Returns the scenario coroutine function(user) that runs a flow with an AsyncVirtualUser."""
+    async def scenario(user):
+        return await run_async_steps(flow(user))
+
+    scenario.__doc__ = flow.__doc__
+    return scenario
+
+
+ASYNC_SCENARIOS = {name: _async_scenario(flow) for name, flow in FLOWS.items()}
+
+
+async def _run_async_user(user, delay, deadline, weights, scenarios, think_time, rng):
+    """Runs weighted scenarios for one async user from its ramp-up delay until the deadline."""
+    await asyncio.sleep(delay)
+    names = list(weights)
+    try:
+        await user.start()
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights=[weights[name] for name in names])[0]
+            try:
+                await scenarios[name](user)
+            except Exception:
+                # Already recorded as a failed transaction (set-up steps included): start over clean
+                user.auth.invalidate()
+            await asyncio.sleep(min(rng.uniform(0.5, 1.5) * think_time, max(0.0, deadline - time.monotonic())))
+    except Exception as e:
+        user.results.record("start_user", time.monotonic(), 0.0, _describe(e))  # The browser did not start
+    finally:
+        await user.stop()
+
+
+def _settings(weights, scenarios, credentials, seed):
+    """Checks the weights and fills in the default weights, credentials and seed."""
+    weights = dict(weights or DEFAULT_WEIGHTS)
+    unknown = set(weights) - set(scenarios)
+    if unknown:
+        raise ValueError(f"Unknown scenarios {sorted(unknown)}, expected some of {sorted(scenarios)}")
+    if credentials is None:
+        valid = first_row("login_data.csv", expected="pass")
+        credentials = (valid["username"], valid["password"])
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    return weights, credentials, seed
+
+
+def run_load_test(base_url=DEFAULT_BASE_URL, users=1, ramp_up=0.0, duration=60.0, weights=None,
+                  think_time=1.0, credentials=None, seed=None, driver_factory=None, headless=True, scenarios=SCENARIOS):
+    """Runs a load test and returns its LoadResults together with the elapsed seconds.
+    Args:
+        base_url: Root URL of the application (the public demo, or a local stand-in server).
+        users: Number of virtual users.
+        ramp_up: Seconds over which the users are started, evenly spaced.
+        duration: Seconds from the first user's start until users stop starting new scenarios.
+        weights: Scenario name -> relative frequency (DEFAULT_WEIGHTS if not given).
+        think_time: Mean pause in seconds between two scenarios of a user.
+        credentials: (username, password); the valid row of data/login_data.csv if not given.
+        seed: Seed of the scenario choices and generated employees (random if not given).
+        driver_factory: Callable returning a new WebDriver; headless Chrome if not given.
+        headless: Whether the default Chrome drivers run headless.
+        scenarios: Scenario name -> function(user).
+    """
+    weights, credentials, seed = _settings(weights, scenarios, credentials, seed)
+    if driver_factory is None:
+        driver_factory = lambda: webdriver.Chrome(options=headless_chrome_options(headless))
+
+    results = LoadResults()
+    deadline = results.started + duration
+    threads = []
+    for number in range(users):
+        user = VirtualUser(number, base_url, credentials, results,
+                           EmployeeDataGenerator(seed=seed, worker=number, workers=users), driver_factory)
+        thread = threading.Thread(target=_run_user, name=f"virtual-user-{number}",
+                                  args=(user, deadline, weights, scenarios, think_time, random.Random(seed + number)))
+        delay = results.started + number * ramp_up / users - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)  # Linear ramp-up
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, time.monotonic() - results.started
+
+
+def run_async_load_test(base_url=DEFAULT_BASE_URL, users=1, ramp_up=0.0, duration=60.0, weights=None,
+                        think_time=1.0, credentials=None, seed=None, headless=True, max_connections=2,
+                        scenarios=ASYNC_SCENARIOS):
+    """Runs a load test with coroutine users in this thread and returns its LoadResults and the elapsed seconds.
+
+    Arguments are those of run_load_test(), except that all browsers are sessions of one
+    ChromeDriverServer, each driven over max_connections keep-alive connections, and
+    scenarios are coroutine functions of an AsyncVirtualUser.
+    """
+    weights, credentials, seed = _settings(weights, scenarios, credentials, seed)
+
+    async def run():
+        async with ChromeDriverServer(headless, max_connections) as server:
+            results = LoadResults()
+            deadline = results.started + duration
+            await asyncio.gather(*(
+                _run_async_user(
+                    AsyncVirtualUser(number, base_url, credentials, results,
+                                     EmployeeDataGenerator(seed=seed, worker=number, workers=users), server.new_session),
+                    number * ramp_up / users, deadline, weights, scenarios, think_time, random.Random(seed + number),
+                )
+                for number in range(users)
+            ))
+            return results, time.monotonic() - results.started
+
+    return asyncio.run(run())
+
+
+def write_report(path, results, elapsed, interval, settings):
+    """Writes the summary, timeline and errors of a run as JSON."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as json_file:
+        json.dump({
+            "settings": settings,
+            "elapsed": elapsed,
+            "summary": results.summary(elapsed),
+            "timeline": results.timeline(interval),
+            "errors": results.errors(),
+        }, json_file, indent=2)
+    return path
+
+
+def _parse_weight(text):
+    name, _, weight = text.partition("=")
+    return name, float(weight or 1)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Load test Orange HRM with the page-object flows.")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="Application URL, e.g. a local stand-in server.")
+    parser.add_argument("--users", type=int, default=5, help="Number of virtual users.")
+    parser.add_argument("--ramp-up", type=float, default=30, help="Seconds over which users are started.")
+    parser.add_argument("--duration", type=float, default=120, help="Seconds the load is applied.")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean pause between scenarios of a user.")
+    parser.add_argument("--scenario", action="append", type=_parse_weight, metavar="NAME=WEIGHT",
+                        help=f"Scenario and its weight; repeat for several. Available: {', '.join(SCENARIOS)}.")
+    parser.add_argument("--interval", type=float, default=10, help="Seconds per interval of the timeline.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of scenario choices and employee data.")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows.")
+    parser.add_argument("--backend", choices=("threads", "asyncio"), default="threads",
+                        help="Drive each browser from a thread, or all of them from one asyncio event loop.")
+    parser.add_argument("--output", default=None, help="JSON report path (reports/load/<time>.json by default).")
+    args = parser.parse_args(argv)
+
+    weights = dict(args.scenario) if args.scenario else DEFAULT_WEIGHTS
+    run = run_async_load_test if args.backend == "asyncio" else run_load_test
+    results, elapsed = run(args.base_url, args.users, args.ramp_up, args.duration, weights,
+                           args.think_time, seed=args.seed, headless=not args.headed)
+
+    print(f"{'transaction':<18}{'count':>7}{'tps':>8}{'errors':>8}{'p50 s':>8}{'p95 s':>8}{'p99 s':>8}")
+    for name, stats in results.summary(elapsed).items():
+        print(f"{name:<18}{stats['count']:>7}{stats['throughput']:>8.2f}{stats['error_rate']:>8.1%}"
+              f"{stats['p50']:>8.2f}{stats['p95']:>8.2f}{stats['p99']:>8.2f}")
+    for error, count in results.errors().items():
+        print(f"{count:>5} x {error}")
+    output = args.output or os.path.join("reports", "load", f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    settings = {key: value for key, value in vars(args).items() if key != "scenario"} | {"weights": weights}
+    print(f"Report written to {write_report(output, results, elapsed, args.interval, settings)}")
+
+
+if __name__ == "__main__":
+    main()
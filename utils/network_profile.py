@@ -0,0 +1,211 @@
+"""
+network_profile.py
+
+This module defines the NetworkProfile class, which makes the browsers of the
+suite skip the downloads the tests never look at: fonts, images, avatars,
+media and third-party scripts. Matching requests are blocked through the CDP
+Network domain before they leave the browser, so page loads (after login, when
+opening PIM) finish sooner without changing anything the tests assert on.
+
+Static assets that are still needed (scripts, stylesheets) can be kept in a
+browser disk cache that outlives the drivers, so a recycled driver, or
+the next run, starts with a warm cache. Each running Chrome gets a folder of its
+own under the cache directory; a folder is reused once its Chrome has exited.
+
+The traffic of each test is read from the Chrome performance log: requests and
+bytes that went over the network, requests blocked, requests served from the
+cache, and the bytes saved by both (the size of a blocked or cached resource
+is known once it has been downloaded in some run with the same cache folder).
+
+Usage:
+    profile = NetworkProfile(block=PROFILES["lean"], cache_dir=".browser-cache")
+    pool = DriverPool(url, driver_factory=profile.driver_factory(headless=True))
+    with pool.lease() as driver:
+        profile.start_test(driver)
+        ...
+        print(profile.collect(driver))
+    profile.save_sizes()
+"""
+import itertools
+import json
+import os
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from utils.driver_pool import headless_chrome_options
+from utils.parallel import worker_id
+
+# URL patterns (CDP wildcards) of each class of resources that can be blocked
+RESOURCE_CLASSES = {
+    "font": ("*.woff2*", "*.woff*", "*.ttf*", "*.otf*", "*.eot*"),
+    "image": ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.ico*", "*.bmp*"),
+    "avatar": ("*/pim/viewPhoto/*", "*/buzz/photo/*"),
+    "media": ("*.mp4*", "*.webm*", "*.mp3*", "*.ogg*"),
+    "third_party": (
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*", "*facebook.net*", "*hotjar.com*", "*youtube.com*", "*ytimg.com*",
+    ),
+}
+
+# Named sets of resource classes for --network-profile
+PROFILES = {
+    "off": (),
+    "lean": ("font", "avatar", "media", "third_party"),
+    "minimal": ("font", "image", "avatar", "media", "third_party"),
+}
+
+# Owner of a cache folder whose Chrome is being started
+_STARTING = object()
+
+# Name of the file, in each cache folder, with the sizes of the resources downloaded so far
+_SIZES_FILE = "resource_sizes.json"
+
+
+def block_patterns(block):
+    """Expands resource class names to their URL patterns; anything else is taken as a pattern itself."""
+    patterns = []
+    for entry in block:
+        for pattern in RESOURCE_CLASSES.get(entry, (entry,)):
+            if pattern not in patterns:
+                patterns.append(pattern)
+    return patterns
+
+
+def _resource_key(url):
+    """Returns the URL a resource size is stored under (without query string or fragment)."""
+    return url.split("#", 1)[0].split("?", 1)[0]
+
+
+def _running(driver):
+    """Returns whether the browser of a driver is still running."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return process is not None and process.poll() is None
+
+
+class NetworkProfile:
+    """Request blocking and disk caching applied to the drivers of the suite, with per-test traffic totals."""
+
+    def __init__(self, block=(), cache_dir=None):
+        """Initializes the profile.
+        Args:
+            block: Resource class names (see RESOURCE_CLASSES) and URL patterns to block.
+            cache_dir: Folder for the browser disk caches, or None to keep Chrome's default per-profile cache.
+        """
+        self.patterns = block_patterns(block)
+        self.cache_dir = cache_dir
+        self.sizes = {}  # Resource URL -> bytes of its largest download
+        self._cache_folders = {}  # Cache folder -> driver using it (or _STARTING)
+        self._lock = threading.Lock()
+        if cache_dir:
+            self._load_sizes()
+
+    def _load_sizes(self):
+        """Reads the resource sizes recorded in the cache folders."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in sorted(os.listdir(self.cache_dir)):
+            path = os.path.join(self.cache_dir, name, _SIZES_FILE)
+            if os.path.isfile(path):
+                with open(path) as sizes_file:
+                    self.sizes.update(json.load(sizes_file))
+
+    def save_sizes(self):
+        """Writes the resource sizes known to this process to the cache folder of the worker."""
+        if not self.cache_dir or not self.sizes:
+            return None
+        path = os.path.join(self.cache_dir, f"{worker_id()}-0", _SIZES_FILE)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as sizes_file:
+            json.dump(self.sizes, sizes_file, indent=2, sort_keys=True)
+        return path
+
+    def cache_folder(self):
+        """Reserves a cache folder of this worker that no running browser uses, and returns it."""
+        with self._lock:
+            for number in itertools.count():
+                folder = os.path.join(self.cache_dir, f"{worker_id()}-{number}")
+                owner = self._cache_folders.get(folder)
+                if owner is None or (owner is not _STARTING and not _running(owner)):
+                    self._cache_folders[folder] = _STARTING
+                    return folder
+
+    def chrome_options(self, options, cache_folder=None):
+        """Adds the disk cache folder and the network events of the performance log to Chrome options."""
+        if cache_folder:
+            options.add_argument(f"--disk-cache-dir={os.path.abspath(cache_folder)}")
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        return options
+
+    def apply(self, driver):
+        """Turns on request blocking in a running browser."""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def driver_factory(self, headless=True):
+        """Returns a callable starting Chrome with this profile applied, for DriverPool."""
+        def factory():
+            folder = self.cache_folder() if self.cache_dir else None
+            try:
+                driver = webdriver.Chrome(options=self.chrome_options(headless_chrome_options(headless), folder))
+            except WebDriverException:
+                with self._lock:
+                    self._cache_folders.pop(folder, None)  # Free the folder again
+                raise
+            if folder:
+                with self._lock:
+                    self._cache_folders[folder] = driver
+            self.apply(driver)
+            return driver
+        return factory
+
+    def start_test(self, driver):
+        """Discards the traffic logged before the test, such as the reset of a pooled driver."""
+        try:
+            driver.get_log("performance")
+        except WebDriverException:
+            pass
+
+    def collect(self, driver):
+        """Returns the traffic of the driver since start_test() or the previous collect()."""
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            return None
+        return self.traffic(json.loads(entry["message"])["message"] for entry in entries)
+
+    def traffic(self, events):
+        """Adds up CDP Network events into the totals of one test.
+        Returns:
+            dict: requests and bytes downloaded, requests blocked and served from cache, and bytes saved.
+        """
+        urls = {}  # Request id -> URL
+        cached = set()  # Ids of requests served from the memory or disk cache
+        totals = {"requests": 0, "bytes": 0, "blocked": 0, "cached": 0, "bytes_saved": 0}
+        for event in events:
+            method, params = event["method"], event.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.requestServedFromCache":
+                cached.add(params["requestId"])
+            elif method == "Network.responseReceived" and params["response"].get("fromDiskCache"):
+                cached.add(params["requestId"])
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                totals["blocked"] += 1
+                totals["bytes_saved"] += self.sizes.get(_resource_key(urls.get(params["requestId"], "")), 0)
+            elif method == "Network.loadingFinished":
+                url = urls.get(params["requestId"])
+                if url is None or url.startswith("data:"):
+                    continue
+                if params["requestId"] in cached:
+                    totals["cached"] += 1
+                    totals["bytes_saved"] += self.sizes.get(_resource_key(url), 0)
+                else:
+                    size = int(params.get("encodedDataLength", 0))
+                    totals["requests"] += 1
+                    totals["bytes"] += size
+                    key = _resource_key(url)
+                    self.sizes[key] = max(self.sizes.get(key, 0), size)  # A revalidation only transfers headers
+        return totals
@@ -0,0 +1,71 @@
+"""
+parallel.py
+
+This module contains the helpers used when the suite runs on several pytest-xdist
+workers at once. It identifies the current worker, gives each worker its own
+namespace for the test data it creates, and orders tests longest-first using the
+durations recorded on earlier runs.
+
+Functions:
+    - worker_id(): Returns the xdist worker id, e.g. "gw0", or "main" without xdist.
+    - worker_index(): Returns the numeric index of the current worker.
+    - worker_namespace(): Returns the tag used to mark employees created by this worker.
+    - longest_first(items, durations): Orders test items by descending recorded duration.
+    - merge_durations(previous, current): Combines the durations of the last run with older ones.
+"""
+import os
+
+# Cache key under which test durations are kept between runs (in .pytest_cache)
+DURATIONS_CACHE_KEY = "orangehrm/durations"
+
+
+def worker_id():
+    """Returns the xdist worker id, e.g. "gw0", or "main" when not running under xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def worker_index():
+    """Returns the number of the current worker (0 when not running under xdist)."""
+    current = worker_id()
+    return int(current[2:]) if current.startswith("gw") else 0
+
+
+def worker_namespace():
+    """Returns the tag added to the records created by the current worker."""
+    return f"w{worker_index()}"
+
+
+def longest_first(items, durations):
+    """Orders test items so the slowest known tests are scheduled first.
+
+    Tests without a recorded duration go first, in collection order, because they
+    may be the slowest of all. Ties keep their collection order, so every worker
+    computes exactly the same order from the same durations.
+    Args:
+        items: Collected pytest items.
+        durations: Mapping of node id to seconds from earlier runs.
+    Returns:
+        list: The reordered items.
+    """
+    def key(indexed):
+        index, item = indexed
+        duration = durations.get(item.nodeid)
+        return (0 if duration is None else 1, -(duration or 0.0), index)
+
+    return [item for _, item in sorted(enumerate(items), key=key)]
+
+
+def merge_durations(previous, current, weight=0.5):
+    """Blends the durations of this run into the ones recorded before.
+    Args:
+        previous: Mapping of node id to seconds from earlier runs.
+        current: Mapping of node id to seconds measured in this run.
+        weight: Share of the new measurement in the blended value.
+    Returns:
+        dict: The updated durations.
+    """
+    merged = dict(previous)
+    for nodeid, seconds in current.items():
+        old = merged.get(nodeid)
+        merged[nodeid] = seconds if old is None else round(weight * seconds + (1 - weight) * old, 3)
+    return merged
@@ -0,0 +1,301 @@
+"""
+perf_metrics.py
+
+This module records browser-side performance metrics while the functional tests
+run, so the suite doubles as a performance regression check of the application.
+
+At each checkpoint (a page transition or a key action of a page object) the
+PerfRecorder collects, in one script call:
+
+    - Navigation Timing of a newly loaded document (TTFB, DOMContentLoaded, load),
+    - the Resource Timing entries added since the last checkpoint, with the
+      latency of every XHR/fetch request made by the application,
+    - long tasks (main-thread work over 50 ms) since the last checkpoint,
+
+and, on Chrome, the change of the CDP Performance.getMetrics counters (script,
+layout and task duration) since the previous checkpoint of the same browser.
+
+The samples of a run are reduced to one median per metric, stored per run and
+compared with a baseline; a metric that got slower than the baseline by more
+than the threshold is reported as a regression.
+
+Page objects call perf_checkpoint() and perf_transition(); both do nothing
+unless a recorder has been activated.
+
+Usage:
+    recorder = PerfRecorder()
+    activate(recorder)
+    with perf_transition(driver, "login", LOGIN_OUTCOMES):
+        login_button.click()
+    perf_checkpoint(driver, "toast")
+    recorder.write_json("reports/perf/current/main.json")
+    summary = summarize(load_samples("reports/perf/current"))
+    regressions = compare(load_summary("reports/perf/baseline.json"), summary)
+"""
+import contextlib
+import json
+import os
+import re
+import statistics
+import threading
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.waits import EventWait, outcome_triples
+
+# Installs the long-task observer once per document and returns everything recorded since the last call
+_COLLECT_JS = """
+if (!window.__perf) {
+    window.__perf = {resourcesRead: 0, longTasks: [], navigationRead: false};
+    performance.setResourceTimingBufferSize(2000);
+    try {
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) window.__perf.longTasks.push(entry.duration);
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) {}
+}
+const perf = window.__perf;
+const result = {url: location.href, timeOrigin: performance.timeOrigin, navigation: null};
+const navigation = performance.getEntriesByType('navigation')[0];
+if (!perf.navigationRead && navigation && navigation.loadEventEnd > 0) {
+    perf.navigationRead = true;
+    result.navigation = {
+        ttfb_ms: navigation.responseStart,
+        dom_content_loaded_ms: navigation.domContentLoadedEventEnd,
+        load_ms: navigation.loadEventEnd,
+        transfer_bytes: navigation.transferSize,
+    };
+}
+const resources = performance.getEntriesByType('resource');
+const added = resources.slice(perf.resourcesRead);
+perf.resourcesRead = resources.length;
+result.resources = {count: added.length, transfer_bytes: added.reduce((sum, entry) => sum + entry.transferSize, 0)};
+result.xhr = added
+    .filter(entry => entry.initiatorType === 'xmlhttprequest' || entry.initiatorType === 'fetch')
+    .map(entry => ({url: entry.name, duration_ms: entry.duration}));
+result.longTasks = perf.longTasks.splice(0);
+return result;
+"""
+
+# True once a document other than the one with timeOrigin arguments[0] has fired its load event, or while
+# the action stays on that document, once it shows one of the outcomes in arguments[1] ([name, selector, shown]
+# triples of pages.waits.outcome_triples()); elements the wait ignores since it was armed do not count
+_ACTION_DONE_JS = """
+const [previousOrigin, outcomes] = arguments;
+if (performance.timeOrigin !== previousOrigin) {
+    const navigation = performance.getEntriesByType('navigation')[0];
+    return !!navigation && navigation.loadEventEnd > 0;
+}
+const ignored = (window.__oxdWatch && window.__oxdWatch.ignored) || {};
+return outcomes.some(([name, selector, shown]) => Array.from(document.querySelectorAll(selector)).some(
+    node => node.getClientRects().length > 0 && (shown || !ignored[selector] || !ignored[selector].has(node))
+));
+"""
+
+# CDP Performance.getMetrics counters (in seconds) recorded as their change since the previous checkpoint
+CDP_DURATIONS = {
+    "TaskDuration": "task_ms",
+    "ScriptDuration": "script_ms",
+    "LayoutDuration": "layout_ms",
+    "RecalcStyleDuration": "recalc_style_ms",
+}
+
+# Digit runs in XHR paths (employee numbers, IDs) are grouped under one metric
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# The active recorder, or None when performance recording is off
+_active = None
+
+
+class PerfRecorder:
+    """Collects performance samples at page-object checkpoints."""
+
+    def __init__(self, navigation_timeout=15):
+        """Initializes the recorder.
+        Args:
+            navigation_timeout: Seconds a transition waits for the next document to finish loading.
+        """
+        self.navigation_timeout = navigation_timeout
+        self.samples = []  # One dict per checkpoint
+        self.current_test = None
+        self._cdp_enabled = set()  # Session ids with the CDP Performance domain enabled
+        self._cdp_previous = {}  # session id -> counters at the previous checkpoint
+        self._lock = threading.Lock()
+
+    def start_test(self, test_id):
+        """Attributes the following samples to the given test."""
+        self.current_test = test_id
+
+    def _cdp_metrics(self, driver):
+        """Returns the change of the CDP duration counters since the previous checkpoint, or {} off Chrome."""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return {}
+        try:
+            if driver.session_id not in self._cdp_enabled:
+                driver.execute_cdp_cmd("Performance.enable", {})
+                self._cdp_enabled.add(driver.session_id)
+            counters = {metric["name"]: metric["value"] for metric in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+        except WebDriverException:
+            return {}
+        previous = self._cdp_previous.get(driver.session_id, {})
+        self._cdp_previous[driver.session_id] = counters
+        metrics = {
+            metric: (counters.get(name, 0.0) - previous.get(name, 0.0)) * 1000 for name, metric in CDP_DURATIONS.items()
+        }
+        metrics["js_heap_bytes"] = counters.get("JSHeapUsedSize", 0)
+        return metrics
+
+    def checkpoint(self, driver, label):
+        """Records the metrics collected by the browser since the previous checkpoint."""
+        try:
+            collected = driver.execute_script(_COLLECT_JS)
+        except WebDriverException:
+            return None  # The page is navigating; the next checkpoint picks the entries up
+        sample = {
+            "test": self.current_test,
+            "label": label,
+            "url": collected["url"],
+            "navigation": collected["navigation"],
+            "resources": collected["resources"],
+            "xhr": collected["xhr"],
+            "long_tasks": {"count": len(collected["longTasks"]), "total_ms": sum(collected["longTasks"])},
+            "cdp": self._cdp_metrics(driver),
+        }
+        with self._lock:
+            self.samples.append(sample)
+        return sample
+
+    @contextlib.contextmanager
+    def transition(self, driver, label, outcomes=None):
+        """Records a checkpoint once the document loaded by the wrapped action has finished loading.
+
+        Args:
+            driver: The browser the action runs in.
+            label: Name of the checkpoint.
+            outcomes: Outcome name -> CSS selector of the action's outcomes (as for outcome_appeared()).
+                An action rejected without leaving the page, such as a login stopped by field
+                validation, is recorded as soon as one of them is shown instead of after the
+                navigation_timeout.
+        """
+        pairs = outcome_triples(outcomes or {})
+        try:
+            previous_origin = driver.execute_script("return performance.timeOrigin;")
+        except WebDriverException:
+            previous_origin = None
+        yield
+        try:
+            EventWait(driver, self.navigation_timeout, ignored_exceptions=(WebDriverException,)).until(
+                lambda d: d.execute_script(_ACTION_DONE_JS, previous_origin, pairs)
+            )
+        except TimeoutException:
+            pass  # No new document and no outcome (e.g. an in-page update): record what there is
+        self.checkpoint(driver, label)
+
+    def write_json(self, path):
+        """Writes the samples of this process to a JSON file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as json_file:
+            json.dump(self.samples, json_file, indent=2)
+        return path
+
+
+def activate(recorder):
+    """Makes recorder the target of perf_checkpoint() and perf_transition()."""
+    global _active
+    _active = recorder
+
+
+def deactivate():
+    """Turns performance recording off again."""
+    global _active
+    _active = None
+
+
+def perf_checkpoint(driver, label):
+    """Records a checkpoint if performance recording is on."""
+    if _active is not None:
+        _active.checkpoint(driver, label)
+
+
+def perf_transition(driver, label, outcomes=None):
+    """Context manager around an action that loads a new page; records it if performance recording is on."""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.transition(driver, label, outcomes)
+
+
+def xhr_metric(url):
+    """Returns the metric name of an XHR request: its path, with numeric segments replaced by {id}."""
+    path = url.split("://", 1)[-1].split("?", 1)[0]
+    path = path[path.find("/"):] if "/" in path else "/"
+    return "xhr " + _ID_SEGMENT.sub("/{id}", path)
+
+
+def summarize(samples):
+    """Reduces samples to the median of each metric, e.g. {"login.load_ms": {"median": 812.0, "count": 3}}."""
+    values = {}
+
+    def add(name, value):
+        if value is not None:
+            values.setdefault(name, []).append(value)
+
+    for sample in samples:
+        label = sample["label"]
+        for name, value in (sample.get("navigation") or {}).items():
+            add(f"{label}.{name}", value)
+        add(f"{label}.long_tasks_ms", sample["long_tasks"]["total_ms"])
+        add(f"{label}.resource_bytes", sample["resources"]["transfer_bytes"])
+        for name, value in sample.get("cdp", {}).items():
+            add(f"{label}.cdp_{name}", value)
+        for request in sample["xhr"]:
+            add(xhr_metric(request["url"]), request["duration_ms"])
+    return {name: {"median": statistics.median(series), "count": len(series)} for name, series in sorted(values.items())}
+
+
+def compare(baseline, current, threshold=0.2, min_delta_ms=50):
+    """Returns the latency metrics that got slower than the baseline.
+    Args:
+        baseline: Summary of the reference run, as returned by summarize().
+        current: Summary of this run.
+        threshold: Relative slowdown (0.2 = 20 %) above which a metric is reported.
+        min_delta_ms: Slowdowns smaller than this many milliseconds are ignored as noise.
+    Returns:
+        list: Dicts with metric, baseline, current and change, the worst regression first.
+    """
+    regressions = []
+    for name, stats in current.items():
+        reference = baseline.get(name)
+        if reference is None or not (name.endswith("_ms") or name.startswith("xhr ")):
+            continue  # Only latencies are compared, sizes and counters are informational
+        before, after = reference["median"], stats["median"]
+        if after - before > min_delta_ms and after > before * (1 + threshold):
+            regressions.append({"metric": name, "baseline": before, "current": after,
+                                "change": after / before - 1 if before else float("inf")})
+    return sorted(regressions, key=lambda regression: regression["change"], reverse=True)
+
+
+def load_samples(directory):
+    """Returns the samples of every JSON file in a directory (one file per worker)."""
+    samples = []
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name)) as json_file:
+                    samples.extend(json.load(json_file))
+    return samples
+
+
+def load_summary(path):
+    """Returns the summary stored in a JSON file, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def write_summary(path, summary):
+    """Stores a summary as JSON."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as json_file:
+        json.dump(summary, json_file, indent=2, sort_keys=True)
+    return path
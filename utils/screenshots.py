@@ -0,0 +1,164 @@
+"""
+screenshots.py
+
+This module defines the ScreenshotWriter class, which saves test screenshots on a
+background thread so the test thread only pays for taking the screenshot, never
+for encoding it or writing it to disk.
+
+Every file name carries the run, the worker, the test and a per-process counter,
+so two captures in the same second, from parallel workers or from an earlier run
+never overwrite each other.
+Frames identical to one already saved (same content hash) are skipped. In
+"on-failure" mode the frames of a test are kept in memory and only written if
+the test fails. Frames can optionally be stored as lossy JPEG (needs Pillow;
+without it the writer warns when it is created and keeps PNG).
+Frames that could not be saved are kept with their error until pop_failures()
+is called, so the test suite can report them.
+
+Usage:
+    writer = ScreenshotWriter("screenshots", mode="always")
+    writer.capture(driver, "login_success", test_id="test_login_with_valid_credentials")
+    writer.finish_test("test_login_with_valid_credentials", failed=False)
+    writer.close()  # Waits for pending writes
+    failures = writer.pop_failures()  # (file name, exception) of the frames that could not be saved
+"""
+import hashlib
+import io
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+import warnings
+
+from utils.parallel import worker_id
+
+MODES = ("always", "on-failure", "off")
+
+# Characters kept in file names; everything else becomes "_"
+_UNSAFE_CHARACTERS = re.compile(r"[^\w.-]+")
+
+
+def _pillow_available():
+    """Returns whether Pillow, needed for JPEG frames, can be imported."""
+    try:
+        import PIL  # Only checks that it is installed
+    except ImportError:
+        return False
+    return True
+
+
+class ScreenshotWriter:
+    """Background writer of deduplicated, collision-free screenshots."""
+
+    def __init__(self, directory="screenshots", mode="always", jpeg_quality=None, run_id=None):
+        """Initializes the writer and starts its thread.
+        Args:
+            directory: Folder the screenshots are written to.
+            mode: "always", "on-failure" (only keep frames of failed tests) or "off".
+            jpeg_quality: If set (1-95), frames are re-encoded as JPEG with this quality.
+                Needs Pillow; without it a RuntimeWarning is issued and frames stay PNG.
+            run_id: Identifies the run in the file names; the time the writer was created if not given.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown screenshot mode {mode!r}, expected one of {MODES}")
+        self.directory = directory
+        self.mode = mode
+        self.jpeg_quality = jpeg_quality
+        if jpeg_quality and not _pillow_available():
+            warnings.warn("Screenshots are kept as PNG: a JPEG quality was set but Pillow is not installed",
+                          RuntimeWarning)
+            self.jpeg_quality = None
+        self.worker = worker_id()
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        self.saved = []  # Paths of the files written so far
+        self.skipped_duplicates = 0
+        self._counter = itertools.count(1)
+        self._seen_hashes = set()
+        self._failures = []  # (file name, exception) of the frames that could not be saved
+        self._pending = {}  # test_id -> frames held back in on-failure mode
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def capture(self, driver, prefix, test_id="session"):
+        """Takes a screenshot and hands it to the writer thread (or holds it until the test ends).
+
+        Only the WebDriver call happens on the calling thread.
+        """
+        if self.mode == "off":
+            return
+        frame = (prefix, test_id, next(self._counter), driver.get_screenshot_as_png())
+        if self.mode == "on-failure":
+            with self._lock:
+                self._pending.setdefault(test_id, []).append(frame)
+        else:
+            self._queue.put(frame)
+
+    def finish_test(self, test_id, failed):
+        """Writes the frames held back for a test if it failed, otherwise drops them."""
+        with self._lock:
+            frames = self._pending.pop(test_id, [])
+        if failed:
+            for frame in frames:
+                self._queue.put(frame)
+
+    def _run(self):
+        """Writer thread: deduplicates, encodes and writes queued frames."""
+        while True:
+            frame = self._queue.get()
+            try:
+                if frame is None:
+                    return
+                self._write(*frame)
+            except Exception as e:
+                with self._lock:  # Never let one bad frame stop the writer; the suite reports it
+                    self._failures.append((self._file_name(*frame[:3]), e))
+            finally:
+                self._queue.task_done()
+
+    def _write(self, prefix, test_id, number, png_bytes):
+        digest = hashlib.sha1(png_bytes).hexdigest()
+        if digest in self._seen_hashes:
+            self.skipped_duplicates += 1
+            return
+        self._seen_hashes.add(digest)
+
+        data, extension = png_bytes, "png"
+        if self.jpeg_quality:
+            data, extension = self._to_jpeg(png_bytes)
+
+        name = self._file_name(prefix, test_id, number)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{name}.{extension}")
+        with open(path, "wb") as screenshot_file:
+            screenshot_file.write(data)
+        self.saved.append(path)
+
+    def _file_name(self, prefix, test_id, number):
+        """Returns the file name of a frame, without its extension."""
+        return _UNSAFE_CHARACTERS.sub("_", f"{prefix}_{self.run_id}_{self.worker}_{test_id}_{number:05d}")
+
+    def pop_failures(self):
+        """Returns the frames that could not be saved since the last call, as (file name, exception) pairs."""
+        with self._lock:
+            failures, self._failures = self._failures, []
+        return failures
+
+    def _to_jpeg(self, png_bytes):
+        """Re-encodes a PNG frame as JPEG."""
+        from PIL import Image
+        output = io.BytesIO()
+        Image.open(io.BytesIO(png_bytes)).convert("RGB").save(output, "JPEG", quality=self.jpeg_quality, optimize=True)
+        return output.getvalue(), "jpg"
+
+    def flush(self):
+        """Blocks until every queued frame has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Writes the remaining frames and stops the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
@@ -0,0 +1,483 @@
+/*
+ * app.js
+ *
+ * Frontend of the Orange HRM stand-in server. It reproduces the behaviour the
+ * page objects rely on: client-side validation messages, toasts, the employee
+ * table with selection, bulk delete and pagination, the oxd-select dropdowns and
+ * the forms that save through the REST API.
+ */
+(function () {
+    'use strict';
+
+    const API = '/web/index.php/api/v2';
+    const PAGE_SIZE = 50;
+    const TOAST_MS = 3000;
+    const FLASH_KEY = 'standInToast';
+    const MAX_PICTURE_BYTES = 1024 * 1024;
+    const PICTURE_TYPES = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif'];
+
+    function element(tag, className, text) {
+        const node = document.createElement(tag);
+        if (className) node.className = className;
+        if (text !== undefined && text !== null) node.textContent = text;
+        return node;
+    }
+
+    async function api(method, path, body) {
+        const response = await fetch(API + path, {
+            method: method,
+            credentials: 'same-origin',
+            headers: {'Accept': 'application/json', 'Content-Type': 'application/json'},
+            body: body === undefined ? undefined : JSON.stringify(body),
+        });
+        if (response.status === 401) {
+            window.location.assign('/web/index.php/auth/login');
+            throw new Error('Session expired');
+        }
+        const payload = await response.json().catch(() => ({}));
+        return {ok: response.ok, status: response.status, data: payload.data, meta: payload.meta, error: payload.error};
+    }
+
+    // --- toasts ---
+
+    function toast(type, message) {
+        const titles = {success: 'Success', error: 'Error', info: 'Info'};
+        const container = document.getElementById('oxd-toaster_1');
+        if (!container) return;
+        const item = element('div', `oxd-toast oxd-toast--${type} oxd-toast-container--toast`);
+        const start = element('div', 'oxd-toast-start');
+        const content = element('div', `oxd-toast-content oxd-toast-content--${type}`);
+        content.appendChild(element('p', 'oxd-text oxd-text--p oxd-text--toast-title oxd-toast-content-text', titles[type]));
+        content.appendChild(element('p', 'oxd-text oxd-text--p oxd-text--toast-message oxd-toast-content-text', message));
+        start.appendChild(content);
+        item.appendChild(start);
+        container.appendChild(item);
+        setTimeout(() => item.remove(), TOAST_MS);
+    }
+
+    // Keeps a toast on screen across the page load that follows a save
+    function flashToast(type, message) {
+        sessionStorage.setItem(FLASH_KEY, JSON.stringify({type: type, message: message, until: Date.now() + TOAST_MS}));
+    }
+
+    function showFlashedToast() {
+        const stored = sessionStorage.getItem(FLASH_KEY);
+        if (!stored) return;
+        sessionStorage.removeItem(FLASH_KEY);
+        const flashed = JSON.parse(stored);
+        if (flashed.until > Date.now()) toast(flashed.type, flashed.message);
+    }
+
+    // --- validation messages ---
+
+    function clearErrors(form) {
+        form.querySelectorAll('.oxd-input-field-error-message').forEach(message => message.remove());
+        form.querySelectorAll('.oxd-input--error').forEach(input => input.classList.remove('oxd-input--error'));
+    }
+
+    function showError(input, message) {
+        if (!input) return;
+        input.classList.add('oxd-input--error');
+        const group = input.closest('.oxd-input-group');
+        group.appendChild(element('span', 'oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message', message));
+    }
+
+    function clearError(input) {
+        const group = input.closest('.oxd-input-group');
+        group.querySelectorAll('.oxd-input-field-error-message').forEach(message => message.remove());
+        input.classList.remove('oxd-input--error');
+    }
+
+    function showApiErrors(form, result) {
+        const errors = (result.error && result.error.data && result.error.data.invalidParamKeys) || {};
+        const fields = Object.keys(errors);
+        fields.forEach(field => showError(form.querySelector(`[name="${field}"]`), errors[field]));
+        if (!fields.length) toast('error', (result.error && result.error.message) || 'Unexpected Error!');
+    }
+
+    function requireFields(form, names) {
+        let valid = true;
+        for (const name of names) {
+            const input = form.querySelector(`[name="${name}"]`);
+            if (!input.value.trim()) {
+                showError(input, 'Required');
+                valid = false;
+            }
+        }
+        return valid;
+    }
+
+    // --- login ---
+
+    function initLogin() {
+        const form = document.getElementById('login-form');
+        form.addEventListener('submit', event => {
+            clearErrors(form);
+            if (!requireFields(form, ['username', 'password'])) event.preventDefault();
+        });
+    }
+
+    // --- employee list ---
+
+    function initEmployeeList() {
+        const rows = document.getElementById('employee-rows');
+        const pagination = document.getElementById('pagination');
+        const bulkActions = document.getElementById('bulk-actions');
+        const selectAll = document.getElementById('select-all');
+        const search = document.getElementById('employee-search');
+        const state = {page: 1, filters: {}};
+
+        function selectedIds() {
+            return Array.from(rows.querySelectorAll("input[type='checkbox']:checked"), input => parseInt(input.value, 10));
+        }
+
+        function updateSelection() {
+            const count = selectedIds().length;
+            bulkActions.hidden = count === 0;
+            document.getElementById('selected-count').textContent = `(${count}) Record${count === 1 ? '' : 's'} Selected`;
+        }
+
+        function checkboxCell(value) {
+            const cell = element('div', 'oxd-table-cell oxd-padding-cell');
+            cell.setAttribute('role', 'cell');
+            const wrapper = element('div', 'oxd-table-card-cell-checkbox');
+            const checkboxWrapper = element('div', 'oxd-checkbox-wrapper');
+            const label = element('label');
+            const input = element('input');
+            input.type = 'checkbox';
+            input.value = value;
+            label.appendChild(input);
+            label.appendChild(element('span', 'oxd-checkbox-input'));
+            checkboxWrapper.appendChild(label);
+            wrapper.appendChild(checkboxWrapper);
+            cell.appendChild(wrapper);
+            return cell;
+        }
+
+        function textCell(text) {
+            const cell = element('div', 'oxd-table-cell oxd-padding-cell');
+            cell.setAttribute('role', 'cell');
+            cell.appendChild(element('div', null, text || ''));
+            return cell;
+        }
+
+        function renderRows(employees) {
+            rows.replaceChildren();
+            for (const employee of employees) {
+                const card = element('div', 'oxd-table-card');
+                const row = element('div', 'oxd-table-row oxd-table-row--with-border oxd-table-row--clickable');
+                row.setAttribute('role', 'row');
+                row.dataset.empNumber = employee.empNumber;
+                row.appendChild(checkboxCell(employee.empNumber));
+                row.appendChild(textCell(employee.employeeId));
+                row.appendChild(textCell([employee.firstName, employee.middleName].filter(Boolean).join(' ')));
+                row.appendChild(textCell(employee.lastName));
+                row.appendChild(textCell(employee.jobTitle && employee.jobTitle.title));
+                row.appendChild(textCell(employee.empStatus && employee.empStatus.name));
+                row.appendChild(textCell(employee.subunit && employee.subunit.name));
+                row.appendChild(textCell(''));
+                const actions = element('div', 'oxd-table-cell oxd-padding-cell');
+                actions.setAttribute('role', 'cell');
+                const trash = element('button', 'oxd-icon-button oxd-table-cell-action-space');
+                trash.type = 'button';
+                trash.dataset.delete = employee.empNumber;
+                trash.appendChild(element('i', 'oxd-icon bi-trash'));
+                actions.appendChild(trash);
+                row.appendChild(actions);
+                card.appendChild(row);
+                rows.appendChild(card);
+            }
+        }
+
+        function pageButton(className, content) {
+            const item = element('li', 'oxd-pagination-page-item-wrapper');
+            const button = element('button', `oxd-pagination-page-item ${className}`);
+            button.type = 'button';
+            if (typeof content === 'string') button.textContent = content;
+            else button.appendChild(content);
+            item.appendChild(button);
+            return [item, button];
+        }
+
+        function renderPagination(total) {
+            pagination.replaceChildren();
+            const pages = Math.ceil(total / PAGE_SIZE);
+            if (pages <= 1) return;
+            const list = element('ul', 'oxd-pagination__ul');
+            if (state.page > 1) {
+                const [item, button] = pageButton('oxd-pagination-page-item--previous-next', element('i', 'oxd-icon bi-chevron-left'));
+                button.addEventListener('click', () => load(state.page - 1));
+                list.appendChild(item);
+            }
+            for (let page = 1; page <= pages; page++) {
+                const selected = page === state.page ? ' oxd-pagination-page-item--selected' : '';
+                const [item, button] = pageButton(`oxd-pagination-page-item--page${selected}`, String(page));
+                button.addEventListener('click', () => load(page));
+                list.appendChild(item);
+            }
+            if (state.page < pages) {
+                const [item, button] = pageButton('oxd-pagination-page-item--previous-next', element('i', 'oxd-icon bi-chevron-right'));
+                button.addEventListener('click', () => load(state.page + 1));
+                list.appendChild(item);
+            }
+            pagination.appendChild(list);
+        }
+
+        async function load(page) {
+            state.page = page;
+            const query = new URLSearchParams({limit: PAGE_SIZE, offset: (page - 1) * PAGE_SIZE});
+            for (const [name, value] of Object.entries(state.filters)) if (value) query.set(name, value);
+            const result = await api('GET', `/pim/employees?${query}`);
+            if (!result.ok) return showApiErrors(search, result);
+            renderRows(result.data);
+            renderPagination(result.meta.total);
+            const total = result.meta.total;
+            document.getElementById('record-count').textContent =
+                total ? `(${total}) Record${total === 1 ? '' : 's'} Found` : 'No Records Found';
+            selectAll.checked = false;
+            updateSelection();
+        }
+
+        function confirmDelete(ids) {
+            const container = element('div', 'oxd-dialog-container-default');
+            const sheet = element('div', 'oxd-dialog-sheet oxd-dialog-sheet--shadow');
+            sheet.setAttribute('role', 'document');
+            const header = element('div', 'orangehrm-modal-header');
+            header.appendChild(element('p', 'oxd-text oxd-text--p oxd-text--card-title', 'Are you Sure?'));
+            const body = element('div', 'orangehrm-text-center-align');
+            body.appendChild(element('p', 'oxd-text oxd-text--p oxd-text--card-body',
+                'The selected record will be permanently deleted. Are you sure you want to continue?'));
+            const footer = element('div', 'orangehrm-modal-footer');
+            const cancel = element('button', 'oxd-button oxd-button--medium oxd-button--ghost orangehrm-button-margin', ' No, Cancel ');
+            const confirm = element('button', 'oxd-button oxd-button--medium oxd-button--label-danger orangehrm-button-margin', ' Yes, Delete ');
+            cancel.type = confirm.type = 'button';
+            footer.appendChild(cancel);
+            footer.appendChild(confirm);
+            sheet.appendChild(header);
+            sheet.appendChild(body);
+            sheet.appendChild(footer);
+            container.appendChild(sheet);
+            document.body.appendChild(container);
+            cancel.addEventListener('click', () => container.remove());
+            confirm.addEventListener('click', async () => {
+                container.remove();
+                const result = await api('DELETE', '/pim/employees', {ids: ids});
+                if (!result.ok) return toast('error', 'Records Not Found');
+                toast('success', 'Successfully Deleted');
+                await load(1);
+            });
+        }
+
+        rows.addEventListener('click', event => {
+            const trash = event.target.closest('[data-delete]');
+            if (trash) return confirmDelete([parseInt(trash.dataset.delete, 10)]);
+            if (event.target.closest('.oxd-table-card-cell-checkbox')) return;
+            const row = event.target.closest("[role='row']");
+            if (row) window.location.assign(`/web/index.php/pim/viewPersonalDetails/empNumber/${row.dataset.empNumber}`);
+        });
+        rows.addEventListener('change', updateSelection);
+        selectAll.addEventListener('change', () => {
+            rows.querySelectorAll("input[type='checkbox']").forEach(input => { input.checked = selectAll.checked; });
+            updateSelection();
+        });
+        document.getElementById('delete-selected').addEventListener('click', () => confirmDelete(selectedIds()));
+        search.addEventListener('submit', event => {
+            event.preventDefault();
+            state.filters = {
+                nameOrId: search.querySelector('[name="nameOrId"]').value.trim(),
+                employeeId: search.querySelector('[name="employeeId"]').value.trim(),
+            };
+            load(1);
+        });
+        search.addEventListener('reset', () => {
+            state.filters = {};
+            setTimeout(() => load(1));
+        });
+        load(1);
+    }
+
+    // --- add employee ---
+
+    function readPicture(input) {
+        const file = input.files && input.files[0];
+        if (!file) return Promise.resolve(null);
+        return new Promise((resolve, reject) => {
+            const reader = new FileReader();
+            reader.onload = () => resolve({
+                name: file.name, type: file.type, size: file.size, base64: String(reader.result).split(',')[1] || '',
+            });
+            reader.onerror = () => reject(reader.error);
+            reader.readAsDataURL(file);
+        });
+    }
+
+    function pictureError(input) {
+        const file = input.files && input.files[0];
+        if (!file) return null;
+        if (!PICTURE_TYPES.includes(file.type)) return 'File type not allowed';
+        if (file.size > MAX_PICTURE_BYTES) return 'Attachment Size Exceeded';
+        return null;
+    }
+
+    // Like Orange HRM, the Employee Id is checked while it is typed, so a duplicate is shown before saving
+    const ID_CHECK_DELAY_MS = 250;
+
+    function watchEmployeeId(input) {
+        let timer = null;
+        let checked = 0;
+        const state = {duplicate: false};
+        input.addEventListener('input', () => {
+            clearTimeout(timer);
+            const value = input.value.trim();
+            const check = ++checked;
+            timer = setTimeout(async () => {
+                const result = value ? await api('GET', `/pim/employees?employeeId=${encodeURIComponent(value)}&limit=1`) : null;
+                if (check !== checked) return;  // The ID changed again meanwhile
+                state.duplicate = Boolean(result && result.ok && result.meta.total > 0);
+                clearError(input);
+                if (state.duplicate) showError(input, 'Employee Id already exists');
+            }, ID_CHECK_DELAY_MS);
+        });
+        return state;
+    }
+
+    function initAddEmployee() {
+        const form = document.getElementById('add-employee-form');
+        const picture = form.querySelector("input[type='file']");
+        const employeeId = watchEmployeeId(form.querySelector('[name="employeeId"]'));
+        let saving = false;
+        picture.addEventListener('change', () => {
+            clearError(picture);
+            const error = pictureError(picture);
+            if (error) showError(picture, error);
+        });
+        document.getElementById('cancel').addEventListener('click', () => {
+            window.location.assign('/web/index.php/pim/viewEmployeeList');
+        });
+        form.addEventListener('submit', async event => {
+            event.preventDefault();
+            if (saving) return;
+            clearErrors(form);
+            const valid = requireFields(form, ['firstName', 'lastName']);
+            const error = pictureError(picture);
+            if (error) showError(picture, error);
+            if (employeeId.duplicate) showError(form.querySelector('[name="employeeId"]'), 'Employee Id already exists');
+            if (!valid || error || employeeId.duplicate) return;
+            saving = true;
+            const value = name => form.querySelector(`[name="${name}"]`).value.trim();
+            const result = await api('POST', '/pim/employees', {
+                firstName: value('firstName'),
+                middleName: value('middleName'),
+                lastName: value('lastName'),
+                employeeId: value('employeeId'),
+                empPicture: await readPicture(picture),
+            });
+            if (!result.ok) {
+                saving = false;
+                return showApiErrors(form, result);
+            }
+            toast('success', 'Successfully Saved');
+            flashToast('success', 'Successfully Saved');
+            // The application opens the new employee once the toast has been shown
+            setTimeout(() => {
+                window.location.assign(`/web/index.php/pim/viewPersonalDetails/empNumber/${result.data.empNumber}`);
+            }, 1000);
+        });
+    }
+
+    // --- personal details ---
+
+    function initSelects() {
+        document.querySelectorAll('.oxd-select-wrapper').forEach(wrapper => {
+            const options = ['-- Select --'].concat(JSON.parse(wrapper.dataset.options));
+            const text = wrapper.querySelector('.oxd-select-text');
+            const close = () => {
+                const listbox = wrapper.querySelector("[role='listbox']");
+                if (listbox) listbox.remove();
+                text.classList.remove('oxd-select-text--focus');
+            };
+            text.addEventListener('click', event => {
+                event.stopPropagation();
+                if (wrapper.querySelector("[role='listbox']")) return close();
+                document.querySelectorAll("[role='listbox']").forEach(listbox => listbox.remove());
+                const listbox = element('div', 'oxd-select-dropdown --positon-bottom');
+                listbox.setAttribute('role', 'listbox');
+                for (const option of options) {
+                    const item = element('div', 'oxd-select-option');
+                    item.setAttribute('role', 'option');
+                    item.appendChild(element('span', null, option));
+                    listbox.appendChild(item);
+                }
+                listbox.addEventListener('click', clicked => {
+                    clicked.stopPropagation();
+                    const item = clicked.target.closest("[role='option']");
+                    if (!item) return;
+                    setSelect(wrapper, item.innerText.trim());
+                    close();
+                });
+                wrapper.appendChild(listbox);
+                text.classList.add('oxd-select-text--focus');
+            });
+            document.addEventListener('click', close);
+        });
+    }
+
+    function setSelect(wrapper, value) {
+        wrapper.querySelector('.oxd-select-text-input').textContent = value || '-- Select --';
+    }
+
+    function selectValue(wrapper) {
+        const value = wrapper.querySelector('.oxd-select-text-input').textContent.trim();
+        return value === '-- Select --' ? null : value;
+    }
+
+    function initPersonalDetails() {
+        const form = document.getElementById('personal-details-form');
+        const empNumber = document.querySelector('[data-emp-number]').dataset.empNumber;
+        const nationality = form.querySelector("[data-name='nationality']");
+        const maritalStatus = form.querySelector("[data-name='maritalStatus']");
+        const nationalities = JSON.parse(nationality.dataset.options);
+        const textFields = ['firstName', 'middleName', 'lastName', 'employeeId', 'otherId', 'drivingLicenseNo',
+            'drivingLicenseExpiredDate', 'birthday'];
+        initSelects();
+
+        api('GET', `/pim/employees/${empNumber}/personal-details`).then(result => {
+            if (!result.ok) return toast('error', 'Record Not Found');
+            const details = result.data;
+            for (const name of textFields) form.querySelector(`[name="${name}"]`).value = details[name] || '';
+            setSelect(nationality, details.nationality && details.nationality.name);
+            setSelect(maritalStatus, details.maritalStatus);
+            form.querySelectorAll("[name='gender']").forEach(radio => {
+                radio.checked = String(details.gender) === radio.value;
+            });
+            document.getElementById('employee-name').textContent = `${details.firstName} ${details.lastName}`;
+        });
+
+        form.addEventListener('submit', async event => {
+            event.preventDefault();
+            clearErrors(form);
+            if (!requireFields(form, ['firstName', 'lastName'])) return;
+            const details = {};
+            for (const name of textFields) details[name] = form.querySelector(`[name="${name}"]`).value.trim() || null;
+            const gender = form.querySelector("[name='gender']:checked");
+            details.gender = gender ? parseInt(gender.value, 10) : null;
+            details.maritalStatus = selectValue(maritalStatus);
+            const nationalityName = selectValue(nationality);
+            details.nationalityId = nationalityName ? nationalities.indexOf(nationalityName) + 1 : null;
+            const result = await api('PUT', `/pim/employees/${empNumber}/personal-details`, details);
+            if (!result.ok) return showApiErrors(form, result);
+            toast('success', 'Successfully Updated');
+            document.getElementById('employee-name').textContent = `${result.data.firstName} ${result.data.lastName}`;
+        });
+    }
+
+    const pages = {
+        'login': initLogin,
+        'employee-list': initEmployeeList,
+        'add-employee': initAddEmployee,
+        'personal-details': initPersonalDetails,
+    };
+    showFlashedToast();
+    const init = pages[document.body.dataset.page];
+    if (init) init();
+})();
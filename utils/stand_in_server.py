@@ -0,0 +1,603 @@
+"""
+stand_in_server.py
+
+This module defines the StandInServer class, a local stand-in for the Orange HRM
+application that the suite, the benchmarks and the load test can point at
+instead of the shared public demo. It needs no network and starts in
+milliseconds.
+
+The server renders the pages the page objects drive (login, dashboard, employee
+list, add employee, personal details) with the same markup, classes and labels
+as Orange HRM, and implements the REST endpoints the frontend and OrangeHRMApi
+use. Its state is deterministic: every server (or reset) starts from the same
+employees, employee numbers are handed out in order, and the same toasts and
+validation messages ("Required", "Employee Id already exists", "Attachment
+Size Exceeded") as in the real application are produced.
+
+Anything else, such as assets or API calls of other modules, can be replayed
+from a HAR file recorded from a real session (DevTools > Network > "Save all as
+HAR"). Latency can be injected per kind of request to model a slow deployment.
+
+Usage:
+    with StandInServer(latency={"api": 0.2}) as server:
+        driver.get(server.url)
+
+    python -m utils.stand_in_server --port 8080 --latency 0.05 --latency api=0.3 --recording session.har
+"""
+import argparse
+import base64
+import binascii
+import html
+import http.cookies
+import json
+import os
+import random
+import re
+import string
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from data.data_generators import MARITAL_STATUSES, NATIONALITIES
+
+# Templates, script and stylesheet of the stand-in pages
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stand_in")
+
+SESSION_COOKIE = "orangehrm"
+FLASH_COOKIE = "orangehrm_flash"
+
+# Largest profile picture accepted, and its allowed types, as in Orange HRM
+MAX_PICTURE_BYTES = 1024 * 1024
+PICTURE_TYPES = ("image/jpeg", "image/jpg", "image/png", "image/gif")
+MAX_EMPLOYEE_ID_LENGTH = 10
+
+DEFAULT_USERS = {"Admin": "admin123"}
+
+# Employees every server starts with
+DEFAULT_EMPLOYEES = [
+    {"firstName": "Linda", "middleName": "Jane", "lastName": "Anderson", "employeeId": "0001"},
+    {"firstName": "Peter", "middleName": "Mac", "lastName": "Anderson", "employeeId": "0002"},
+    {"firstName": "Odis", "middleName": "", "lastName": "Adalwin", "employeeId": "0003"},
+]
+
+# Kinds of requests latency can be injected for
+LATENCY_KINDS = ("page", "api", "auth", "static", "replay")
+
+_PERSONAL_DETAILS_PATH = re.compile(r"^/web/index\.php/api/v2/pim/employees/(\d+)/personal-details$")
+_VIEW_DETAILS_PATH = re.compile(r"^/web/index\.php/pim/viewPersonalDetails/empNumber/(\d+)$")
+
+# Response headers of a recording that must not be replayed as they were
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie", "connection"}
+
+
+class StandInError(Exception):
+    """Raised by the state when a request is invalid; carries the HTTP status and field errors."""
+
+    def __init__(self, status, message, errors=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.errors = errors or {}
+
+
+class StandInState:
+    """Users, sessions and employees of the stand-in application."""
+
+    def __init__(self, users=None, employees=None):
+        self.users = dict(users or DEFAULT_USERS)
+        self.initial_employees = list(employees if employees is not None else DEFAULT_EMPLOYEES)
+        self.nationalities = [{"id": number, "name": name} for number, name in enumerate(sorted(NATIONALITIES), start=1)]
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """Goes back to the initial employees and forgets every session."""
+        with self._lock:
+            self.sessions = {}  # token -> username
+            self.employees = {}  # empNumber -> personal details
+            self._next_emp_number = 1
+            self._next_token = 1
+            for employee in self.initial_employees:
+                self.create_employee(employee)
+
+    def login(self, username, password):
+        """Returns a new session token, or None if the credentials are wrong."""
+        with self._lock:
+            if not username or self.users.get(username) != password:
+                return None
+            token = f"stand-in-session-{self._next_token}"
+            self._next_token += 1
+            self.sessions[token] = username
+            return token
+
+    def logout(self, token):
+        with self._lock:
+            self.sessions.pop(token, None)
+
+    def user(self, token):
+        """Returns the user of a session token, or None."""
+        return self.sessions.get(token)
+
+    def next_employee_id(self):
+        """Returns the employee ID the Add Employee form suggests, like Orange HRM does."""
+        return f"{self._next_emp_number:04d}"
+
+    def _validate(self, details, emp_number=None):
+        errors = {}
+        for field in ("firstName", "lastName"):
+            if not (details.get(field) or "").strip():
+                errors[field] = "Required"
+        employee_id = str(details.get("employeeId") or "")
+        if len(employee_id) > MAX_EMPLOYEE_ID_LENGTH:
+            errors["employeeId"] = f"Should not exceed {MAX_EMPLOYEE_ID_LENGTH} characters"
+        elif employee_id and any(
+            other["employeeId"] == employee_id and number != emp_number for number, other in self.employees.items()
+        ):
+            errors["employeeId"] = "Employee Id already exists"
+        picture = details.get("empPicture")
+        if picture:
+            if picture.get("type") not in PICTURE_TYPES:
+                errors["empPicture"] = "File type not allowed"
+            elif int(picture.get("size") or 0) > MAX_PICTURE_BYTES:
+                errors["empPicture"] = "Attachment Size Exceeded"
+        if errors:
+            raise StandInError(422, "Invalid Parameter", errors)
+
+    def create_employee(self, details):
+        """Adds an employee and returns it."""
+        with self._lock:
+            self._validate(details)
+            picture = details.get("empPicture")
+            employee = {
+                "empNumber": self._next_emp_number,
+                "firstName": details["firstName"].strip(),
+                "middleName": (details.get("middleName") or "").strip(),
+                "lastName": details["lastName"].strip(),
+                "employeeId": str(details.get("employeeId") or ""),
+                "otherId": None,
+                "drivingLicenseNo": None,
+                "drivingLicenseExpiredDate": None,
+                "gender": None,
+                "maritalStatus": None,
+                "birthday": None,
+                "nationality": None,
+                "pictureBytes": int(picture["size"]) if picture else 0,
+            }
+            self.employees[employee["empNumber"]] = employee
+            self._next_emp_number += 1
+            return self.summary(employee)
+
+    def employee(self, emp_number):
+        employee = self.employees.get(emp_number)
+        if employee is None:
+            raise StandInError(404, "Record Not Found")
+        return employee
+
+    @staticmethod
+    def summary(employee):
+        """Returns the list representation of an employee."""
+        return {
+            "empNumber": employee["empNumber"],
+            "firstName": employee["firstName"],
+            "middleName": employee["middleName"],
+            "lastName": employee["lastName"],
+            "employeeId": employee["employeeId"],
+            "terminationId": None,
+            "jobTitle": {"id": None, "title": None},
+            "empStatus": {"id": None, "name": None},
+            "subunit": {"id": None, "name": None},
+            "supervisors": [],
+        }
+
+    def personal_details(self, emp_number):
+        """Returns the personal details of an employee."""
+        with self._lock:
+            return {key: value for key, value in self.employee(emp_number).items() if key != "pictureBytes"}
+
+    def update_personal_details(self, emp_number, details):
+        """Updates the personal details of an employee and returns them."""
+        with self._lock:
+            employee = self.employee(emp_number)
+            merged = {**employee, **{key: value for key, value in details.items() if key in employee}}
+            self._validate(merged, emp_number)
+            nationality_id = details.get("nationalityId")
+            if "nationalityId" in details:
+                merged["nationality"] = next(
+                    (nationality for nationality in self.nationalities if nationality["id"] == nationality_id), None
+                )
+            if merged.get("maritalStatus") not in (None, "", *MARITAL_STATUSES):
+                raise StandInError(422, "Invalid Parameter", {"maritalStatus": "Invalid"})
+            self.employees[emp_number] = merged
+            return self.personal_details(emp_number)
+
+    def find_employees(self, name_or_id=None, employee_id=None, limit=50, offset=0):
+        """Returns (matching employees of the requested page, total number of matches)."""
+        with self._lock:
+            matches = []
+            for employee in self.employees.values():
+                if employee_id and employee["employeeId"] != employee_id:
+                    continue
+                if name_or_id:
+                    needle = name_or_id.lower()
+                    full_name = f"{employee['firstName']} {employee['middleName']} {employee['lastName']}".lower()
+                    if needle not in full_name and needle != employee["employeeId"].lower():
+                        continue
+                matches.append(self.summary(employee))
+            return matches[offset:offset + limit], len(matches)
+
+    def delete_employees(self, emp_numbers):
+        """Deletes employees; fails without deleting anything if one of them does not exist."""
+        with self._lock:
+            emp_numbers = [int(emp_number) for emp_number in emp_numbers]
+            if not emp_numbers or any(emp_number not in self.employees for emp_number in emp_numbers):
+                raise StandInError(404, "Records Not Found")
+            for emp_number in emp_numbers:
+                del self.employees[emp_number]
+            return emp_numbers
+
+
+class Recording:
+    """GET responses of a HAR file, replayed for requests the stand-in does not implement itself."""
+
+    def __init__(self, path):
+        with open(path, encoding="utf-8") as har_file:
+            entries = json.load(har_file)["log"]["entries"]
+        self.responses = {}  # path with query -> (status, headers, body)
+        for entry in entries:
+            request, response = entry["request"], entry["response"]
+            if request["method"] != "GET" or response["status"] in (0, 304):
+                continue
+            url = urlsplit(request["url"])
+            content = response.get("content", {})
+            body = content.get("text") or ""
+            body = base64.b64decode(body) if content.get("encoding") == "base64" else body.encode("utf-8")
+            headers = [(header["name"], header["value"]) for header in response["headers"]
+                       if header["name"].lower() not in _SKIPPED_HEADERS and not header["name"].startswith(":")]
+            full_path = url.path + (f"?{url.query}" if url.query else "")
+            self.responses.setdefault(full_path, (response["status"], headers, body))
+            self.responses.setdefault(url.path, (response["status"], headers, body))
+
+    def lookup(self, path_with_query):
+        """Returns the recorded (status, headers, body) for a request, trying the exact URL first."""
+        return self.responses.get(path_with_query) or self.responses.get(path_with_query.split("?", 1)[0])
+
+
+def _load_template(name):
+    with open(os.path.join(ASSETS_DIR, name), encoding="utf-8") as template_file:
+        return string.Template(template_file.read())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes one request to a page, the API, the static assets or the recording."""
+
+    server_version = "OrangeHRMStandIn/1.0"
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real server
+
+    @property
+    def stand_in(self):
+        return self.server.stand_in
+
+    def log_message(self, format, *args):
+        pass  # Keep the test output clean
+
+    # --- request helpers ---
+
+    def _cookies(self):
+        cookie = http.cookies.SimpleCookie()
+        cookie.load(self.headers.get("Cookie", ""))
+        return {name: morsel.value for name, morsel in cookie.items()}
+
+    def _user(self):
+        return self.stand_in.state.user(self._cookies().get(SESSION_COOKIE))
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _json_body(self):
+        body = self._body()
+        try:
+            return json.loads(body) if body else {}
+        except ValueError:
+            raise StandInError(400, "Invalid JSON body") from None
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if not any(name.lower() == "cache-control" for name, _ in headers):
+            self.send_header("Cache-Control", "no-store")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _redirect(self, location, headers=()):
+        self._send(302, headers=[("Location", location), *headers])
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    # --- dispatch ---
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = parse_qs(url.query)
+        if path.startswith("/web/index.php/api/"):
+            kind = "api"
+        elif path.startswith("/web/index.php/auth/"):
+            kind = "auth"
+        elif path.startswith("/web/stand-in/"):
+            kind = "static"
+        else:
+            kind = "page"
+        self.stand_in.delay(kind)
+        try:
+            if kind == "api":
+                self._api(method, path, query)
+            elif kind == "static" and method == "GET":
+                self._static(path)
+            elif path == "/__stand-in/reset" and method == "POST":
+                self.stand_in.state.reset()
+                self._send_json(200, {"data": "reset"})
+            elif not self._page(method, path):
+                self._replay_or_404()
+        except StandInError as e:
+            self._send_json(e.status, {"error": {"status": str(e.status), "message": e.message,
+                                                 "data": {"invalidParamKeys": e.errors}}})
+
+    def _replay_or_404(self):
+        recorded = self.stand_in.recording.lookup(self.path) if self.stand_in.recording else None
+        if recorded is None:
+            self._send(404, self.stand_in.render("not_found.html", title="Not Found"))
+            return
+        self.stand_in.delay("replay")
+        status, headers, body = recorded
+        content_type = next((value for name, value in headers if name.lower() == "content-type"), "application/octet-stream")
+        self._send(status, body, content_type, [(name, value) for name, value in headers if name.lower() != "content-type"])
+
+    def _static(self, path):
+        name = os.path.basename(path)
+        types = {".js": "application/javascript", ".css": "text/css", ".svg": "image/svg+xml"}
+        extension = os.path.splitext(name)[1]
+        file_path = os.path.join(ASSETS_DIR, name)
+        if extension not in types or not os.path.isfile(file_path):
+            self._send(404, b"Not Found", "text/plain")
+            return
+        with open(file_path, "rb") as asset:
+            self._send(200, asset.read(), types[extension], [("Cache-Control", "max-age=3600")])
+
+    # --- pages ---
+
+    def _page(self, method, path):
+        """Serves the application pages; returns False if the path is not one of them."""
+        state = self.stand_in.state
+        if path == "/" or path == "/web/index.php":
+            self._redirect("/web/index.php/auth/login")
+        elif path == "/web/index.php/auth/login" and method == "GET":
+            if self._user():
+                self._redirect("/web/index.php/dashboard/index")
+                return True
+            failed = self._cookies().get(FLASH_COOKIE) == "invalid"
+            self._send(200, self.stand_in.render("login.html", alert=self.stand_in.render_text("login_alert.html") if failed else ""),
+                       headers=[("Set-Cookie", f"{FLASH_COOKIE}=; Path=/; Max-Age=0")] if failed else ())
+        elif path == "/web/index.php/auth/validate" and method == "POST":
+            form = parse_qs(self._body().decode("utf-8"))
+            token = state.login(form.get("username", [""])[0], form.get("password", [""])[0])
+            if token is None:
+                self._redirect("/web/index.php/auth/login", [("Set-Cookie", f"{FLASH_COOKIE}=invalid; Path=/")])
+            else:
+                self._redirect("/web/index.php/dashboard/index", [("Set-Cookie", f"{SESSION_COOKIE}={token}; Path=/; HttpOnly")])
+        elif path == "/web/index.php/auth/logout":
+            state.logout(self._cookies().get(SESSION_COOKIE))
+            self._redirect("/web/index.php/auth/login", [("Set-Cookie", f"{SESSION_COOKIE}=; Path=/; Max-Age=0")])
+        elif path.startswith("/web/index.php/dashboard/") or path.startswith("/web/index.php/pim/"):
+            user = self._user()
+            if user is None:
+                self._redirect("/web/index.php/auth/login")
+            elif path == "/web/index.php/dashboard/index":
+                self._send(200, self.stand_in.render_layout("dashboard.html", "Dashboard", user))
+            elif path == "/web/index.php/pim/viewPimModule":
+                self._redirect("/web/index.php/pim/viewEmployeeList")
+            elif path == "/web/index.php/pim/viewEmployeeList":
+                self._send(200, self.stand_in.render_layout("employee_list.html", "PIM", user, page="employee-list"))
+            elif path == "/web/index.php/pim/addEmployee":
+                self._send(200, self.stand_in.render_layout("add_employee.html", "PIM", user, page="add-employee",
+                                                            next_employee_id=state.next_employee_id()))
+            elif _VIEW_DETAILS_PATH.match(path) and int(_VIEW_DETAILS_PATH.match(path).group(1)) in state.employees:
+                self._send(200, self.stand_in.render_layout(
+                    "personal_details.html", "PIM", user, page="personal-details",
+                    emp_number=_VIEW_DETAILS_PATH.match(path).group(1),
+                    nationality_options=html.escape(json.dumps([nationality["name"] for nationality in state.nationalities])),
+                    marital_options=html.escape(json.dumps(MARITAL_STATUSES)),
+                ))
+            else:
+                return False
+        else:
+            return False
+        return True
+
+    # --- API ---
+
+    def _api(self, method, path, query):
+        if self._user() is None:
+            raise StandInError(401, "Session expired")
+        state = self.stand_in.state
+        match = _PERSONAL_DETAILS_PATH.match(path)
+        if path == "/web/index.php/api/v2/pim/employees":
+            if method == "GET":
+                limit = int(query.get("limit", ["50"])[0])
+                offset = int(query.get("offset", ["0"])[0])
+                rows, total = state.find_employees(query.get("nameOrId", [None])[0], query.get("employeeId", [None])[0],
+                                                   limit, offset)
+                self._send_json(200, {"data": rows, "meta": {"total": total}, "rels": []})
+            elif method == "POST":
+                details = self._json_body()
+                picture = details.get("empPicture")
+                if picture and picture.get("base64"):
+                    try:
+                        picture["size"] = len(base64.b64decode(picture["base64"]))
+                    except (binascii.Error, ValueError):
+                        raise StandInError(422, "Invalid Parameter", {"empPicture": "Invalid file"}) from None
+                self._send_json(200, {"data": state.create_employee(details), "meta": [], "rels": []})
+            elif method == "DELETE":
+                self._send_json(200, {"data": state.delete_employees(self._json_body().get("ids", [])), "meta": [], "rels": []})
+            else:
+                raise StandInError(405, "Method Not Allowed")
+        elif match:
+            emp_number = int(match.group(1))
+            if method == "GET":
+                self._send_json(200, {"data": state.personal_details(emp_number), "meta": [], "rels": []})
+            elif method == "PUT":
+                self._send_json(200, {"data": state.update_personal_details(emp_number, self._json_body()), "meta": [], "rels": []})
+            else:
+                raise StandInError(405, "Method Not Allowed")
+        elif path == "/web/index.php/api/v2/admin/nationalities" and method == "GET":
+            self._send_json(200, {"data": state.nationalities, "meta": {"total": len(state.nationalities)}, "rels": []})
+        else:
+            recorded = self.stand_in.recording.lookup(self.path) if self.stand_in.recording and method == "GET" else None
+            if recorded is None:
+                raise StandInError(404, "Invalid URL")
+            self._replay_or_404()
+
+
+class StandInServer:
+    """Local HTTP server standing in for Orange HRM."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=None, jitter=0.0, recording=None, users=None,
+                 employees=None, seed=0):
+        """Initializes the server without starting it.
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free one.
+            latency: Seconds added to every response, or a dict with a "default" and per-kind
+                values for "page", "api", "auth", "static" and "replay" requests.
+            jitter: Relative random variation of the latency (0.2 = +/-20 %), reproducible through the seed.
+            recording: Path of a HAR file whose GET responses are replayed for unknown URLs.
+            users: Username -> password of the accounts that can log in.
+            employees: Employees the server starts with (DEFAULT_EMPLOYEES if not given).
+            seed: Seed of the latency jitter.
+        """
+        if not isinstance(latency, dict):
+            latency = {"default": latency or 0.0}
+        unknown = set(latency) - {"default", *LATENCY_KINDS}
+        if unknown:
+            raise ValueError(f"Unknown latency kinds {sorted(unknown)}, expected some of {LATENCY_KINDS}")
+        self.latency = latency
+        self.jitter = jitter
+        self.state = StandInState(users, employees)
+        self.recording = Recording(recording) if recording else None
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._templates = {}
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stand_in = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """Root URL of the server, with a trailing slash like the demo URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def delay(self, kind):
+        """Sleeps for the latency configured for this kind of request."""
+        seconds = self.latency.get(kind, self.latency.get("default", 0.0))
+        if seconds <= 0:
+            return
+        if self.jitter:
+            with self._random_lock:
+                seconds *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        time.sleep(seconds)
+
+    def render_text(self, name, **values):
+        """Fills in a template of the stand_in folder and returns the text."""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = _load_template(name)
+        return template.substitute(**values)
+
+    def render(self, name, **values):
+        """Fills in a template and returns it as UTF-8 bytes."""
+        return self.render_text(name, **values).encode("utf-8")
+
+    def render_layout(self, name, module, user, page="", **values):
+        """Renders a page of the application inside the common layout."""
+        content = self.render_text(name, **values)
+        return self.render("layout.html", module=module, user=html.escape(user), page=page, content=content,
+                           tabs=self.render_text("pim_tabs.html") if module == "PIM" else "")
+
+    def start(self):
+        """Starts serving on a background thread and returns the server."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serves on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """Stops the server and closes its socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()  # Blocks until serve_forever returns, so only when it runs
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _parse_latency(values):
+    latency = {}
+    for value in values or ():
+        kind, _, seconds = value.rpartition("=")
+        latency[kind or "default"] = float(seconds)
+    return latency
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for Orange HRM.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", action="append", metavar="[KIND=]SECONDS",
+                        help=f"Injected latency, for all requests or one kind ({', '.join(LATENCY_KINDS)}); repeatable.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Relative random variation of the latency.")
+    parser.add_argument("--recording", help="HAR file replayed for URLs the stand-in does not implement.")
+    args = parser.parse_args(argv)
+
+    server = StandInServer(args.host, args.port, _parse_latency(args.latency), args.jitter, args.recording)
+    print(f"Orange HRM stand-in serving on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
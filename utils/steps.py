@@ -0,0 +1,48 @@
+"""
+steps.py
+
+This module runs flows written once for both the synchronous and the async
+drivers and page objects.
+
+A flow is a generator that yields the result of every driver or page-object
+call it makes and receives the value of that call back. With Selenium and the
+synchronous page objects the call has already run, so run_steps() just sends
+its result back. With AsyncWebDriver and the async page objects the call
+returned a coroutine, which run_async_steps() awaits; an exception it raises is
+thrown into the flow at the yield, so `try` and `with` blocks around the steps
+behave the same with both drivers.
+
+Usage:
+    def login_steps(page, username, password):
+        yield page.login(username, password)
+        outcome, message = yield page.wait_for_outcome()
+        return outcome
+
+    outcome = run_steps(login_steps(LoginPage(driver), "Admin", "admin123"))
+    outcome = await run_async_steps(login_steps(AsyncLoginPage(driver), "Admin", "admin123"))
+"""
+import inspect
+
+
+def run_steps(steps):
+    """Runs a flow whose calls are synchronous and returns its return value."""
+    value = None
+    while True:
+        try:
+            value = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+
+
+async def run_async_steps(steps):
+    """Runs a flow, awaiting the coroutines it yields, and returns its return value."""
+    send, value = steps.send, None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            send, value = steps.send, (await step if inspect.isawaitable(step) else step)
+        except Exception as e:
+            send, value = steps.throw, e
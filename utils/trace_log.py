@@ -0,0 +1,157 @@
+"""
+trace_log.py
+
+This module keeps a structured trace of what the page objects do, for the
+tests that fail, without costing the tests that pass anything but a few
+appends to memory.
+
+Page objects call trace() at each step of an action (the field they fill in,
+the button they click, the message they read). While a TraceLog is active, the
+event and its fields are appended to a ring buffer that only holds the last
+`capacity` events of the current test. When the test passes the buffer is
+simply cleared; when it fails the buffer is written, as JSON lines, to the
+trace file of the worker. Nothing is formatted or written before that.
+
+Secrets are redacted when the events are written: the value of every field
+(or nested key) whose name looks like a secret (password, token, cookie...) is
+replaced, and so is every occurrence of that value in other fields of the test.
+
+Usage:
+    log = TraceLog(capacity=200)
+    activate(log)
+    log.start_test("tests/test_pages.py::test_valid_login")
+    trace("login.password", password=password)  # Written as "***"
+    log.flush("reports/traces/main.jsonl")  # Only when the test failed, else log.discard()
+"""
+import collections
+import json
+import os
+import re
+import time
+
+# Field names whose values are never written
+SECRET_FIELD = re.compile(r"passw(or)?d|secret|token|cookie|auth|credential|api_?key", re.IGNORECASE)
+
+# What a redacted value is written as
+REDACTED = "***"
+
+# The active trace log, or None when tracing is off
+_active = None
+
+
+class TraceLog:
+    """Keeps the last events of the current test in memory."""
+
+    def __init__(self, capacity=200):
+        """Initializes the trace log.
+        Args:
+            capacity: Number of events kept per test; older events are dropped.
+        """
+        self.capacity = capacity
+        self.current_test = None
+        self._events = collections.deque(maxlen=capacity)
+        self._recorded = 0  # Events of the current test, including the dropped ones
+        self._started = time.perf_counter()
+        self._secrets = set()  # Values redacted from every test
+
+    def start_test(self, test_id):
+        """Attributes the following events to the given test, forgetting those of the previous one."""
+        self.current_test = test_id
+        self._events.clear()
+        self._recorded = 0
+        self._started = time.perf_counter()
+
+    def record(self, event, fields):
+        """Appends an event to the buffer of the current test."""
+        self._events.append((time.perf_counter(), event, fields))
+        self._recorded += 1
+
+    def add_secret(self, value):
+        """Redacts value wherever it appears in the events written from now on."""
+        if value:
+            self._secrets.add(str(value))
+
+    def events(self):
+        """Returns the buffered events as dicts with their seconds since the start of the test, redacted."""
+        secrets = set(self._secrets)
+        events = []
+        for recorded_at, event, fields in self._events:
+            fields = _redact_fields(fields, secrets)
+            events.append({"t": round(recorded_at - self._started, 4), "event": event, "fields": fields})
+        if secrets:
+            # Secret values may also appear inside other fields, e.g. in a message or a list of entered values
+            ordered = sorted(secrets, key=len, reverse=True)
+            for event in events:
+                event["fields"] = _mask(event["fields"], ordered)
+        return events
+
+    def discard(self):
+        """Forgets the events of the current test without writing them."""
+        self._events.clear()
+        self._recorded = 0
+
+    def flush(self, path):
+        """Appends the events of the current test to a JSON lines file and clears the buffer.
+
+        The first line names the test and how many of its events no longer fit in the buffer.
+        Returns:
+            str: The path written to, or None if the test recorded no events.
+        """
+        events = self.events()
+        dropped = self._recorded - len(events)
+        self.discard()
+        if not events:
+            return None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a") as trace_file:
+            trace_file.write(json.dumps({"test": self.current_test, "events": len(events), "dropped": dropped}) + "\n")
+            for event in events:
+                trace_file.write(json.dumps(event, default=repr) + "\n")
+        return path
+
+
+def _redact_fields(value, secrets):
+    """Returns value with the items of secret-named keys redacted, at any depth, adding their values to secrets."""
+    if isinstance(value, dict):
+        redacted = {}
+        for name, item in value.items():
+            if SECRET_FIELD.search(str(name)):
+                if item:
+                    secrets.add(str(item))
+                item = REDACTED
+            redacted[name] = _redact_fields(item, secrets)
+        return redacted
+    if isinstance(value, (list, tuple, set)):
+        return [_redact_fields(item, secrets) for item in value]
+    return value
+
+
+def _mask(value, secrets):
+    """Returns value with every occurrence of the secrets in its strings redacted."""
+    if isinstance(value, str):
+        for secret in secrets:
+            value = value.replace(secret, REDACTED)
+        return value
+    if isinstance(value, dict):
+        return {name: _mask(item, secrets) for name, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_mask(item, secrets) for item in value]
+    return value
+
+
+def activate(log):
+    """Makes log the target of trace()."""
+    global _active
+    _active = log
+
+
+def deactivate():
+    """Turns tracing off again."""
+    global _active
+    _active = None
+
+
+def trace(event, **fields):
+    """Records an event with its fields if tracing is on."""
+    if _active is not None:
+        _active.record(event, fields)